@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+Al Ahly Stats Query Engine
+==========================
+Answers the dashboard's filter + group-by questions on the server: MATCHDETAILS
+is held as a pandas frame (one per snapshot, see ahly_workbook), filters become
+vectorized boolean masks and results are cached by their normalized filter state.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from ahly_workbook import clean
+
+# Query results kept per snapshot (most recently used)
+QUERY_CACHE_SIZE = int(os.environ.get('AHLY_QUERY_CACHE_SIZE', '512'))
+
+# Dashboard filter / group-by names (getCurrentFilters in al_ahly_stats.js) -> MATCHDETAILS column
+DIMENSIONS = {
+    'matchId': 'MATCH_ID',
+    'championSystem': 'CHAMPION SYSTEM',
+    'champion': 'CHAMPION',
+    'season': 'SEASON',
+    'sy': 'SY',
+    'ahlyManager': 'AHLY MANAGER',
+    'opponentManager': 'OPPONENT MANAGER',
+    'referee': 'REFREE',
+    'round': 'ROUND',
+    'hAN': 'H-A-N',
+    'stadium': 'STAD',
+    'ahlyTeam': 'AHLY TEAM',
+    'opponentTeam': 'OPPONENT TEAM',
+    'result': 'W-D-L',
+    'cleanSheet': 'CLEAN SHEET',
+    'extraTime': 'ET',
+    'penalties': 'PEN'
+}
+# Filters that aren't plain column equality
+SPECIAL_FILTERS = ('trophy', 'goalsFor', 'goalsAgainst', 'dateFrom', 'dateTo')
+
+# Counted per group (sums of the frame's 0/1 and goal columns)
+AGGREGATES = ['matches', 'wins', 'draws', 'draws_with_goals', 'draws_no_goals', 'losses',
+              'goals_for', 'goals_against', 'clean_sheets', 'clean_sheets_against']
+
+
+class QueryError(ValueError):
+    """Unknown filter or group-by dimension (the caller's mistake)"""
+
+
+def normalize_filters(filters):
+    """
+    Canonical form of a filter set: known keys only, blanks dropped, values stripped
+
+    Raises:
+        QueryError: for unknown filter names, filters that aren't a mapping,
+            or values that aren't a string or number
+    """
+    if filters is not None and not isinstance(filters, dict):
+        raise QueryError("filters must be an object of filter name -> value")
+    normalized = {}
+    for key, value in (filters or {}).items():
+        if key not in DIMENSIONS and key not in SPECIAL_FILTERS:
+            raise QueryError(f"Unknown filter: {key}")
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (str, int, float))):
+            raise QueryError(f"Filter {key} must be a string or number")
+        value = clean(value)
+        if value:
+            normalized[key] = value
+    return dict(sorted(normalized.items()))
+
+
+def normalize_group_by(group_by):
+    """Group-by dimensions as a list (accepts 'season,champion' or a list)"""
+    if isinstance(group_by, str):
+        group_by = group_by.split(',')
+    elif group_by is not None and not isinstance(group_by, (list, tuple)):
+        raise QueryError("group_by must be a list or a comma-separated string")
+    dimensions = [clean(name) for name in group_by or () if clean(name)]
+    for name in dimensions:
+        if name not in DIMENSIONS:
+            raise QueryError(f"Unknown group-by dimension: {name}")
+    return dimensions
+
+
+def parse_dates(values):
+    """DATE cells (Excel serial numbers or date text) as datetimes (NaT if unreadable)"""
+    numbers = pd.to_numeric(values, errors='coerce')
+    serial = pd.to_datetime(numbers, unit='D', origin='1899-12-30', errors='coerce')
+    text = pd.to_datetime(values.where(numbers.isna()).astype(str), errors='coerce', dayfirst=True, format='mixed')
+    return serial.fillna(text)
+
+
+class MatchQueryEngine:
+    """MATCHDETAILS as columns plus a result cache, for one workbook snapshot"""
+
+    def __init__(self, workbook):
+        self.workbook = workbook
+        self.trophy_seasons = {
+            clean(row.get('Champions')) for row in workbook.sheets.get('TROPHY') or [] if clean(row.get('Champions'))
+        }
+        self.frame = self._build_frame(workbook.matches)
+        self._results = OrderedDict()  # (filters, group_by, include_matches) -> result
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _build_frame(matches):
+        raw = pd.DataFrame(matches)
+        frame = pd.DataFrame(index=raw.index)
+        for column in DIMENSIONS.values():
+            frame[column] = raw[column].map(clean) if column in raw else ''
+
+        frame['GF'] = pd.to_numeric(raw['GF'], errors='coerce').fillna(0).astype(int) if 'GF' in raw else 0
+        frame['GA'] = pd.to_numeric(raw['GA'], errors='coerce').fillna(0).astype(int) if 'GA' in raw else 0
+        frame['date'] = parse_dates(raw['DATE']) if 'DATE' in raw else pd.NaT
+        frame['match_id_lower'] = frame['MATCH_ID'].str.lower()
+
+        result = frame['W-D-L']
+        frame['matches'] = 1
+        frame['wins'] = (result == 'W').astype(int)
+        frame['draws'] = result.str.contains('D', regex=False).astype(int)
+        frame['draws_with_goals'] = result.isin(['D', 'D WITH G', 'DWITHG']).astype(int)
+        frame['draws_no_goals'] = result.isin(['D.', 'D WITHOUT G', 'DWITHOUTG']).astype(int)
+        frame['losses'] = (result == 'L').astype(int)
+        frame['goals_for'] = frame['GF']
+        frame['goals_against'] = frame['GA']
+        frame['clean_sheets'] = (frame['GA'] == 0).astype(int)
+        frame['clean_sheets_against'] = (frame['GF'] == 0).astype(int)
+        return frame
+
+    def mask(self, filters):
+        """Boolean mask of the matches passing a normalized filter set (same rules as applyMainFiltersToMatch)"""
+        frame = self.frame
+        mask = pd.Series(True, index=frame.index)
+        for key, value in filters.items():
+            if key == 'trophy':
+                if value == 'only-trophy':
+                    mask &= frame['SEASON'].isin(self.trophy_seasons)
+            elif key == 'matchId':
+                mask &= frame['match_id_lower'].str.contains(value.lower(), regex=False)
+            elif key == 'goalsFor':
+                mask &= frame['GF'] == pd.to_numeric(value, errors='coerce')
+            elif key == 'goalsAgainst':
+                mask &= frame['GA'] == pd.to_numeric(value, errors='coerce')
+            elif key in ('dateFrom', 'dateTo'):
+                bound = pd.to_datetime(value, errors='coerce')
+                if pd.isna(bound):
+                    raise QueryError(f"Invalid date for {key}: {value}")
+                # Matches without a readable date aren't filtered out (as on the dashboard)
+                inside = frame['date'] >= bound if key == 'dateFrom' else frame['date'] <= bound
+                mask &= inside | frame['date'].isna()
+            else:
+                mask &= frame[DIMENSIONS[key]] == value
+        return mask
+
+    def query(self, filters=None, group_by=None, include_matches=False):
+        """
+        Aggregate the matches passing filters, optionally per group
+
+        Args:
+            filters: Dashboard filter set ({'season': '2023-2024', 'hAN': 'H', ...})
+            group_by: Dimension names to group by (e.g. ['season'])
+            include_matches: Also return the filtered MATCHDETAILS rows
+
+        Returns:
+            Tuple (result, cached) - result has filters, group_by, totals, groups
+            (and matches); don't modify it
+
+        Raises:
+            QueryError: for unknown filters / dimensions or unreadable dates
+        """
+        filters = normalize_filters(filters)
+        group_by = normalize_group_by(group_by)
+        key = (tuple(filters.items()), tuple(group_by), bool(include_matches))
+
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return result, True
+            self.misses += 1
+
+        result = self._run(filters, group_by, include_matches)
+        with self._lock:
+            self._results[key] = result
+            while len(self._results) > QUERY_CACHE_SIZE:
+                self._results.popitem(last=False)
+        return result, False
+
+    def _run(self, filters, group_by, include_matches):
+        selected = self.frame[self.mask(filters)]
+        totals = {name: int(selected[name].sum()) for name in AGGREGATES}
+
+        groups = []
+        if group_by:
+            columns = [DIMENSIONS[name] for name in group_by]
+            summed = selected.groupby(columns, sort=False)[AGGREGATES].sum().reset_index()
+            summed = summed.sort_values('matches', ascending=False, kind='stable')
+            for row in summed.itertuples(index=False, name=None):
+                group = dict(zip(group_by, row[:len(columns)]))
+                group.update({name: int(value) for name, value in zip(AGGREGATES, row[len(columns):])})
+                groups.append(group)
+
+        result = {'filters': filters, 'group_by': group_by, 'totals': totals, 'groups': groups}
+        if include_matches:
+            result['matches'] = [self.workbook.matches[position] for position in selected.index]
+        return result
+
+    def get_stats(self):
+        return {'cached_results': len(self._results), 'hits': self.hits, 'misses': self.misses}
+
+
+def get_query_engine(workbook):
+    """The query engine of a workbook snapshot (built on first use)"""
+    return workbook.derived('query_engine', lambda: MatchQueryEngine(workbook))
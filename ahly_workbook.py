@@ -0,0 +1,787 @@
+# -*- coding: utf-8 -*-
+"""
+Al Ahly Workbook Model
+======================
+Indexed, read-only view of the synced AHLY_MATCH snapshot (see google_sheets_sync).
+Each worksheet is hash-indexed once by MATCH_ID / PLAYER NAME, so routes answer
+with dictionary lookups instead of downloading worksheets per request (or per match).
+
+One model is kept per process and rebuilt only when the snapshot changes.
+"""
+
+import os
+import re
+import time
+import threading
+from collections import Counter, OrderedDict
+
+import pandas as pd
+
+# Player profiles kept per snapshot (most recently used)
+PLAYER_PROFILE_CACHE_SIZE = int(os.environ.get('PLAYER_PROFILE_CACHE_SIZE', '256'))
+
+# Goal minute buckets for the goal-minutes timeline: (label, first minute, last minute)
+GOAL_MINUTE_BUCKETS = [('1-15', 1, 15), ('16-30', 16, 30), ('31-45', 31, 45), ('46-60', 46, 60),
+                       ('61-75', 61, 75), ('76-89', 76, 89), ('90+', 90, None)]
+
+# PLAYERDETAILS penalty codes (TYPE or GA) -> overview stat
+PENALTY_STATS = {
+    'PENGOAL': 'pen_goal',
+    'PENASSISTGOAL': 'pen_ast_goal',
+    'PENMISSED': 'pen_missed',
+    'PENASSISTMISSED': 'pen_ast_miss',
+    'PENMAKEGOAL': 'pen_make_g',
+    'PENMAKEMISSED': 'pen_make_m'
+}
+
+
+def clean(value):
+    """Cell value as a stripped string ('' for blanks; 12.0 -> '12')"""
+    if value is None:
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+def to_int(value, default=0):
+    """Cell value as an int (default for blanks and text)"""
+    try:
+        return int(float(clean(value)))
+    except ValueError:
+        return default
+
+
+def code(value):
+    """Event code without spaces / punctuation ('Pen Goal' -> 'PENGOAL')"""
+    return re.sub(r'[^A-Z]', '', clean(value).upper())
+
+
+def minute_sort_key(minute):
+    """'45+2' sorts after '45' and before '46'"""
+    base, _, extra = clean(minute).partition('+')
+    return to_int(base) + to_int(extra) / 100
+
+
+def is_goal(row):
+    return clean(row.get('GA')).upper() == 'GOAL'
+
+
+def is_pen_goal(row):
+    return is_goal(row) and clean(row.get('TYPE')).upper() == 'PENGOAL'
+
+
+def empty_goalkeeper_stats():
+    return {'total_matches': 0, 'goals_conceded': 0, 'clean_sheets': 0,
+            'pen_goals_conceded': 0, 'pen_saves': 0}
+
+
+class AhlyWorkbook:
+    """The AHLY_MATCH worksheets plus lookup indexes"""
+
+    def __init__(self, sheets, version=None):
+        """
+        Args:
+            sheets: Snapshot {worksheet title: records} as cached by the sync service
+            version: Cache version of the snapshot (None if unknown)
+        """
+        start_time = time.time()
+        self.sheets = sheets
+        self.version = version
+        self.matches = sheets.get('MATCHDETAILS') or []
+        self.details = sheets.get('PLAYERDETAILS') or []
+        self.gk_rows = sheets.get('GKDETAILS') or []
+        self.pen_missed = sheets.get('HOWPENMISSED') or []
+        self.lineups = sheets.get('LINEUPDETAILS') or []
+        self._derived = {}  # name -> table built on first use (lives as long as this snapshot)
+        self._derived_lock = threading.RLock()  # builders may use other derived tables
+        self._profiles = OrderedDict()  # (player, team) -> profile
+        self._build_indexes()
+        self.build_seconds = time.time() - start_time
+
+    def _build_indexes(self):
+        # MATCHDETAILS: match id -> row, and its position (sheet order)
+        self.match_by_id = {}
+        self.match_order = {}
+        for position, row in enumerate(self.matches):
+            match_id = clean(row.get('MATCH_ID'))
+            if match_id and match_id not in self.match_by_id:
+                self.match_by_id[match_id] = row
+                self.match_order[match_id] = position
+
+        # PLAYERDETAILS: goal / assist rows by match and by player
+        self.details_by_match = {}
+        self.details_by_player = {}
+        for row in self.details:
+            match_id = clean(row.get('MATCH_ID'))
+            if not match_id:
+                continue
+            self.details_by_match.setdefault(match_id, []).append(row)
+            self.details_by_player.setdefault(clean(row.get('PLAYER NAME')), []).append(row)
+
+        # GKDETAILS: keeper rows by match and by keeper, keepers used per (match, team)
+        self.gk_by_match = {}
+        self.gk_by_player = {}
+        self.gk_count_by_match_team = Counter()
+        for row in self.gk_rows:
+            match_id = clean(row.get('MATCH_ID'))
+            keeper = clean(row.get('PLAYER NAME'))
+            if not match_id or not keeper:
+                continue
+            self.gk_by_match.setdefault(match_id, []).append(row)
+            self.gk_by_player.setdefault(keeper, []).append(row)
+            self.gk_count_by_match_team[(match_id, clean(row.get('TEAM')))] += 1
+
+        # LINEUPDETAILS: appearances by player (the sheet names the column PLAYER or PLAYER NAME)
+        self.lineups_by_player = {}
+        for row in self.lineups:
+            player = clean(row.get('PLAYER') or row.get('PLAYER NAME'))
+            if player and clean(row.get('MATCH_ID')):
+                self.lineups_by_player.setdefault(player, []).append(row)
+
+        # HOWPENMISSED: penalty saves by (match, keeper)
+        self.pen_saves_by_match_keeper = Counter(
+            (clean(row.get('MATCH_ID')), clean(row.get('PLAYER NAME')))
+            for row in self.pen_missed
+        )
+
+    def derived(self, name, build):
+        """Table computed once per snapshot: build() on first use, then from memory"""
+        value = self._derived.get(name)
+        if value is None:
+            with self._derived_lock:
+                value = self._derived.get(name)
+                if value is None:
+                    value = build()
+                    self._derived[name] = value
+        return value
+
+    def opponent_of(self, match, team):
+        """The other side of a match, seen from `team`"""
+        ahly_team = clean(match.get('AHLY TEAM'))
+        opponent_team = clean(match.get('OPPONENT TEAM'))
+        if team and team == opponent_team:
+            return ahly_team
+        return opponent_team
+
+    def goalkeeper_matches(self, keeper, team=None):
+        """
+        Every match a goalkeeper played, in MATCHDETAILS order
+
+        Args:
+            keeper: PLAYER NAME as written in GKDETAILS
+            team: Only matches where the keeper played for this TEAM (None/'' = all)
+
+        Returns:
+            List of match dictionaries (goals conceded, penalty goals conceded and
+            penalty saves are the keeper's own)
+        """
+        keeper = clean(keeper)
+        team = clean(team)
+
+        gk_rows_by_match = {}
+        for row in self.gk_by_player.get(keeper, ()):
+            if team and clean(row.get('TEAM')) != team:
+                continue
+            match_id = clean(row.get('MATCH_ID'))
+            if match_id in self.match_by_id:
+                gk_rows_by_match.setdefault(match_id, []).append(row)
+
+        pen_goals_conceded = self.pen_goals_by_match_keeper()
+        matches = []
+        for match_id in sorted(gk_rows_by_match, key=self.match_order.get):
+            match = self.match_by_id[match_id]
+            gk_rows = gk_rows_by_match[match_id]
+            gk_team = clean(gk_rows[0].get('TEAM'))
+            goals_conceded = sum(to_int(row.get('GOALS CONCEDED')) for row in gk_rows)
+
+            matches.append({
+                'match_id': match_id,
+                'date': match.get('DATE', ''),
+                'season': match.get('SEASON', ''),
+                'ahly_manager': match.get('AHLY MANAGER', ''),
+                'team': gk_team,
+                'opponent_team': self.opponent_of(match, gk_team),
+                'goals_conceded': goals_conceded,
+                'penalty_goals': pen_goals_conceded[(match_id, keeper)],
+                'penalty_saves': self.pen_saves_by_match_keeper[(match_id, keeper)],
+                'clean_sheet': 'Yes' if goals_conceded == 0 else 'No'
+            })
+        return matches
+
+    def goalkeeper_profile(self, keeper, team=None):
+        """
+        A goalkeeper's matches plus their totals per championship, season and opponent
+
+        Args:
+            keeper: PLAYER NAME as written in GKDETAILS
+            team: Only matches where the keeper played for this TEAM (None/'' = all)
+
+        Returns:
+            Dictionary with matches (see goalkeeper_matches), championships, seasons
+            and vs_teams (most matches first; clean sheets as in goalkeeper_stats)
+        """
+        matches = self.goalkeeper_matches(keeper, team)
+
+        def group(label, key_of):
+            groups = {}
+            for match in matches:
+                name = key_of(match)
+                stats = groups.setdefault(name, dict(empty_goalkeeper_stats(), **{label: name}))
+                stats['total_matches'] += 1
+                stats['goals_conceded'] += match['goals_conceded']
+                stats['clean_sheets'] += int(match['goals_conceded'] == 0 and
+                                             self.gk_count_by_match_team[(match['match_id'], match['team'])] == 1)
+                stats['pen_goals_conceded'] += match['penalty_goals']
+                stats['pen_saves'] += match['penalty_saves']
+            return sorted(groups.values(), key=lambda stats: -stats['total_matches'])
+
+        def match_field(field):
+            return lambda match: clean(self.match_by_id[match['match_id']].get(field))
+
+        return {
+            'matches': matches,
+            'championships': group('championship', match_field('CHAMPION')),
+            'seasons': group('season', match_field('SEASON')),
+            'vs_teams': group('team', lambda match: match['opponent_team'])
+        }
+
+    def goalkeeper_stats_table(self):
+        """
+        Overview statistics of every goalkeeper, per team and overall
+
+        Returns:
+            Dictionary {keeper: {team: stats}} where team '' holds the keeper's totals
+            and stats has total_matches, goals_conceded, clean_sheets,
+            pen_goals_conceded and pen_saves
+        """
+        return self.derived('goalkeeper_stats', self._build_goalkeeper_stats)
+
+    def _build_goalkeeper_stats(self):
+        table = {}
+        keeper_team_by_match = {}
+        pen_goals_conceded = Counter(self.pen_goals_by_match_keeper())
+        for row in self.gk_rows:
+            match_id = clean(row.get('MATCH_ID'))
+            keeper = clean(row.get('PLAYER NAME'))
+            if not match_id or not keeper:
+                continue
+            team = clean(row.get('TEAM'))
+            keeper_team_by_match.setdefault((match_id, keeper), team)
+
+            goals_conceded = to_int(row.get('GOALS CONCEDED'))
+            # A clean sheet only counts for a keeper who played the whole match alone
+            clean_sheet = goals_conceded == 0 and self.gk_count_by_match_team[(match_id, team)] == 1
+            # Charged once per (match, keeper), even if the keeper has several rows
+            pen_goals = pen_goals_conceded.pop((match_id, keeper), 0)
+
+            for stats in self._goalkeeper_stats_rows(table, keeper, team):
+                stats['total_matches'] += 1
+                stats['goals_conceded'] += goals_conceded
+                stats['clean_sheets'] += int(clean_sheet)
+                stats['pen_goals_conceded'] += pen_goals
+
+        # Saves count for the team the keeper played for in that match (if known)
+        for (match_id, keeper), saves in self.pen_saves_by_match_keeper.items():
+            if not keeper:
+                continue
+            team = keeper_team_by_match.get((match_id, keeper), '')
+            for stats in self._goalkeeper_stats_rows(table, keeper, team):
+                stats['pen_saves'] += saves
+        return table
+
+    @staticmethod
+    def _goalkeeper_stats_rows(table, keeper, team):
+        """The keeper's overall stats, plus the per-team stats when team is known"""
+        by_team = table.setdefault(keeper, {})
+        rows = [by_team.setdefault('', empty_goalkeeper_stats())]
+        if team:
+            rows.append(by_team.setdefault(team, empty_goalkeeper_stats()))
+        return rows
+
+    def goalkeeper_stats(self, keeper, team=None):
+        """Overview statistics of one goalkeeper (all zero if unknown)"""
+        by_team = self.goalkeeper_stats_table().get(clean(keeper), {})
+        return dict(by_team.get(clean(team)) or empty_goalkeeper_stats())
+
+    def goalkeeper_leaderboard(self, team=None):
+        """Every goalkeeper's statistics for a team ('' / None = overall), most matches first"""
+        team = clean(team)
+        rows = [
+            dict(by_team[team], goalkeeper_name=keeper)
+            for keeper, by_team in self.goalkeeper_stats_table().items()
+            if team in by_team
+        ]
+        rows.sort(key=lambda row: (-row['total_matches'], row['goalkeeper_name']))
+        return rows
+
+    def goal_attribution(self):
+        """
+        Every goal with the goalkeeper who conceded it
+
+        Each goal is matched to the other team's keepers in that match; with a
+        substitution the keeper who came on last at or before the goal minute is
+        responsible (goals with no such keeper go to the starter).
+
+        Returns:
+            DataFrame with match_id, scorer, team, minute, is_pen, keeper, keeper_team
+        """
+        return self.derived('goal_attribution', self._build_goal_attribution)
+
+    def _build_goal_attribution(self):
+        goals = pd.DataFrame(
+            [(clean(row.get('MATCH_ID')), clean(row.get('PLAYER NAME')), clean(row.get('TEAM')),
+              clean(row.get('MINUTE')), clean(row.get('TYPE')).upper() == 'PENGOAL')
+             for row in self.details if is_goal(row)],
+            columns=['match_id', 'scorer', 'team', 'minute', 'is_pen']
+        )
+        keepers = pd.DataFrame(
+            [(clean(row.get('MATCH_ID')), clean(row.get('PLAYER NAME')), clean(row.get('TEAM')),
+              clean(row.get('11/BAKEUP')).upper(), clean(row.get('SUBMIN')))
+             for row in self.gk_rows],
+            columns=['match_id', 'keeper', 'keeper_team', 'eleven_backup', 'submin']
+        )
+        columns = ['match_id', 'scorer', 'team', 'minute', 'is_pen', 'keeper', 'keeper_team']
+        goals = goals[(goals['match_id'] != '') & (goals['scorer'] != '')]
+        keepers = keepers[(keepers['match_id'] != '') & (keepers['keeper'] != '')]
+        if goals.empty or keepers.empty:
+            return pd.DataFrame(columns=columns)
+
+        # '45+2' -> 45; blanks -> 0
+        goals['minute'] = pd.to_numeric(goals['minute'].str.extract(r'(\d+)', expand=False), errors='coerce').fillna(0).astype(int)
+        goals['goal_id'] = range(len(goals))
+        # Minute the keeper came on (starters: 0)
+        submin = pd.to_numeric(keepers['submin'].str.extract(r'(\d+)', expand=False), errors='coerce').fillna(0).astype(int)
+        keepers['on_minute'] = submin.where(keepers['eleven_backup'] != '11', 0)
+
+        # Interval join: each goal against the other team's keepers in that match
+        pairs = goals.merge(keepers[['match_id', 'keeper', 'keeper_team', 'on_minute']], on='match_id')
+        pairs = pairs[pairs['keeper_team'] != pairs['team']]
+        on_pitch = pairs['on_minute'] <= pairs['minute']
+        # Keep the latest keeper on before the goal; failing that, the earliest keeper
+        pairs = pairs.assign(on_pitch=on_pitch, order=pairs['on_minute'].where(on_pitch, -pairs['on_minute']))
+        pairs = pairs.sort_values(['goal_id', 'on_pitch', 'order'], kind='stable')
+        attributed = pairs.drop_duplicates('goal_id', keep='last')
+        return attributed[columns].reset_index(drop=True)
+
+    def pen_goals_by_match_keeper(self):
+        """
+        Penalty goals conceded per (match, goalkeeper)
+
+        Taken from goal_attribution(), so with a substitution each penalty is
+        charged to the keeper who was on the pitch, not to both keepers.
+        """
+        return self.derived('pen_goals_by_match_keeper', self._build_pen_goals_by_match_keeper)
+
+    def _build_pen_goals_by_match_keeper(self):
+        attribution = self.goal_attribution()
+        penalties = attribution[attribution['is_pen'].astype(bool)]
+        return Counter(zip(penalties['match_id'], penalties['keeper']))
+
+    def scorer_keeper_table(self):
+        """
+        Goals per (scorer, team, goalkeeper, keeper team)
+
+        Returns:
+            DataFrame with scorer, team, keeper, keeper_team, goals, pen_goals
+        """
+        return self.derived('scorer_keeper_table', self._build_scorer_keeper_table)
+
+    def _build_scorer_keeper_table(self):
+        attribution = self.goal_attribution()
+        keys = ['scorer', 'team', 'keeper', 'keeper_team']
+        if attribution.empty:
+            return pd.DataFrame(columns=keys + ['goals', 'pen_goals'])
+        return (attribution.groupby(keys, sort=False)
+                .agg(goals=('is_pen', 'size'), pen_goals=('is_pen', 'sum'))
+                .reset_index())
+
+    def player_vs_goalkeepers(self, player, team=None):
+        """
+        Goalkeepers who conceded goals from a player, most goals first
+
+        Args:
+            player: Scorer's PLAYER NAME
+            team: Only goals scored for this TEAM (None/'' = all)
+        """
+        table = self.scorer_keeper_table()
+        rows = table[table['scorer'] == clean(player)]
+        if clean(team):
+            rows = rows[rows['team'] == clean(team)]
+        return self._goals_by(rows, 'keeper', 'GOALKEEPER_NAME')
+
+    def goalkeeper_vs_players(self, keeper, team=None):
+        """
+        Players who scored against a goalkeeper, most goals first
+
+        Args:
+            keeper: Goalkeeper's PLAYER NAME
+            team: Only goals conceded while keeping for this TEAM (None/'' = all)
+        """
+        table = self.scorer_keeper_table()
+        rows = table[table['keeper'] == clean(keeper)]
+        if clean(team):
+            rows = rows[rows['keeper_team'] == clean(team)]
+        return self._goals_by(rows, 'scorer', 'PLAYER_NAME')
+
+    def player_profile(self, player, team=None):
+        """
+        Every tab of a player's profile, built in one pass over the player's rows
+
+        Args:
+            player: PLAYER NAME
+            team: Only events / appearances for this TEAM (None/'' = all)
+
+        Returns:
+            Dictionary with overview_stats, matches, championships, seasons, sy,
+            vs_teams, vs_goalkeepers, goal_minutes and goals_by_round
+            (cached for this snapshot - don't modify it)
+        """
+        key = (clean(player), clean(team))
+        with self._derived_lock:
+            profile = self._profiles.get(key)
+            if profile is not None:
+                self._profiles.move_to_end(key)
+                return profile
+
+        profile = self._build_player_profile(*key)
+        with self._derived_lock:
+            self._profiles[key] = profile
+            while len(self._profiles) > PLAYER_PROFILE_CACHE_SIZE:
+                self._profiles.popitem(last=False)
+        return profile
+
+    def _build_player_profile(self, player, team):
+        overview = dict(
+            total_matches=0, total_minutes=0, total_goals=0, total_assists=0,
+            matches_with_goals=0, matches_without_goals=0,
+            brace_goals=0, brace_assists=0, hat_trick_goals=0, hat_trick_assists=0,
+            three_plus_goals=0, three_plus_assists=0, own_goals=0,
+            **{stat: 0 for stat in PENALTY_STATS.values()}
+        )
+
+        # Goals / assists per match, the team the player had in it, goal minutes and rounds
+        ga_by_match = {}
+        team_by_match = {}
+        goal_minutes = Counter()
+        goals_by_round = {}
+        for row in self.details_by_player.get(player, ()):
+            row_team = clean(row.get('TEAM'))
+            match_id = clean(row.get('MATCH_ID'))
+            if (team and row_team != team) or match_id not in self.match_by_id:
+                continue
+            team_by_match.setdefault(match_id, row_team)
+            ga = clean(row.get('GA')).upper()
+            for event in {code(row.get('TYPE')), code(row.get('GA'))}:
+                if event in PENALTY_STATS:
+                    overview[PENALTY_STATS[event]] += 1
+            if code(row.get('TYPE')) == 'OG':
+                overview['own_goals'] += 1
+            if ga not in ('GOAL', 'ASSIST'):
+                continue
+
+            counts = ga_by_match.setdefault(match_id, [0, 0])
+            counts[1 if ga == 'ASSIST' else 0] += 1
+            match = self.match_by_id[match_id]
+            champion = clean(match.get('CHAMPION')) or 'Unknown'
+            round_name = clean(match.get('ROUND')) or 'Unknown'
+            champion_stats = goals_by_round.setdefault(champion, {'totalGoals': 0, 'totalAssists': 0, 'rounds': {}})
+            round_stats = champion_stats['rounds'].setdefault(round_name, {'goals': 0, 'assists': 0})
+            if ga == 'GOAL':
+                champion_stats['totalGoals'] += 1
+                round_stats['goals'] += 1
+                if clean(row.get('MINUTE')):
+                    goal_minutes[clean(row.get('MINUTE'))] += 1
+            else:
+                champion_stats['totalAssists'] += 1
+                round_stats['assists'] += 1
+
+        # Appearances: minutes per match (LINEUPDETAILS rows without TEAM are Ahly's)
+        minutes_by_match = {}
+        for row in self.lineups_by_player.get(player, ()):
+            match_id = clean(row.get('MATCH_ID'))
+            match = self.match_by_id.get(match_id)
+            if match is None:
+                continue
+            row_team = clean(row.get('TEAM')) or clean(match.get('AHLY TEAM'))
+            if team and row_team != team:
+                continue
+            team_by_match.setdefault(match_id, row_team)
+            minutes = to_int(row.get('MINTOTAL'))
+            minutes_by_match[match_id] = max(minutes, minutes_by_match.get(match_id, 0))
+
+        played = sorted(minutes_by_match, key=self.match_order.get)
+        matches = []
+        for match_id in played:
+            match = self.match_by_id[match_id]
+            goals, assists = ga_by_match.get(match_id, (0, 0))
+            matches.append({
+                'match_id': match_id,
+                'date': match.get('DATE', ''),
+                'season': match.get('SEASON', ''),
+                'ahly_manager': match.get('AHLY MANAGER', ''),
+                'opponent_team': self.opponent_of(match, team_by_match[match_id]),
+                'goals': goals,
+                'assists': assists,
+                'minutes': minutes_by_match[match_id]
+            })
+
+        overview['total_matches'] = len(played)
+        overview['total_minutes'] = sum(minutes_by_match.values())
+        overview['matches_with_goals'] = sum(1 for match_id in played if ga_by_match.get(match_id, (0, 0))[0] > 0)
+        overview['matches_without_goals'] = len(played) - overview['matches_with_goals']
+        for goals, assists in ga_by_match.values():
+            overview['total_goals'] += goals
+            overview['total_assists'] += assists
+            overview['brace_goals'] += goals >= 2
+            overview['hat_trick_goals'] += goals >= 3
+            overview['three_plus_goals'] += goals >= 4
+            overview['brace_assists'] += assists >= 2
+            overview['hat_trick_assists'] += assists >= 3
+            overview['three_plus_assists'] += assists >= 4
+
+        def group(label, key_of):
+            # Matches / minutes from appearances; goals and assists from every match with events
+            groups = {}
+            match_ids = sorted(set(minutes_by_match) | set(ga_by_match), key=self.match_order.get)
+            for match_id in match_ids:
+                name = key_of(match_id)
+                stats = groups.setdefault(name, {label: name, 'matches': 0, 'minutes': 0, 'goals': 0, 'assists': 0})
+                if match_id in minutes_by_match:
+                    stats['matches'] += 1
+                    stats['minutes'] += minutes_by_match[match_id]
+                goals, assists = ga_by_match.get(match_id, (0, 0))
+                stats['goals'] += goals
+                stats['assists'] += assists
+            rows = list(groups.values())
+            for stats in rows:
+                stats['ga_sum'] = stats['goals'] + stats['assists']
+            return rows
+
+        def match_field(field, blank=''):
+            return lambda match_id: clean(self.match_by_id[match_id].get(field)) or blank
+
+        # Lists, not dicts: JSON responses sort object keys
+        timeline = [{'period': label, 'goals': 0} for label, _, _ in GOAL_MINUTE_BUCKETS]
+        for minute, count in goal_minutes.items():
+            value = minute_sort_key(minute)
+            for bucket, (_, first, last) in zip(timeline, GOAL_MINUTE_BUCKETS):
+                if value >= first and (last is None or value < last + 1):
+                    bucket['goals'] += count
+                    break
+
+        return {
+            'overview_stats': overview,
+            'matches': matches,
+            'championships': group('CHAMPION', match_field('CHAMPION')),
+            'seasons': group('SEASON', match_field('SEASON')),
+            'sy': group('SY', match_field('SY', '—')),
+            'vs_teams': group('OPPONENT_TEAM', lambda match_id: self.opponent_of(
+                self.match_by_id[match_id], team_by_match[match_id])),
+            'vs_goalkeepers': self.player_vs_goalkeepers(player, team),
+            'goal_minutes': {
+                'minutes': [{'minute': minute, 'goals': count}
+                            for minute, count in sorted(goal_minutes.items(), key=lambda item: minute_sort_key(item[0]))],
+                'timeline': timeline
+            },
+            'goals_by_round': goals_by_round
+        }
+
+    @staticmethod
+    def _goals_by(rows, column, name_key):
+        if rows.empty:
+            return []
+        totals = rows.groupby(column, sort=False)[['goals', 'pen_goals']].sum()
+        totals = totals.sort_values('goals', ascending=False, kind='stable')
+        return [
+            {name_key: name, 'goals': int(goals), 'pen_goals': int(pen_goals)}
+            for name, goals, pen_goals in totals.itertuples()
+        ]
+
+
+# Global workbook instance (rebuilt when the snapshot changes)
+_workbook = None
+_workbook_lock = threading.Lock()
+
+def get_workbook():
+    """
+    Get the workbook model for the current AHLY_MATCH snapshot
+
+    Returns:
+        AhlyWorkbook, or None if no snapshot could be loaded
+    """
+    global _workbook
+    from google_sheets_sync import get_sheets_data, CACHE_KEY_PREFIX
+    from cache_manager import get_cache_manager
+
+    sheets = get_sheets_data()
+    if not sheets:
+        return None
+
+    workbook = _workbook
+    if workbook is not None and workbook.sheets is sheets:
+        return workbook
+
+    with _workbook_lock:
+        if _workbook is None or _workbook.sheets is not sheets:
+            entry = get_cache_manager().get_memory_entry(f"{CACHE_KEY_PREFIX}all_sheets", sheets)
+            _workbook = AhlyWorkbook(sheets, version=entry.version if entry else None)
+            print(f"📚 Indexed Al Ahly workbook ({len(_workbook.matches)} matches) in {_workbook.build_seconds:.3f}s")
+        return _workbook
+
+
+def _fixture_sheets(match_count=3000, seed=7):
+    """Synthetic snapshot shaped like AHLY_MATCH (for the benchmark below)"""
+    import random
+    rng = random.Random(seed)
+    keepers = [f"Keeper {i}" for i in range(40)]
+    teams = [f"Team {i}" for i in range(60)]
+    sheets = {'MATCHDETAILS': [], 'PLAYERDETAILS': [], 'GKDETAILS': [], 'HOWPENMISSED': []}
+    for number in range(match_count):
+        match_id = f"M{number:05d}"
+        opponent = rng.choice(teams)
+        sheets['MATCHDETAILS'].append({
+            'MATCH_ID': match_id, 'DATE': 40000 + number, 'SEASON': f"{2000 + number // 60}",
+            'AHLY MANAGER': 'Manager', 'AHLY TEAM': 'الأهلي', 'OPPONENT TEAM': opponent
+        })
+        for team, keeper in (('الأهلي', keepers[number % 5]), (opponent, rng.choice(keepers[5:]))):
+            sheets['GKDETAILS'].append({
+                'MATCH_ID': match_id, 'PLAYER NAME': keeper, 'TEAM': team,
+                '11/BAKEUP': '11', 'SUBMIN': '', 'GOALS CONCEDED': rng.randint(0, 3)
+            })
+            if team == opponent and rng.random() < 0.1:
+                sheets['GKDETAILS'].append({
+                    'MATCH_ID': match_id, 'PLAYER NAME': rng.choice(keepers[5:]), 'TEAM': team,
+                    '11/BAKEUP': 'BAKEUP', 'SUBMIN': rng.randint(30, 80), 'GOALS CONCEDED': 0
+                })
+            for _ in range(rng.randint(0, 4)):
+                pen = rng.random() < 0.15
+                sheets['PLAYERDETAILS'].append({
+                    'MATCH_ID': match_id, 'PLAYER NAME': f"Player {rng.randint(0, 400)}", 'TEAM': team,
+                    'GA': 'GOAL', 'TYPE': 'PENGOAL' if pen else '', 'MINUTE': rng.randint(1, 90)
+                })
+            if rng.random() < 0.05:
+                sheets['HOWPENMISSED'].append({'MATCH_ID': match_id, 'PLAYER NAME': keeper, 'TEAM': team, 'MINUTE': 60})
+    return sheets
+
+
+def _per_match_goalkeeper_matches(sheets, keeper, read_sheet):
+    """
+    The old route's algorithm: both penalty worksheets are re-read for every match
+
+    (Its penalty goals are every penalty the other team scored in the match, so a
+    substituted keeper's count differs from the attributed one - see the benchmark.)
+    """
+    match_ids = {clean(row.get('MATCH_ID')): clean(row.get('TEAM'))
+                 for row in read_sheet('GKDETAILS') if clean(row.get('PLAYER NAME')) == keeper}
+    matches = []
+    for match in read_sheet('MATCHDETAILS'):
+        match_id = clean(match.get('MATCH_ID'))
+        if match_id not in match_ids:
+            continue
+        pen_goals = sum(1 for row in read_sheet('PLAYERDETAILS')
+                        if clean(row.get('MATCH_ID')) == match_id and is_pen_goal(row)
+                        and clean(row.get('TEAM')) != match_ids[match_id])
+        pen_saves = sum(1 for row in read_sheet('HOWPENMISSED')
+                        if clean(row.get('MATCH_ID')) == match_id and clean(row.get('PLAYER NAME')) == keeper)
+        matches.append((match_id, pen_goals, pen_saves))
+    return matches
+
+
+def _per_goal_vs_goalkeepers(sheets, player, read_sheet):
+    """The old player-vs-goalkeepers algorithm: per-player scans and per-goal SUBMIN loops"""
+    goals_by_match = {}
+    for row in read_sheet('PLAYERDETAILS'):
+        if clean(row.get('PLAYER NAME')) == player and is_goal(row):
+            goals_by_match.setdefault(clean(row.get('MATCH_ID')), []).append((to_int(row.get('MINUTE')), clean(row.get('TEAM'))))
+    keepers_by_match = {}
+    for row in read_sheet('GKDETAILS'):
+        submin = to_int(row.get('SUBMIN'))
+        keepers_by_match.setdefault(clean(row.get('MATCH_ID')), []).append(
+            (0 if clean(row.get('11/BAKEUP')) == '11' else submin, clean(row.get('PLAYER NAME')), clean(row.get('TEAM'))))
+    totals = Counter()
+    for match_id, goals in goals_by_match.items():
+        for minute, team in goals:
+            keepers = sorted(k for k in keepers_by_match.get(match_id, ()) if k[2] != team)
+            if not keepers:
+                continue
+            responsible = keepers[0]
+            for keeper in keepers:
+                if keeper[0] <= minute:
+                    responsible = keeper
+            totals[responsible[1]] += 1
+    return dict(totals)
+
+
+if __name__ == '__main__':
+    # Benchmark: per-match worksheet reads vs the indexed model.
+    # Usage: python ahly_workbook.py [snapshot.json]  (a saved /api/ahly-stats/sheets-data
+    # response or {worksheet: records}; default: a synthetic fixture)
+    import sys
+    import json
+
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], 'r', encoding='utf-8') as f:
+            sheets = json.load(f)
+        sheets = sheets.get('data', sheets)
+    else:
+        sheets = _fixture_sheets()
+
+    reads = Counter()
+
+    def read_sheet(title):
+        reads[title] += 1
+        return list(sheets.get(title) or [])  # get_all_records() hands out a fresh list
+
+    start = time.perf_counter()
+    workbook = AhlyWorkbook(sheets)
+    workbook.pen_goals_by_match_keeper()
+    build_seconds = time.perf_counter() - start
+
+    keepers = sorted(workbook.gk_by_player, key=lambda name: -len(workbook.gk_by_player[name]))[:5]
+    for keeper in keepers:
+        reads.clear()
+        start = time.perf_counter()
+        expected = _per_match_goalkeeper_matches(sheets, keeper, read_sheet)
+        old_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = workbook.goalkeeper_matches(keeper)
+        new_seconds = time.perf_counter() - start
+
+        actual = [(m['match_id'], m['penalty_saves']) for m in result]
+        assert actual == [(match_id, pen_saves) for match_id, _, pen_saves in expected], f"Mismatch for {keeper}"
+        # Keepers who played a whole match alone are charged every penalty against their team
+        for match, (_, pen_goals, _) in zip(result, expected):
+            if workbook.gk_count_by_match_team[(match['match_id'], match['team'])] == 1:
+                assert match['penalty_goals'] == pen_goals, f"Penalty mismatch for {keeper} in {match['match_id']}"
+        print(f"{keeper}: {len(result)} matches | per-match: {sum(reads.values())} worksheet reads, "
+              f"{old_seconds * 1000:.1f}ms | indexed: 0 reads, {new_seconds * 1000:.2f}ms")
+
+    print(f"Index build + penalty attribution: {build_seconds * 1000:.1f}ms (once per snapshot)")
+
+    start = time.perf_counter()
+    table = workbook.goalkeeper_stats_table()
+    print(f"Goalkeeper stats for {len(table)} keepers (every team): "
+          f"{(time.perf_counter() - start) * 1000:.1f}ms (once per snapshot)")
+    # Every attributed penalty is charged to exactly one keeper
+    charged = sum(by_team['']['pen_goals_conceded'] for by_team in table.values())
+    assert charged == int(workbook.goal_attribution()['is_pen'].sum()), "Penalties charged more than once"
+
+    start = time.perf_counter()
+    table = workbook.scorer_keeper_table()
+    print(f"Goal attribution for {table['scorer'].nunique()} scorers: "
+          f"{(time.perf_counter() - start) * 1000:.1f}ms (once per snapshot)")
+    scorers = table.groupby('scorer')['goals'].sum().nlargest(5).index
+    for scorer in scorers:
+        reads.clear()
+        start = time.perf_counter()
+        expected = _per_goal_vs_goalkeepers(sheets, scorer, read_sheet)
+        old_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = workbook.player_vs_goalkeepers(scorer)
+        new_seconds = time.perf_counter() - start
+
+        assert {row['GOALKEEPER_NAME']: row['goals'] for row in result} == expected, f"Mismatch for {scorer}"
+        print(f"{scorer} vs goalkeepers: per-goal {old_seconds * 1000:.1f}ms | table {new_seconds * 1000:.2f}ms")
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""
+Cache Codec
+===========
+Serializes cache envelopes to compact bytes (orjson / msgpack / json) with optional
+gzip or zstd compression. Encoded values start with a header byte naming the codec
+and compression, so entries written as plain JSON text by older versions still decode.
+"""
+
+import os
+import json
+import gzip
+
+# Try to import fast codecs and zstd (all optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Header byte: 1ZZZ CCCC -> high bit set (never the first byte of JSON text),
+# ZZZ = compression id, CCCC = codec id
+HEADER_FLAG = 0x80
+
+# Values smaller than this are stored uncompressed
+MIN_COMPRESS_BYTES = 4096
+GZIP_LEVEL = 5
+ZSTD_LEVEL = 3
+
+
+def _json_dumps(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _json_loads(raw):
+    return json.loads(bytes(raw) if isinstance(raw, memoryview) else raw)
+
+# Codec name -> (id, dumps to bytes, loads from bytes)
+CODECS = {'json': (1, _json_dumps, _json_loads)}
+if ORJSON_AVAILABLE:
+    CODECS['orjson'] = (2, lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS), orjson.loads)
+if MSGPACK_AVAILABLE:
+    CODECS['msgpack'] = (
+        3,
+        lambda obj: msgpack.packb(obj, use_bin_type=True),
+        lambda raw: msgpack.unpackb(raw, raw=False, strict_map_key=False)
+    )
+
+# Compression name -> (id, compress, decompress)
+COMPRESSIONS = {
+    'none': (0, None, None),
+    'gzip': (1, lambda raw: gzip.compress(raw, compresslevel=GZIP_LEVEL), gzip.decompress),
+}
+if ZSTD_AVAILABLE:
+    COMPRESSIONS['zstd'] = (
+        2,
+        lambda raw: zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw),
+        lambda raw: zstandard.ZstdDecompressor().decompress(raw)
+    )
+
+_CODECS_BY_ID = {codec_id: (name, loads) for name, (codec_id, _, loads) in CODECS.items()}
+_COMPRESSIONS_BY_ID = {comp_id: (name, decompress) for name, (comp_id, _, decompress) in COMPRESSIONS.items()}
+
+
+def default_codec():
+    """Fastest available codec: orjson, then msgpack, then json"""
+    for name in ('orjson', 'msgpack', 'json'):
+        if name in CODECS:
+            return name
+
+def default_compression():
+    """zstd if available (cheap enough to always use), else none"""
+    return 'zstd' if ZSTD_AVAILABLE else 'none'
+
+
+class CacheCodec:
+    """Encodes/decodes cache values with a self-describing header byte"""
+
+    def __init__(self, codec=None, compression=None):
+        """
+        Initialize codec
+
+        Args:
+            codec: 'orjson', 'msgpack' or 'json' (None/'auto' = fastest available)
+            compression: 'zstd', 'gzip' or 'none' (None/'auto' = zstd if available)
+        """
+        if codec in (None, '', 'auto'):
+            codec = default_codec()
+        if compression in (None, '', 'auto'):
+            compression = default_compression()
+
+        if codec not in CODECS:
+            print(f"⚠️ Cache codec '{codec}' not available, using {default_codec()}")
+            codec = default_codec()
+        if compression not in COMPRESSIONS:
+            print(f"⚠️ Cache compression '{compression}' not available, using none")
+            compression = 'none'
+
+        self.codec = codec
+        self.compression = compression
+
+    def encode(self, obj):
+        """Serialize (and maybe compress) a value to bytes with the header byte"""
+        return self.encode_sized(obj)[0]
+
+    def dumps(self, obj):
+        """Serialize a value with the codec alone (no header or compression), e.g. to hash it"""
+        return CODECS[self.codec][1](obj)
+
+    def encode_sized(self, obj):
+        """
+        Encode a value
+
+        Returns:
+            Tuple (encoded bytes, uncompressed size) - the size is what the
+            decoded value costs to keep around, used for memory budgets
+        """
+        codec_id, dumps, _ = CODECS[self.codec]
+        raw = dumps(obj)
+        raw_size = len(raw)
+
+        comp_id, compress, _ = COMPRESSIONS[self.compression]
+        if compress is None or raw_size < MIN_COMPRESS_BYTES:
+            comp_id = 0
+        else:
+            raw = compress(raw)
+
+        return bytes([HEADER_FLAG | (comp_id << 4) | codec_id]) + raw, raw_size
+
+    def decode(self, raw):
+        """
+        Decode a value written by any codec (or legacy JSON text)
+
+        Raises:
+            ValueError: unknown header (e.g. written with a codec that isn't installed here)
+        """
+        return self.decode_sized(raw)[0]
+
+    def decode_sized(self, raw):
+        """
+        Decode a value
+
+        Returns:
+            Tuple (value, uncompressed size)
+        """
+        if isinstance(raw, str):
+            return json.loads(raw), len(raw)
+
+        if not len(raw) or not raw[0] & HEADER_FLAG:
+            # Legacy entry: plain JSON text
+            return json.loads(bytes(raw)), len(raw)
+
+        header = raw[0]
+        codec_id, comp_id = header & 0x0F, (header >> 4) & 0x07
+        if codec_id not in _CODECS_BY_ID or comp_id not in _COMPRESSIONS_BY_ID:
+            raise ValueError(f"Unsupported cache encoding (header 0x{header:02x})")
+
+        # raw may be an mmap - views must be released before the caller closes it
+        with memoryview(raw) as view:
+            with view[1:] as body:
+                decompress = _COMPRESSIONS_BY_ID[comp_id][1]
+                if decompress is not None:
+                    decoded = decompress(body)
+                    return _CODECS_BY_ID[codec_id][1](decoded), len(decoded)
+                return _CODECS_BY_ID[codec_id][1](body), len(body)
+
+    def describe(self):
+        return f"{self.codec}+{self.compression}"
+
+
+# Global codec instance
+_codec = None
+
+def get_codec():
+    """Get or create the codec configured by CACHE_CODEC / CACHE_COMPRESSION"""
+    global _codec
+    if _codec is None:
+        _codec = CacheCodec(os.environ.get('CACHE_CODEC'), os.environ.get('CACHE_COMPRESSION'))
+    return _codec
+
+
+if __name__ == '__main__':
+    # Benchmark every available codec/compression on real cache entries
+    # Usage: python cache_codec.py [cache_dir_or_file ...]   (default: the local file cache)
+    import sys
+    import time
+    from pathlib import Path
+
+    def load_datasets(paths):
+        """Read cache envelopes (any format) from files / directories"""
+        reader = CacheCodec('json', 'none')
+        datasets = {}
+        for path in paths:
+            path = Path(path)
+            files = sorted(path.glob('*.json')) if path.is_dir() else [path]
+            for cache_file in files:
+                try:
+                    datasets[cache_file.name] = reader.decode(cache_file.read_bytes())
+                except Exception as e:
+                    print(f"⚠️ Skipping {cache_file.name}: {e}")
+        return datasets
+
+    def timed(func, repeat):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            result = func()
+        return (time.perf_counter() - start) / repeat * 1000, result
+
+    paths = sys.argv[1:]
+    if not paths:
+        from cache_manager import get_cache_manager
+        cache = get_cache_manager()
+        if not hasattr(cache, 'cache_dir'):
+            print("❌ No file cache available - pass a cache directory or JSON file")
+            sys.exit(1)
+        paths = [cache.cache_dir]
+
+    datasets = load_datasets(paths)
+    if not datasets:
+        print("❌ No cache entries found - run a sync first or pass a JSON file")
+        sys.exit(1)
+
+    legacy = lambda obj: json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+    for name, envelope in sorted(datasets.items(), key=lambda item: -len(legacy(item[1]))):
+        repeat = 5
+        legacy_bytes = legacy(envelope)
+        print("\n" + "=" * 78)
+        print(f"{name}  (legacy indent=2 JSON: {len(legacy_bytes) / 1024:.1f} KB)")
+        print("=" * 78)
+        print(f"{'codec':<18}{'size KB':>10}{'ratio':>8}{'encode ms':>12}{'decode ms':>12}")
+
+        legacy_encode, _ = timed(lambda: legacy(envelope), repeat)
+        legacy_decode, _ = timed(lambda: json.loads(legacy_bytes), repeat)
+        print(f"{'legacy json':<18}{len(legacy_bytes) / 1024:>10.1f}{1:>8.2f}{legacy_encode:>12.2f}{legacy_decode:>12.2f}")
+
+        for codec_name in CODECS:
+            for compression_name in COMPRESSIONS:
+                codec = CacheCodec(codec_name, compression_name)
+                encode_ms, encoded = timed(lambda: codec.encode(envelope), repeat)
+                decode_ms, decoded = timed(lambda: codec.decode(encoded), repeat)
+                assert decoded == json.loads(legacy_bytes), f"{codec.describe()} changed the data"
+                ratio = len(encoded) / len(legacy_bytes)
+                print(f"{codec.describe():<18}{len(encoded) / 1024:>10.1f}{ratio:>8.2f}{encode_ms:>12.2f}{decode_ms:>12.2f}")
+
+    print(f"\nActive codec: {get_codec().describe()}")
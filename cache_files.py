@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Cache File I/O
+==============
+Crash- and concurrency-safe file operations for the file-based cache:
+atomic replace on write, per-key locks (threads and processes), and
+memory-mapped reads for large entries
+"""
+
+import os
+import time
+import mmap
+import tempfile
+import threading
+from contextlib import contextmanager
+
+# Platform specific advisory file locks
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+# Entries at least this big are memory-mapped instead of read into a bytes copy
+MMAP_MIN_BYTES = 256 * 1024
+
+# os.replace on Windows fails while another handle has the target open - retry briefly
+REPLACE_RETRIES = 10
+REPLACE_RETRY_DELAY = 0.05
+
+
+class KeyLocks:
+    """Per-key write locks: a thread lock plus an advisory lock file shared by processes"""
+
+    def __init__(self, lock_dir):
+        self.lock_dir = lock_dir
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def _thread_lock(self, name):
+        with self._lock:
+            if name not in self._locks:
+                self._locks[name] = threading.Lock()
+            return self._locks[name]
+
+    @contextmanager
+    def hold(self, name):
+        """Hold the lock for a cache file name (e.g. 'Egypt_Teams_matches.json')"""
+        with self._thread_lock(name):
+            lock_path = os.path.join(self.lock_dir, f".{name}.lock")
+            with open(lock_path, 'a+b') as lock_file:
+                _lock_file(lock_file)
+                try:
+                    yield
+                finally:
+                    _unlock_file(lock_file)
+
+
+def _lock_file(lock_file):
+    if os.name == 'nt':
+        lock_file.seek(0)
+        # LK_LOCK retries for ~10 seconds before raising
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+    else:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+
+
+def try_lock_file(lock_file):
+    """Non-blocking exclusive lock on an open file (True if acquired)"""
+    try:
+        if os.name == 'nt':
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock_file(lock_file):
+    if os.name == 'nt':
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def atomic_write(path, data):
+    """
+    Write bytes so readers see either the old file or the complete new one
+
+    Writes a temp file in the same directory, fsyncs it and renames it over
+    the target with os.replace.
+    """
+    path = str(path)
+    directory = os.path.dirname(path)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+        for attempt in range(REPLACE_RETRIES):
+            try:
+                os.replace(temp_path, path)
+                break
+            except PermissionError:
+                # Windows: a reader still has the old file open
+                if attempt == REPLACE_RETRIES - 1:
+                    raise
+                time.sleep(REPLACE_RETRY_DELAY)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def read_decoded(path, decode):
+    """
+    Read a file and decode it, memory-mapping large files
+
+    Args:
+        path: File to read
+        decode: Callable taking a bytes-like object (bytes or mmap)
+
+    Returns:
+        Whatever decode returns
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_MIN_BYTES:
+            return decode(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return decode(mapped)
+
+
+def remove_stale_temp_files(directory, max_age_seconds=3600):
+    """Delete temp files left behind by writes that crashed before os.replace"""
+    now = time.time()
+    count = 0
+    for name in os.listdir(directory):
+        if name.startswith('.') and name.endswith('.tmp'):
+            temp_path = os.path.join(directory, name)
+            try:
+                if now - os.path.getmtime(temp_path) > max_age_seconds:
+                    os.unlink(temp_path)
+                    count += 1
+            except OSError:
+                pass
+    return count
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""
+Cache Access Index & Janitor
+============================
+Tracks per-entry access times and hit counts, sweeps expired entries in the
+background and keeps the file cache within a disk budget (LRU or LFU eviction)
+"""
+
+import os
+import json
+import time
+import threading
+
+from cache_files import atomic_write
+from cache_metadata import meta_path
+
+# Disk budget for the file cache (0 = unlimited)
+DISK_BUDGET_BYTES = int(float(os.environ.get('CACHE_DISK_BUDGET_MB', '500')) * 1024 * 1024)
+# Evict down to this fraction of the budget, so we don't evict again on the next write
+BUDGET_LOW_WATERMARK = 0.9
+# 'lru' (least recently used) or 'lfu' (least frequently used, ties broken by age)
+EVICTION_POLICY = os.environ.get('CACHE_EVICTION_POLICY', 'lru').lower()
+# How often the janitor runs (seconds, 0 = disabled)
+JANITOR_INTERVAL_SECONDS = int(os.environ.get('CACHE_JANITOR_INTERVAL', '600'))
+
+# No .json suffix: cache_dir.glob('*.json') must only see cache entries
+INDEX_FILENAME = '.access_index'
+
+
+class AccessIndex:
+    """
+    Thread-safe per-key access statistics
+
+    Each record: last_access, hits, ttl_hours (as last read by a route).
+    The file backend persists it next to the cache files.
+    """
+
+    def __init__(self, path=None, track_pending=False):
+        """
+        Args:
+            path: File to persist the index to (None = memory only)
+            track_pending: Also collect hit deltas for take_pending_hits()
+        """
+        self.path = path
+        self.track_pending = track_pending
+        self._records = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._pending_hits = {}  # Hits not yet pushed to a shared store (Redis)
+        if path:
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._records = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"⚠️ Could not read cache index ({e}), starting fresh")
+
+    def save(self):
+        """Persist the index if it changed (file backend only)"""
+        if not self.path or not self._dirty:
+            return
+        with self._lock:
+            snapshot = json.dumps(self._records).encode('utf-8')
+            self._dirty = False
+        atomic_write(self.path, snapshot)
+
+    def record_hit(self, key, ttl_hours=None):
+        """Count a cache hit"""
+        with self._lock:
+            record = self._records.setdefault(key, {'hits': 0})
+            record['hits'] += 1
+            record['last_access'] = time.time()
+            record['ttl_hours'] = ttl_hours
+            if self.track_pending:
+                self._pending_hits[key] = self._pending_hits.get(key, 0) + 1
+            self._dirty = True
+
+    def take_pending_hits(self):
+        """Hits counted since the last call, as {key: count}"""
+        with self._lock:
+            pending, self._pending_hits = self._pending_hits, {}
+            return pending
+
+    def record_ttl(self, key, ttl_hours=None):
+        """Remember which TTL readers use for key (needed to sweep it when expired)"""
+        with self._lock:
+            record = self._records.setdefault(key, {'hits': 0})
+            if record.get('ttl_hours', 'unset') != ttl_hours:
+                record['ttl_hours'] = ttl_hours
+                self._dirty = True
+
+    def record_write(self, key):
+        """A fresh write counts as an access (new entries aren't evicted first)"""
+        with self._lock:
+            record = self._records.setdefault(key, {'hits': 0})
+            record['last_access'] = time.time()
+            self._dirty = True
+
+    def get(self, key):
+        with self._lock:
+            record = self._records.get(key)
+            return dict(record) if record else None
+
+    def forget(self, key):
+        with self._lock:
+            if self._records.pop(key, None) is not None:
+                self._dirty = True
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+            self._dirty = True
+
+    def keys(self):
+        with self._lock:
+            return list(self._records)
+
+
+class CacheJanitor:
+    """
+    Background thread that sweeps expired entries and enforces the disk budget
+
+    With Redis it only pushes this process's hit counts to the shared metadata.
+    """
+
+    def __init__(self, cache_manager, interval_seconds=JANITOR_INTERVAL_SECONDS,
+                 budget_bytes=DISK_BUDGET_BYTES, policy=EVICTION_POLICY):
+        self.cache = cache_manager
+        self.interval_seconds = interval_seconds
+        self.budget_bytes = budget_bytes
+        self.policy = policy if policy in ('lru', 'lfu') else 'lru'
+        self.thread = None
+        self._stop = threading.Event()
+        self.last_run = None
+        self.last_result = None
+
+    def start(self):
+        """Start the janitor thread (no-op if disabled or already running)"""
+        if self.interval_seconds <= 0 or (self.thread and self.thread.is_alive()):
+            return
+        self._stop.clear()
+        self.thread = threading.Thread(target=self._loop, daemon=True, name='cache-janitor')
+        self.thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _loop(self):
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"❌ Cache janitor error: {e}")
+
+    def _file_entries(self):
+        """All cache files as dicts {key, path, size, last_access, hits, validated_at, ttl_hours}"""
+        index = self.cache.access_index
+        # Files written before the index existed have no key - they can only be evicted
+        keys_by_name = {self.cache._get_cache_path(key).name: key for key in index.keys()}
+        entries = []
+        for cache_file in self.cache.cache_dir.glob('*.json'):
+            try:
+                stat = cache_file.stat()
+            except OSError:
+                continue
+            key = keys_by_name.get(cache_file.name)
+            record = index.get(key) if key else None
+            entries.append({
+                'key': key,
+                'path': cache_file,
+                'size': stat.st_size,
+                # Never read or written since the index existed: mtime is the best guess
+                'last_access': (record or {}).get('last_access', stat.st_mtime),
+                'hits': (record or {}).get('hits', 0),
+                'ttl_hours': (record or {}).get('ttl_hours'),
+                # Revalidation only rewrites the sidecar, so it is the newer of the two
+                'validated_at': max(stat.st_mtime, self._sidecar_mtime(cache_file))
+            })
+        return entries
+
+    @staticmethod
+    def _sidecar_mtime(cache_file):
+        try:
+            return meta_path(cache_file).stat().st_mtime
+        except OSError:
+            return 0
+
+    def sweep_expired(self, entries):
+        """Delete entries older than their (hard) TTL. Returns remaining entries."""
+        now = time.time()
+        remaining = []
+        removed = 0
+        for entry in entries:
+            ttl_hours = entry['ttl_hours']
+            if entry['key'] and ttl_hours is not None:
+                max_age_hours = self.cache.get_hard_ttl_hours(entry['key'], ttl_hours) or ttl_hours
+                if now - entry['validated_at'] > max_age_hours * 3600:
+                    self.cache._delete(entry['key'])
+                    removed += 1
+                    continue
+            remaining.append(entry)
+        if removed:
+            print(f"🧹 Janitor removed {removed} expired cache entries")
+        return remaining, removed
+
+    def enforce_budget(self, entries):
+        """Evict LRU/LFU entries until the cache fits the disk budget"""
+        total = sum(entry['size'] for entry in entries)
+        if not self.budget_bytes or total <= self.budget_bytes:
+            return total, 0
+
+        if self.policy == 'lfu':
+            entries.sort(key=lambda entry: (entry['hits'], entry['last_access']))
+        else:
+            entries.sort(key=lambda entry: entry['last_access'])
+
+        target = self.budget_bytes * BUDGET_LOW_WATERMARK
+        evicted = 0
+        for entry in entries:
+            if total <= target:
+                break
+            if entry['key']:
+                self.cache._delete(entry['key'])
+            else:
+                self.cache._unlink_cache_file(entry['path'])
+            total -= entry['size']
+            evicted += 1
+
+        print(f"🧹 Janitor evicted {evicted} cache entries ({self.policy.upper()}), "
+              f"cache now {total / 1024:.0f} KB of {self.budget_bytes / 1024:.0f} KB")
+        return total, evicted
+
+    def run_once(self):
+        """One sweep: expire, enforce budget, persist the access index"""
+        if self.cache.no_cache_mode:
+            return None
+        if self.cache.using_redis:
+            # Redis evicts by its own maxmemory policy - only share our hit counts
+            self.cache.flush_hit_counts()
+            self.last_run = time.time()
+            return None
+
+        entries = self._file_entries()
+        entries, expired = self.sweep_expired(entries)
+        total, evicted = self.enforce_budget(entries)
+        self.cache.access_index.save()
+
+        self.last_run = time.time()
+        self.last_result = {'expired': expired, 'evicted': evicted, 'total_size_kb': round(total / 1024, 1)}
+        return self.last_result
+
+    def get_status(self):
+        return {
+            'running': bool(self.thread and self.thread.is_alive()),
+            'interval_seconds': self.interval_seconds,
+            'disk_budget_mb': round(self.budget_bytes / 1024 / 1024, 1) if self.budget_bytes and not self.cache.using_redis else None,
+            'eviction_policy': None if self.cache.using_redis else self.policy,
+            'last_run': self.last_run,
+            'last_result': self.last_result
+        }
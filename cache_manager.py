@@ -1,462 +1,1557 @@
-# -*- coding: utf-8 -*-
-"""
-Hybrid Cache Manager
-====================
-Automatically uses Redis (on Render) or File-based cache (locally on Windows)
-"""
-import os
-import sys
-import json
-import time
-from datetime import datetime, timedelta
-from pathlib import Path
-
-# Try to import redis (optional)
-try:
-    import redis
-    REDIS_AVAILABLE = True
-except ImportError:
-    REDIS_AVAILABLE = False
-
-
-class CacheManager:
-    """Manages caching for API responses - supports both Redis and File-based"""
-    
-    # Mapping of cache keys to page names (prefix for file names)
-    PAGE_NAME_MAPPING = {
-        # Al Ahly Stats
-        'ahly_stats': 'Al_Ahly_Stats',
-        # Al Ahly PKs
-        'pks_stats': 'Al_Ahly_PKs',
-        # Al Ahly Finals
-        'finals_stats': 'Al_Ahly_Finals',
-        'finals_players': 'Al_Ahly_Finals',
-        'finals_lineup': 'Al_Ahly_Finals',
-        'finals_playerdatabase': 'Al_Ahly_Finals',
-        # Ahly vs Zamalek
-        'ahly_vs_zamalek': 'Ahly_vs_Zamalek',
-        # Egypt Teams
-        'egypt_teams': 'Egypt_Teams',
-        'youth_egypt': 'Egypt_Youth',
-        # National Men Halls
-        'national_men_halls': 'Halls_national_men',
-        # Database Lists
-        'ahly_players_list': 'Al_Ahly_Stats',
-        'egypt_players_list': 'Egypt_Teams',
-        'teams_list': 'db_Teams_List',
-        'stadiums_list': 'db_Stadiums_List',
-        'champions_list': 'db_Champions_List',
-        'managers_list': 'db_Managers_List',
-        'referees_list': 'db_Referees_List',
-    }
-    
-    def __init__(self, cache_dir=None):
-        """
-        Initialize cache manager
-        
-        Automatically detects:
-        - Redis if REDIS_URL environment variable exists
-        - No cache mode for Vercel (if VERCEL=1 and no Redis)
-        - File-based cache otherwise (perfect for Windows)
-        
-        Args:
-            cache_dir: Directory for file-based cache. 
-                      If None, uses AppData/Local/FootballDataManager/cache
-        """
-        # Detect if running on Vercel
-        self.is_vercel = os.environ.get('VERCEL') == '1'
-        
-        # Try Redis first (for production deployments)
-        self.redis_client = None
-        self.using_redis = False
-        self.no_cache_mode = False
-        
-        redis_url = os.environ.get('REDIS_URL') or os.environ.get('KV_URL')
-        if redis_url and REDIS_AVAILABLE:
-            try:
-                self.redis_client = redis.from_url(
-                    redis_url,
-                    decode_responses=True,
-                    socket_connect_timeout=5,
-                    socket_timeout=5
-                )
-                # Test connection
-                self.redis_client.ping()
-                self.using_redis = True
-                try:
-                    print(f"✅ Using Redis cache: {redis_url.split('@')[-1] if '@' in redis_url else 'connected'}")
-                except UnicodeEncodeError:
-                    print(f"Using Redis cache: {redis_url.split('@')[-1] if '@' in redis_url else 'connected'}")
-            except Exception as e:
-                try:
-                    print(f"⚠️ Redis not available ({e})")
-                except UnicodeEncodeError:
-                    print(f"Redis not available ({e})")
-                self.redis_client = None
-        
-        # If on Vercel without Redis, use no-cache mode
-        if self.is_vercel and not self.using_redis:
-            self.no_cache_mode = True
-            try:
-                print(f"⚡ Vercel detected: Running in NO-CACHE mode (direct Google Sheets access)")
-            except UnicodeEncodeError:
-                print(f"Vercel detected: Running in NO-CACHE mode")
-            return
-        
-        # Setup file-based cache (fallback or primary on Windows)
-        if not self.using_redis:
-            if cache_dir is None:
-                # Use Windows AppData\Local for cache storage (standard location)
-                if os.name == 'nt':  # Windows
-                    app_data_dir = os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))
-                    cache_dir = os.path.join(app_data_dir, 'FootballDataManager', 'cache')
-                else:
-                    # Fallback for other OS
-                    if getattr(sys, 'frozen', False):
-                        # Running as compiled executable
-                        app_dir = os.path.dirname(sys.executable)
-                    else:
-                        # Running as script
-                        app_dir = os.path.dirname(os.path.abspath(__file__))
-                    
-                    cache_dir = os.path.join(app_dir, 'cache')
-            
-            self.cache_dir = Path(cache_dir)
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
-            
-            try:
-                print(f"📁 Using file-based cache: {self.cache_dir}")
-            except UnicodeEncodeError:
-                print(f"Using file-based cache: {self.cache_dir}")
-    
-    def _get_cache_path(self, key):
-        """Get file path for a cache key (file-based cache only)"""
-        # Check if we can add a page name prefix
-        page_prefix = None
-        key_pattern_matched = None
-        for key_pattern, page_name in self.PAGE_NAME_MAPPING.items():
-            if key.startswith(key_pattern):
-                page_prefix = page_name
-                key_pattern_matched = key_pattern
-                break
-        
-        # Create filename with page prefix if found
-        if page_prefix and key_pattern_matched:
-            # Remove the matched pattern from the key to avoid duplication
-            # e.g., "ahly_vs_zamalek_matches" becomes "matches"
-            remaining_key = key[len(key_pattern_matched):].lstrip('_')
-            
-            # If there's remaining text, use it as description
-            if remaining_key:
-                # Sanitize the remaining key
-                safe_remaining = "".join(c if c.isalnum() or c in '_-' else '_' for c in remaining_key)
-                filename = f"{page_prefix}_{safe_remaining}.json"
-            else:
-                # No remaining text, just use the page prefix
-                filename = f"{page_prefix}.json"
-        else:
-            # No mapping found, use the original key
-            safe_key = "".join(c if c.isalnum() or c in '_-' else '_' for c in key)
-            filename = f"{safe_key}.json"
-        
-        return self.cache_dir / filename
-    
-    def get(self, key, ttl_hours=None):
-        """
-        Get cached data
-        
-        Args:
-            key: Cache key
-            ttl_hours: Time to live in hours. If None, cache never expires (permanent)
-            
-        Returns:
-            Cached data if valid, None otherwise
-        """
-        # If in no-cache mode, always return None (fetch fresh data)
-        if self.no_cache_mode:
-            return None
-            
-        # Try Redis first
-        if self.using_redis:
-            return self._get_redis(key, ttl_hours)
-        else:
-            return self._get_file(key, ttl_hours)
-    
-    def _get_redis(self, key, ttl_hours=None):
-        """Get from Redis cache"""
-        try:
-            cached_data = self.redis_client.get(key)
-            if not cached_data:
-                print(f"❌ Cache miss (Redis): {key}")
-                return None
-            
-            cache_obj = json.loads(cached_data)
-            
-            # If ttl_hours is None, cache is permanent (no expiration check)
-            if ttl_hours is None:
-                print(f"✅ Cache hit (Redis, permanent): {key}")
-                return cache_obj.get('data')
-            
-            # Check expiration
-            cached_at = cache_obj.get('cached_at', 0)
-            ttl_seconds = ttl_hours * 3600
-            
-            if time.time() - cached_at > ttl_seconds:
-                print(f"⏰ Cache expired (Redis): {key}")
-                self.redis_client.delete(key)
-                return None
-            
-            age_minutes = int((time.time() - cached_at) / 60)
-            print(f"✅ Cache hit (Redis): {key} (age: {age_minutes} minutes)")
-            return cache_obj.get('data')
-            
-        except Exception as e:
-            print(f"❌ Error reading Redis cache for {key}: {e}")
-            return None
-    
-    def _get_file(self, key, ttl_hours=None):
-        """Get from file-based cache"""
-        cache_path = self._get_cache_path(key)
-        
-        if not cache_path.exists():
-            print(f"❌ Cache miss (File): {key}")
-            return None
-        
-        try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
-            # If ttl_hours is None, cache is permanent
-            if ttl_hours is None:
-                print(f"✅ Cache hit (File, permanent): {key}")
-                return cache_data.get('data')
-            
-            # Check expiration
-            cached_at = cache_data.get('cached_at', 0)
-            ttl_seconds = ttl_hours * 3600
-            
-            if time.time() - cached_at > ttl_seconds:
-                print(f"⏰ Cache expired (File): {key}")
-                cache_path.unlink()  # Delete expired cache
-                return None
-            
-            age_minutes = int((time.time() - cached_at) / 60)
-            print(f"✅ Cache hit (File): {key} (age: {age_minutes} minutes)")
-            return cache_data.get('data')
-            
-        except Exception as e:
-            print(f"❌ Error reading file cache for {key}: {e}")
-            # Delete corrupted cache
-            try:
-                cache_path.unlink()
-            except:
-                pass
-            return None
-    
-    def set(self, key, data, metadata=None):
-        """
-        Set cached data
-        
-        Args:
-            key: Cache key
-            data: Data to cache
-            metadata: Optional metadata to store with cache
-        """
-        # If in no-cache mode, don't cache anything
-        if self.no_cache_mode:
-            return
-            
-        # Use both Redis and File cache
-        if self.using_redis:
-            self._set_redis(key, data, metadata)
-        else:
-            self._set_file(key, data, metadata)
-    
-    def _set_redis(self, key, data, metadata=None):
-        """Set to Redis cache"""
-        try:
-            cache_data = {
-                'key': key,
-                'cached_at': time.time(),
-                'cached_at_readable': datetime.now().isoformat(),
-                'data': data,
-                'metadata': metadata or {}
-            }
-            
-            # Store as JSON string in Redis
-            self.redis_client.set(key, json.dumps(cache_data))
-            
-            # Estimate size
-            data_size = len(json.dumps(cache_data)) / 1024  # KB
-            print(f"💾 Cached (Redis): {key} (~{data_size:.1f} KB)")
-            
-        except Exception as e:
-            print(f"❌ Error caching to Redis {key}: {e}")
-    
-    def _set_file(self, key, data, metadata=None):
-        """Set to file-based cache"""
-        cache_path = self._get_cache_path(key)
-        
-        cache_data = {
-            'key': key,
-            'cached_at': time.time(),
-            'cached_at_readable': datetime.now().isoformat(),
-            'data': data,
-            'metadata': metadata or {}
-        }
-        
-        try:
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
-            
-            file_size = os.path.getsize(cache_path) / 1024  # KB
-            print(f"💾 Cached (File): {key} ({file_size:.1f} KB)")
-            
-        except Exception as e:
-            print(f"❌ Error caching to file {key}: {e}")
-    
-    def clear(self, pattern=None):
-        """
-        Clear cache
-        
-        Args:
-            pattern: If provided, only clear cache keys matching this pattern
-        """
-        # If in no-cache mode, nothing to clear
-        if self.no_cache_mode:
-            print("⚡ No-cache mode: Nothing to clear")
-            return
-            
-        if self.using_redis:
-            self._clear_redis(pattern)
-        else:
-            self._clear_file(pattern)
-    
-    def _clear_redis(self, pattern=None):
-        """Clear Redis cache"""
-        try:
-            if pattern is None:
-                # Clear all keys (be careful!)
-                count = 0
-                for key in self.redis_client.scan_iter():
-                    self.redis_client.delete(key)
-                    count += 1
-                print(f"🧹 Cleared all cache (Redis, {count} keys)")
-            else:
-                # Clear matching keys
-                count = 0
-                # Convert pattern to Redis pattern
-                redis_pattern = f"*{pattern}*"
-                for key in self.redis_client.scan_iter(match=redis_pattern):
-                    self.redis_client.delete(key)
-                    count += 1
-                print(f"🧹 Cleared cache matching '{pattern}' (Redis, {count} keys)")
-        except Exception as e:
-            print(f"❌ Error clearing Redis cache: {e}")
-    
-    def _clear_file(self, pattern=None):
-        """Clear file-based cache"""
-        if pattern is None:
-            # Clear all cache
-            count = 0
-            for cache_file in self.cache_dir.glob('*.json'):
-                cache_file.unlink()
-                count += 1
-            print(f"🧹 Cleared all cache (File, {count} files)")
-        else:
-            # Clear matching cache
-            count = 0
-            safe_pattern = "".join(c if c.isalnum() or c in '_-*' else '_' for c in pattern)
-            for cache_file in self.cache_dir.glob(f"{safe_pattern}.json"):
-                cache_file.unlink()
-                count += 1
-            print(f"🧹 Cleared cache matching '{pattern}' (File, {count} files)")
-    
-    def get_cache_info(self):
-        """Get information about cached data"""
-        # If in no-cache mode, return empty info
-        if self.no_cache_mode:
-            return {
-                'cache_type': 'No Cache (Direct Fetch)',
-                'total_items': 0,
-                'note': 'Running on Vercel without Redis - data fetched directly from Google Sheets'
-            }
-            
-        if self.using_redis:
-            return self._get_redis_info()
-        else:
-            return self._get_file_info()
-    
-    def _get_redis_info(self):
-        """Get Redis cache info"""
-        try:
-            keys = list(self.redis_client.scan_iter())
-            total_keys = len(keys)
-            
-            info = {
-                'cache_type': 'Redis',
-                'total_items': total_keys,
-                'items': []
-            }
-            
-            for key in keys[:100]:  # Limit to first 100 keys
-                try:
-                    cached_data = self.redis_client.get(key)
-                    if cached_data:
-                        cache_obj = json.loads(cached_data)
-                        cached_at = cache_obj.get('cached_at', 0)
-                        age_minutes = int((time.time() - cached_at) / 60)
-                        
-                        info['items'].append({
-                            'key': key,
-                            'age_minutes': age_minutes,
-                            'cached_at': cache_obj.get('cached_at_readable', 'Unknown')
-                        })
-                except:
-                    pass
-            
-            return info
-        except Exception as e:
-            return {'cache_type': 'Redis', 'error': str(e)}
-    
-    def _get_file_info(self):
-        """Get file-based cache info"""
-        cache_files = list(self.cache_dir.glob('*.json'))
-        
-        info = {
-            'cache_type': 'File',
-            'cache_dir': str(self.cache_dir),
-            'total_files': len(cache_files),
-            'total_size_kb': sum(f.stat().st_size for f in cache_files) / 1024,
-            'files': []
-        }
-        
-        for cache_file in cache_files:
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-                
-                cached_at = cache_data.get('cached_at', 0)
-                age_minutes = int((time.time() - cached_at) / 60)
-                
-                info['files'].append({
-                    'key': cache_data.get('key', cache_file.stem),
-                    'size_kb': cache_file.stat().st_size / 1024,
-                    'age_minutes': age_minutes,
-                    'cached_at': cache_data.get('cached_at_readable', 'Unknown')
-                })
-            except:
-                pass
-        
-        return info
-
-
-# Global cache manager instance
-_cache_manager = None
-
-def get_cache_manager():
-    """Get or create global cache manager instance"""
-    global _cache_manager
-    if _cache_manager is None:
-        _cache_manager = CacheManager()
-    return _cache_manager
+# -*- coding: utf-8 -*-
+"""
+Hybrid Cache Manager
+====================
+Automatically uses Redis (on Render) or File-based cache (locally on Windows)
+"""
+import os
+import sys
+import re
+import json
+import time
+import uuid
+import hashlib
+import fnmatch
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from memory_cache import MemoryCache
+from cache_codec import get_codec
+from cache_files import KeyLocks, atomic_write, read_decoded, remove_stale_temp_files
+from cache_janitor import AccessIndex, CacheJanitor, INDEX_FILENAME
+from cache_metadata import (META_HASH_KEY, HITS_HASH_KEY, TAG_KEY_PREFIX, build_entry_meta, meta_from_envelope,
+                            describe_entry, write_file_meta, read_file_meta, remove_file_meta,
+                            normalize_tags, invalidation_tags, is_spreadsheet_tag, tags_match)
+
+# Try to import redis (optional)
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Single-flight configuration (one loader per cache key on a miss)
+SINGLE_FLIGHT_WAIT_SECONDS = float(os.environ.get('CACHE_SINGLE_FLIGHT_WAIT', '60'))  # Max wait for another loader
+SINGLE_FLIGHT_LEASE_SECONDS = float(os.environ.get('CACHE_SINGLE_FLIGHT_LEASE', '120'))  # Loader considered dead after this
+SINGLE_FLIGHT_POLL_SECONDS = 0.2  # Redis lock polling interval
+FLIGHT_LOCK_PREFIX = 'flight:'  # Redis lock keys (never read as cache entries)
+VERSION_KEY_PREFIX = 'ver:'  # Redis version stamps (checked by the in-process L1 cache)
+META_KEY_PREFIX = 'meta:'  # Redis metadata hashes (see cache_metadata)
+LEADER_KEY_PREFIX = 'leader:'  # Redis leader leases (see leader_lock)
+JOB_KEY_PREFIX = 'job:'  # Redis sync job snapshots (see sync_jobs)
+INTERNAL_KEY_PREFIXES = (FLIGHT_LOCK_PREFIX, VERSION_KEY_PREFIX, META_KEY_PREFIX, TAG_KEY_PREFIX,
+                         LEADER_KEY_PREFIX, JOB_KEY_PREFIX)
+
+# Stale-while-revalidate: entries with a registered loader are served stale (and refreshed
+# in the background) until ttl_hours * HARD_TTL_FACTOR, only then does a caller block
+HARD_TTL_FACTOR = float(os.environ.get('CACHE_HARD_TTL_FACTOR', '4'))
+
+# Bulk Redis operations (fewer round trips to a remote Redis)
+REDIS_SCAN_COUNT = int(os.environ.get('CACHE_REDIS_SCAN_COUNT', '1000'))  # Keys per SCAN call
+REDIS_BATCH_SIZE = 500  # Keys per UNLINK / MGET command
+
+def make_version(cached_at, serialized):
+    """
+    Version stamp of a cache entry: write time (ms, hex) + content digest
+    
+    Doubles as the HTTP ETag of responses built from the entry, and can be
+    parsed back to cached_at (see version_cached_at) without reading the payload.
+    
+    Args:
+        cached_at: Write time (epoch seconds)
+        serialized: The data as bytes (the cache codec's encoding - see CacheCodec.dumps)
+    """
+    digest = hashlib.blake2b(serialized, digest_size=8).hexdigest()
+    return f"{int(cached_at * 1000):x}-{digest}"
+
+def escape_glob(text):
+    """Escape Redis SCAN MATCH pattern characters"""
+    return re.sub(r'([*?\[\]\\])', r'\\\1', text)
+
+def version_cached_at(version):
+    """Write time (epoch seconds) encoded in a version stamp, or None"""
+    try:
+        return int(version.split('-', 1)[0], 16) / 1000
+    except (AttributeError, ValueError):
+        return None
+
+# Registered background loaders: key -> (loader, hard_ttl_hours). Module level so
+# loaders can be registered at import time without creating the cache manager.
+_registered_loaders = {}
+
+# Spreadsheet revision probe: callable(sheet_id) -> revision or None. Registered by the
+# Sheets client module so reload() can skip loaders whose source spreadsheets are unchanged.
+_revision_probe = None
+
+# Delete the Redis lock only if we still own it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class KeyFlights:
+    """
+    In-process single-flight registry: at most one thread loads a given cache key
+    
+    A flight is owned by the thread that started it until end() is called.
+    Flights older than lease_seconds are taken over, so a loader that never
+    calls end() can't block a key forever.
+    """
+    
+    def __init__(self, lease_seconds=SINGLE_FLIGHT_LEASE_SECONDS):
+        self.lease_seconds = lease_seconds
+        self._flights = {}  # key -> (owner thread id, started_at)
+        self._cond = threading.Condition()
+        self._local = threading.local()
+    
+    def held(self):
+        """Keys the current thread is loading"""
+        if not hasattr(self._local, 'keys'):
+            self._local.keys = set()
+        return self._local.keys
+    
+    def owns(self, key):
+        """True if the current thread is loading key"""
+        return key in self.held()
+    
+    def begin(self, key, timeout=SINGLE_FLIGHT_WAIT_SECONDS):
+        """
+        Become the loader for key, waiting while another thread loads it
+        
+        Args:
+            key: Cache key
+            timeout: Max seconds to wait for the other loader
+        
+        Returns:
+            True if we had to wait for another loader (caller should re-check the cache)
+        """
+        me = threading.get_ident()
+        deadline = time.time() + timeout
+        waited = False
+        
+        with self._cond:
+            while True:
+                flight = self._flights.get(key)
+                now = time.time()
+                if flight is None or flight[0] == me:
+                    break
+                if now - flight[1] > self.lease_seconds or now >= deadline:
+                    break  # Dead or too slow loader - take over
+                waited = True
+                self._cond.wait(min(deadline, flight[1] + self.lease_seconds) - now)
+            
+            self._flights[key] = (me, time.time())
+        
+        self.held().add(key)
+        return waited
+    
+    def try_begin(self, key):
+        """Become the loader for key only if nobody else is loading it (never waits)"""
+        me = threading.get_ident()
+        with self._cond:
+            flight = self._flights.get(key)
+            if flight and flight[0] != me and time.time() - flight[1] <= self.lease_seconds:
+                return False
+            self._flights[key] = (me, time.time())
+        self.held().add(key)
+        return True
+    
+    def end(self, key):
+        """Finish the current thread's flight for key and wake up waiters"""
+        if key not in self.held():
+            return
+        self.held().discard(key)
+        with self._cond:
+            flight = self._flights.get(key)
+            if flight and flight[0] == threading.get_ident():
+                del self._flights[key]
+            self._cond.notify_all()
+    
+    def end_all(self):
+        """Finish every flight owned by the current thread"""
+        for key in list(self.held()):
+            self.end(key)
+    
+    def active(self):
+        """Keys currently being loaded"""
+        with self._cond:
+            return list(self._flights)
+
+
+class CacheManager:
+    """Manages caching for API responses - supports both Redis and File-based"""
+    
+    # Mapping of cache keys to page names (prefix for file names)
+    PAGE_NAME_MAPPING = {
+        # Al Ahly Stats
+        'ahly_stats': 'Al_Ahly_Stats',
+        # Al Ahly PKs
+        'pks_stats': 'Al_Ahly_PKs',
+        # Al Ahly Finals
+        'finals_stats': 'Al_Ahly_Finals',
+        'finals_players': 'Al_Ahly_Finals',
+        'finals_lineup': 'Al_Ahly_Finals',
+        'finals_playerdatabase': 'Al_Ahly_Finals',
+        # Ahly vs Zamalek
+        'ahly_vs_zamalek': 'Ahly_vs_Zamalek',
+        # Egypt Teams
+        'egypt_teams': 'Egypt_Teams',
+        'youth_egypt': 'Egypt_Youth',
+        # National Men Halls
+        'national_men_halls': 'Halls_national_men',
+        # Database Lists
+        'ahly_players_list': 'Al_Ahly_Stats',
+        'egypt_players_list': 'Egypt_Teams',
+        'teams_list': 'db_Teams_List',
+        'stadiums_list': 'db_Stadiums_List',
+        'champions_list': 'db_Champions_List',
+        'managers_list': 'db_Managers_List',
+        'referees_list': 'db_Referees_List',
+    }
+    
+    def __init__(self, cache_dir=None):
+        """
+        Initialize cache manager
+        
+        Automatically detects:
+        - Redis if REDIS_URL environment variable exists
+        - No cache mode for Vercel (if VERCEL=1 and no Redis)
+        - File-based cache otherwise (perfect for Windows)
+        
+        Args:
+            cache_dir: Directory for file-based cache. 
+                      If None, uses AppData/Local/FootballDataManager/cache
+        """
+        # Detect if running on Vercel
+        self.is_vercel = os.environ.get('VERCEL') == '1'
+        
+        # Try Redis first (for production deployments)
+        self.redis_client = None
+        self.redis_binary = None
+        self.using_redis = False
+        self.no_cache_mode = False
+        self.codec = get_codec()
+        
+        # Single-flight state (in-process flights + Redis lock tokens we hold)
+        self.flights = KeyFlights()
+        self._flight_tokens = {}
+        
+        # In-process L1 tier of decoded entries (validated against the backend's version stamps)
+        self.memory = MemoryCache()
+        
+        # Stale-while-revalidate loaders (shared with register_loader()) and running refreshes
+        self._loaders = _registered_loaders
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+        self._refresh_local = threading.local()
+        # Reloads skipped because the source spreadsheets were unchanged, and the ones that ran
+        self.revalidation_stats = {'unchanged': 0, 'changed': 0, 'unknown': 0}
+        # validated_at read from entry metadata: key -> (version, validated_at, read at)
+        self._validated = {}
+        
+        # Per-key hit counts / last access (persisted by the file backend, drives eviction)
+        self.access_index = AccessIndex()
+        self.janitor = None
+        
+        redis_url = os.environ.get('REDIS_URL') or os.environ.get('KV_URL')
+        if redis_url and REDIS_AVAILABLE:
+            try:
+                self.redis_client = redis.from_url(
+                    redis_url,
+                    decode_responses=True,
+                    socket_connect_timeout=5,
+                    socket_timeout=5
+                )
+                # Test connection
+                self.redis_client.ping()
+                self.using_redis = True
+                
+                # Payloads are binary (see cache_codec) - separate client without response decoding
+                self.redis_binary = redis.from_url(
+                    redis_url,
+                    decode_responses=False,
+                    socket_connect_timeout=5,
+                    socket_timeout=5
+                )
+                
+                # Hit counts are summed across workers in the metadata hash by the janitor
+                self.access_index = AccessIndex(track_pending=True)
+                self.janitor = CacheJanitor(self)
+                self.janitor.start()
+                try:
+                    print(f"✅ Using Redis cache: {redis_url.split('@')[-1] if '@' in redis_url else 'connected'}")
+                except UnicodeEncodeError:
+                    print(f"Using Redis cache: {redis_url.split('@')[-1] if '@' in redis_url else 'connected'}")
+            except Exception as e:
+                try:
+                    print(f"⚠️ Redis not available ({e})")
+                except UnicodeEncodeError:
+                    print(f"Redis not available ({e})")
+                self.redis_client = None
+        
+        # If on Vercel without Redis, use no-cache mode
+        if self.is_vercel and not self.using_redis:
+            self.no_cache_mode = True
+            try:
+                print(f"⚡ Vercel detected: Running in NO-CACHE mode (direct Google Sheets access)")
+            except UnicodeEncodeError:
+                print(f"Vercel detected: Running in NO-CACHE mode")
+            return
+        
+        # Setup file-based cache (fallback or primary on Windows)
+        if not self.using_redis:
+            if cache_dir is None:
+                # Use Windows AppData\Local for cache storage (standard location)
+                if os.name == 'nt':  # Windows
+                    app_data_dir = os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))
+                    cache_dir = os.path.join(app_data_dir, 'FootballDataManager', 'cache')
+                else:
+                    # Fallback for other OS
+                    if getattr(sys, 'frozen', False):
+                        # Running as compiled executable
+                        app_dir = os.path.dirname(sys.executable)
+                    else:
+                        # Running as script
+                        app_dir = os.path.dirname(os.path.abspath(__file__))
+                    
+                    cache_dir = os.path.join(app_dir, 'cache')
+            
+            self.cache_dir = Path(cache_dir)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Per-key write locks and cleanup of temp files from interrupted writes
+            self.file_locks = KeyLocks(str(self.cache_dir))
+            remove_stale_temp_files(str(self.cache_dir))
+            
+            # Disk budget: a background janitor sweeps expired entries and evicts LRU/LFU
+            self.access_index = AccessIndex(str(self.cache_dir / INDEX_FILENAME))
+            self.janitor = CacheJanitor(self)
+            self.janitor.start()
+            
+            try:
+                print(f"📁 Using file-based cache: {self.cache_dir}")
+            except UnicodeEncodeError:
+                print(f"Using file-based cache: {self.cache_dir}")
+    
+    def _get_cache_path(self, key):
+        """Get file path for a cache key (file-based cache only)"""
+        # Check if we can add a page name prefix
+        page_prefix = None
+        key_pattern_matched = None
+        for key_pattern, page_name in self.PAGE_NAME_MAPPING.items():
+            if key.startswith(key_pattern):
+                page_prefix = page_name
+                key_pattern_matched = key_pattern
+                break
+        
+        # Create filename with page prefix if found
+        if page_prefix and key_pattern_matched:
+            # Remove the matched pattern from the key to avoid duplication
+            # e.g., "ahly_vs_zamalek_matches" becomes "matches"
+            remaining_key = key[len(key_pattern_matched):].lstrip('_')
+            
+            # If there's remaining text, use it as description
+            if remaining_key:
+                # Sanitize the remaining key
+                safe_remaining = "".join(c if c.isalnum() or c in '_-' else '_' for c in remaining_key)
+                filename = f"{page_prefix}_{safe_remaining}.json"
+            else:
+                # No remaining text, just use the page prefix
+                filename = f"{page_prefix}.json"
+        else:
+            # No mapping found, use the original key
+            safe_key = "".join(c if c.isalnum() or c in '_-' else '_' for c in key)
+            filename = f"{safe_key}.json"
+        
+        return self.cache_dir / filename
+    
+    def get(self, key, ttl_hours=None):
+        """
+        Get cached data
+        
+        On a miss only one caller per key (per process, and per Redis across
+        workers) gets None back and is expected to load the data and call set().
+        Concurrent callers wait for it and get the freshly cached data instead.
+        
+        Args:
+            key: Cache key
+            ttl_hours: Time to live in hours. If None, cache never expires (permanent)
+        
+        Returns:
+            Cached data if valid, None otherwise. The object may be shared with
+            the in-memory tier, so treat it as read-only.
+        """
+        # If in no-cache mode, always return None (fetch fresh data)
+        if self.no_cache_mode:
+            return None
+        
+        # A background refresh re-running the code that fills this key must miss
+        if key in getattr(self._refresh_local, 'keys', ()):
+            print(f"🔄 Reloading in background: {key}")
+            return None
+        
+        data = self._read(key, ttl_hours)
+        if data is not None or self.flights.owns(key):
+            return data
+        
+        # Cache miss - wait for our turn to load (another loader may fill it meanwhile)
+        return self._begin_load(key, ttl_hours)
+    
+    def get_many(self, keys, ttl_hours=None):
+        """
+        Get several cached entries at once
+        
+        Entries not in memory are read with one MGET per batch (Redis) instead
+        of one round trip per key. Misses then go through get(), so they get
+        the same single-flight handling.
+        
+        Args:
+            keys: Cache keys
+            ttl_hours: TTL for every key, or a dictionary {key: ttl_hours}
+        
+        Returns:
+            Dictionary {key: data or None}
+        """
+        keys = list(dict.fromkeys(keys))
+        ttl_for = ttl_hours.get if isinstance(ttl_hours, dict) else (lambda key: ttl_hours)
+        
+        if self.no_cache_mode:
+            return {key: None for key in keys}
+        
+        results = {}
+        refreshing = getattr(self._refresh_local, 'keys', ())
+        entries = self._get_entries([key for key in keys if key not in refreshing])
+        for key in keys:
+            data = None
+            if key in entries:
+                data = self._serve(key, *entries[key], ttl_for(key))
+            if data is None:
+                data = self.get(key, ttl_for(key))
+            results[key] = data
+        return results
+    
+    def _read(self, key, ttl_hours=None):
+        """
+        Read from the active backend
+        
+        Fresh entries (younger than ttl_hours) are returned as-is. Older entries
+        with a registered loader are returned stale and refreshed in the
+        background until the hard TTL; anything older is deleted (a miss).
+        """
+        cache_obj, label = self._get_entry(key)
+        return self._serve(key, cache_obj, label, ttl_hours)
+    
+    def _serve(self, key, cache_obj, label, ttl_hours=None):
+        """Apply TTL rules to an envelope just read (see _read) and return its data or None"""
+        if cache_obj is None:
+            print(f"❌ Cache miss ({label}): {key}")
+            self.access_index.record_ttl(key, ttl_hours)
+            return None
+        
+        # If ttl_hours is None, cache is permanent (no expiration check)
+        if ttl_hours is None:
+            print(f"✅ Cache hit ({label}, permanent): {key}")
+            self.access_index.record_hit(key, ttl_hours)
+            return cache_obj.get('data')
+        
+        # Check expiration
+        cached_at = cache_obj.get('cached_at', 0)
+        age_seconds = time.time() - cached_at
+        if age_seconds > ttl_hours * 3600:
+            # Revalidated entries keep their cached_at - their metadata knows better
+            age_seconds = time.time() - self._validated_at(key, cache_obj.get('version'), cached_at)
+        age_minutes = int(age_seconds / 60)
+        
+        if age_seconds <= ttl_hours * 3600:
+            print(f"✅ Cache hit ({label}): {key} (age: {age_minutes} minutes)")
+            self.access_index.record_hit(key, ttl_hours)
+            return cache_obj.get('data')
+        
+        hard_ttl_hours = self.get_hard_ttl_hours(key, ttl_hours)
+        if hard_ttl_hours is not None and age_seconds <= hard_ttl_hours * 3600:
+            print(f"♻️ Cache stale ({label}): {key} (age: {age_minutes} minutes) - refreshing in background")
+            self.refresh_in_background(key)
+            self.access_index.record_hit(key, ttl_hours)
+            return cache_obj.get('data')
+        
+        print(f"⏰ Cache expired ({label}): {key}")
+        self.access_index.record_ttl(key, ttl_hours)
+        self._delete(key)
+        return None
+    
+    def _begin_load(self, key, ttl_hours=None):
+        """
+        Single-flight miss handling
+        
+        Returns:
+            Data cached by another loader while we waited, or None if the
+            caller is now the loader for this key
+        """
+        # In-process: one loading thread per key
+        if self.flights.begin(key):
+            data = self._read(key, ttl_hours)
+            if data is not None:
+                print(f"🤝 Served by concurrent loader: {key}")
+                self.flights.end(key)
+                return data
+        
+        # Cross-worker: one loading process per key
+        if self.using_redis and self._acquire_redis_flight(key):
+            data = self._read(key, ttl_hours)
+            if data is not None:
+                print(f"🤝 Served by concurrent loader (Redis): {key}")
+                self.end_load(key)
+                return data
+        
+        return None
+    
+    def _acquire_redis_flight(self, key):
+        """
+        Take the Redis lock for loading key, waiting while another worker holds it
+        
+        Returns:
+            True if we had to wait for another worker (caller should re-check the cache)
+        """
+        lock_key = f"{FLIGHT_LOCK_PREFIX}{key}"
+        token = uuid.uuid4().hex
+        lease_ms = int(SINGLE_FLIGHT_LEASE_SECONDS * 1000)
+        deadline = time.time() + SINGLE_FLIGHT_WAIT_SECONDS
+        waited = False
+        
+        try:
+            while not self.redis_client.set(lock_key, token, nx=True, px=lease_ms):
+                if time.time() >= deadline:
+                    print(f"⚠️ Timed out waiting for loader of {key}, loading anyway")
+                    return waited
+                waited = True
+                time.sleep(SINGLE_FLIGHT_POLL_SECONDS)
+            self._flight_tokens[key] = token
+        except Exception as e:
+            print(f"⚠️ Redis flight lock unavailable for {key}: {e}")
+        
+        return waited
+    
+    def _try_redis_flight(self, key):
+        """Take the Redis lock for loading key without waiting (False if another worker holds it)"""
+        token = uuid.uuid4().hex
+        lease_ms = int(SINGLE_FLIGHT_LEASE_SECONDS * 1000)
+        try:
+            if not self.redis_client.set(f"{FLIGHT_LOCK_PREFIX}{key}", token, nx=True, px=lease_ms):
+                return False
+            self._flight_tokens[key] = token
+        except Exception as e:
+            print(f"⚠️ Redis flight lock unavailable for {key}: {e}")
+        return True
+    
+    def end_load(self, key):
+        """Release the single-flight slot for key (called automatically by set())"""
+        token = self._flight_tokens.pop(key, None) if self.flights.owns(key) else None
+        if token and self.using_redis:
+            try:
+                self.redis_client.eval(_RELEASE_LOCK_SCRIPT, 1, f"{FLIGHT_LOCK_PREFIX}{key}", token)
+            except Exception as e:
+                print(f"⚠️ Could not release flight lock for {key}: {e}")
+        self.flights.end(key)
+    
+    def end_all_loads(self):
+        """Release every single-flight slot held by the current thread (e.g. after a failed load)"""
+        for key in list(self.flights.held()):
+            self.end_load(key)
+    
+    def _get_entry(self, key):
+        """
+        Get the cache envelope, from memory if it is still current
+        
+        Returns:
+            Tuple (envelope or None, source label for logging)
+        """
+        label = 'Redis' if self.using_redis else 'File'
+        
+        entry = self.memory.get(key, lambda: self._backend_version(key))
+        if entry is not None:
+            return entry.cache_obj, f"Memory/{label}"
+        
+        if self.using_redis:
+            cache_obj, version, size_bytes = self._get_redis(key)
+        else:
+            cache_obj, version, size_bytes = self._get_file(key)
+        
+        if cache_obj is not None:
+            self.memory.put(key, cache_obj, version, size_bytes)
+        return cache_obj, label
+    
+    def _get_entries(self, keys):
+        """
+        Get several cache envelopes (memory first, then one bulk backend read)
+        
+        Returns:
+            Dictionary {key: (envelope or None, source label)}
+        """
+        label = 'Redis' if self.using_redis else 'File'
+        entries = {}
+        missing = []
+        for key in keys:
+            entry = self.memory.get(key, lambda key=key: self._backend_version(key))
+            if entry is not None:
+                entries[key] = (entry.cache_obj, f"Memory/{label}")
+            else:
+                missing.append(key)
+        
+        if self.using_redis:
+            loaded = self._get_redis_many(missing)
+        else:
+            loaded = {key: self._get_file(key) for key in missing}
+        
+        for key, (cache_obj, version, size_bytes) in loaded.items():
+            if cache_obj is not None:
+                self.memory.put(key, cache_obj, version, size_bytes)
+            entries[key] = (cache_obj, label)
+        return entries
+    
+    def get_validators(self, key, ttl_hours=None):
+        """
+        Get (version, cached_at) of a servable entry without reading its payload
+        
+        Answers from the memory tier, or from the Redis version key. Entries
+        past their TTL (hard TTL when a loader is registered) give None; stale
+        ones trigger a background refresh like get() does.
+        
+        Returns:
+            Tuple (version, cached_at) or None if unknown / not servable
+        """
+        if self.no_cache_mode or key in getattr(self._refresh_local, 'keys', ()):
+            return None
+        
+        entry = self.memory.get(key, lambda: self._backend_version(key))
+        if entry is not None:
+            version = entry.cache_obj.get('version')
+        elif self.using_redis:
+            version = self._backend_version(key)
+        else:
+            return None  # File backend: only known once the entry is in memory
+        
+        cached_at = version_cached_at(version)
+        if cached_at is None:
+            return None
+        
+        if ttl_hours is not None:
+            age_seconds = time.time() - cached_at
+            if age_seconds > ttl_hours * 3600:
+                age_seconds = time.time() - self._validated_at(key, version, cached_at)
+            if age_seconds > ttl_hours * 3600:
+                hard_ttl_hours = self.get_hard_ttl_hours(key, ttl_hours)
+                if hard_ttl_hours is None or age_seconds > hard_ttl_hours * 3600:
+                    return None
+                self.refresh_in_background(key)
+        
+        return version, cached_at
+    
+    def _validated_at(self, key, version, cached_at):
+        """
+        When an entry was last confirmed current (see _revalidate)
+        
+        Read from its metadata, then trusted in this process for the memory
+        tier's verify_seconds. Only asked for entries whose cached_at is past TTL.
+        """
+        now = time.time()
+        known = self._validated.get(key)
+        if known is not None and known[0] == version and now - known[2] <= self.memory.verify_seconds:
+            return known[1]
+        
+        validated_at = cached_at
+        meta = self._read_entry_meta(key)
+        if meta is not None and meta.get('version') == version:
+            validated_at = max(cached_at, meta.get('validated_at') or 0)
+        self._validated[key] = (version, validated_at, now)
+        return validated_at
+    
+    def _read_entry_meta(self, key):
+        """Metadata of an entry (None if missing or unreadable)"""
+        try:
+            if self.using_redis:
+                return self._redis_entry_meta(key, self.redis_client.hget(META_HASH_KEY, key))
+            return self._file_entry_meta(self._get_cache_path(key))
+        except Exception:
+            return None
+    
+    def get_memory_entry(self, key, data):
+        """
+        Get the in-memory entry that `data` (as just returned by get()) came from
+        
+        Used to attach values derived from the data once per version,
+        e.g. the serialized JSON response.
+        
+        Returns:
+            MemoryEntry or None (data not held in memory)
+        """
+        entry = self.memory.peek(key)
+        if entry is not None and entry.cache_obj.get('data') is data:
+            return entry
+        return None
+    
+    def _backend_version(self, key):
+        """Current version stamp of key in the backend (None if missing)"""
+        try:
+            if self.using_redis:
+                return self.redis_client.get(f"{VERSION_KEY_PREFIX}{key}")
+            return self._file_version(self._get_cache_path(key))
+        except Exception:
+            return None
+    
+    def _file_version(self, cache_path):
+        """Version stamp of a cache file (changes whenever the file is rewritten)"""
+        try:
+            stat = cache_path.stat()
+        except OSError:
+            return None
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+    
+    def _get_redis(self, key):
+        """
+        Get the cache envelope from Redis
+        
+        Returns:
+            Tuple (envelope, version, size in bytes) - envelope is None if missing
+        """
+        try:
+            cached_data = self.redis_binary.get(key)
+            if not cached_data:
+                return None, None, 0
+            cache_obj, size_bytes = self.codec.decode_sized(cached_data)
+            # Entries written before version stamps existed are not kept in memory
+            return cache_obj, cache_obj.get('version'), size_bytes
+        
+        except Exception as e:
+            print(f"❌ Error reading Redis cache for {key}: {e}")
+            return None, None, 0
+    
+    def _get_redis_many(self, keys):
+        """
+        Get several cache envelopes from Redis with batched MGETs
+        
+        Returns:
+            Dictionary {key: (envelope, version, size in bytes)} like _get_redis
+        """
+        results = {}
+        for start in range(0, len(keys), REDIS_BATCH_SIZE):
+            batch = keys[start:start + REDIS_BATCH_SIZE]
+            try:
+                payloads = self.redis_binary.mget(batch)
+            except Exception as e:
+                print(f"❌ Error reading Redis cache ({len(batch)} keys): {e}")
+                payloads = [None] * len(batch)
+            
+            for key, cached_data in zip(batch, payloads):
+                results[key] = (None, None, 0)
+                if not cached_data:
+                    continue
+                try:
+                    cache_obj, size_bytes = self.codec.decode_sized(cached_data)
+                    results[key] = (cache_obj, cache_obj.get('version'), size_bytes)
+                except Exception as e:
+                    print(f"❌ Error reading Redis cache for {key}: {e}")
+        return results
+    
+    def _get_file(self, key):
+        """
+        Get the cache envelope from file-based cache
+        
+        Returns:
+            Tuple (envelope, version, size in bytes) - envelope is None if missing
+        """
+        cache_path = self._get_cache_path(key)
+        
+        # Stat before reading: if the file is replaced meanwhile the next version check reloads it
+        version = self._file_version(cache_path)
+        if version is None:
+            return None, None, 0
+        
+        try:
+            # Writes replace the file atomically, so this never sees a half-written entry
+            cache_obj, size_bytes = read_decoded(cache_path, self.codec.decode_sized)
+            return cache_obj, version, size_bytes
+        
+        except FileNotFoundError:
+            return None, None, 0
+        except Exception as e:
+            print(f"❌ Error reading file cache for {key}: {e}")
+            # Delete corrupted cache (unless it was replaced by a good one meanwhile)
+            try:
+                with self.file_locks.hold(cache_path.name):
+                    if self._file_version(cache_path) == version:
+                        cache_path.unlink()
+            except:
+                pass
+            return None, None, 0
+    
+    def _delete(self, key):
+        """Delete one entry from the active backend"""
+        self.memory.pop(key)
+        try:
+            if self.using_redis:
+                pipe = self.redis_client.pipeline()
+                pipe.delete(key, f"{VERSION_KEY_PREFIX}{key}")
+                pipe.hdel(META_HASH_KEY, key)
+                pipe.execute()
+            else:
+                cache_path = self._get_cache_path(key)
+                with self.file_locks.hold(cache_path.name):
+                    remove_file_meta(cache_path)
+                    cache_path.unlink()
+        except Exception:
+            pass
+    
+    def register_loader(self, key, loader, hard_ttl_hours=None):
+        """
+        Register a background refresh loader for a cache key
+        
+        With a loader, an entry past its ttl_hours is still served (stale) while
+        the loader runs in a background thread. Callers only block on a load
+        once the entry is older than the hard TTL.
+        
+        Args:
+            key: Cache key
+            loader: Callable that reloads the data and stores it with set()
+                    (get() for this key returns None inside the loader)
+            hard_ttl_hours: Max age to serve stale data (None = ttl_hours * HARD_TTL_FACTOR)
+        """
+        register_loader(key, loader, hard_ttl_hours)
+    
+    def get_hard_ttl_hours(self, key, ttl_hours):
+        """Hard TTL for a key, or None if it has no loader (expires at ttl_hours)"""
+        if key not in self._loaders:
+            return None
+        hard_ttl_hours = self._loaders[key][1]
+        if hard_ttl_hours is None:
+            hard_ttl_hours = ttl_hours * HARD_TTL_FACTOR
+        return max(hard_ttl_hours, ttl_hours)
+    
+    def refresh_in_background(self, key):
+        """Run the registered loader for key in a background thread (once at a time)"""
+        if key not in self._loaders:
+            return False
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+        
+        thread = threading.Thread(target=self._run_refresh, args=(key,), daemon=True,
+                                  name=f"cache-refresh-{key}")
+        thread.start()
+        return True
+    
+    def _run_refresh(self, key):
+        """Background refresh thread body"""
+        try:
+            start_time = time.time()
+            if self.reload(key):
+                print(f"♻️ Background refresh done: {key} ({time.time() - start_time:.2f}s)")
+        except Exception as e:
+            print(f"❌ Background refresh failed for {key}: {e}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(key)
+    
+    def reload(self, key, loader=None, revalidate=True):
+        """
+        Run the loader for key now, in the calling thread
+        
+        One loader per key in this process and across Redis workers; get() for
+        key misses inside the loader so it re-reads the source.
+        
+        Args:
+            key: Cache key
+            loader: Callable that reloads and set()s the data (default: the registered loader)
+            revalidate: Skip the loader and just extend the entry when none of its
+                        source spreadsheets changed since it was loaded (see _revalidate)
+        
+        Returns:
+            True if loaded (or extended), False if key is already being loaded elsewhere
+        
+        Raises:
+            Whatever the loader raises
+        """
+        loader = loader or self._loaders[key][0]
+        try:
+            # Callers that miss meanwhile wait for this load instead of loading again
+            if not self.flights.try_begin(key):
+                print(f"⏭️ {key} is already being loaded")
+                return False
+            
+            if self.using_redis and not self._try_redis_flight(key):
+                print(f"⏭️ {key} is already being refreshed by another worker")
+                return False
+            
+            self._refresh_local.keys = {key}
+            if self._revalidate(key, extend=revalidate):
+                return True
+            loader()
+            return True
+        finally:
+            self._refresh_local.keys = set()
+            self._refresh_local.revisions = None
+            self.end_load(key)
+    
+    def _probe_revisions(self, tags):
+        """Current revision of every spreadsheet in tags ({sheet_id: revision}, None if any is unknown)"""
+        sheet_ids = sorted({tag.split('/', 1)[0] for tag in tags or ()})
+        if _revision_probe is None or not sheet_ids:
+            return None
+        
+        revisions = {}
+        for sheet_id in sheet_ids:
+            revision = _revision_probe(sheet_id)
+            if revision is None:
+                return None
+            revisions[sheet_id] = revision
+        return revisions
+    
+    def _revalidate(self, key, extend=True):
+        """
+        Before a reload: probe the entry's source spreadsheets, and if none changed
+        since the entry was loaded, extend it instead of reloading
+        
+        Extending only moves validated_at in the entry's metadata: the payload,
+        cached_at and version (the ETag) stay as they are, so clients keep their
+        304s and the memory tier keeps its prepared responses.
+        
+        The revisions probed here are the ones set() records for the reloaded
+        entry - probed before the load, so an edit made during it is never missed.
+        
+        Args:
+            key: Cache key about to be reloaded
+            extend: False = only probe (the loader runs regardless)
+        
+        Returns:
+            True if the entry was extended (the loader can be skipped)
+        """
+        cache_obj, _ = self._get_entry(key)
+        if cache_obj is None:
+            return False
+        
+        revisions = self._probe_revisions(cache_obj.get('tags'))
+        self._refresh_local.revisions = revisions
+        if revisions is None:
+            self.revalidation_stats['unknown'] += 1
+            return False
+        if not extend:
+            return False
+        if cache_obj.get('revisions') != revisions:
+            self.revalidation_stats['changed'] += 1
+            return False
+        
+        self.revalidation_stats['unchanged'] += 1
+        print(f"⏭️ Sources unchanged since last load, extending: {key}")
+        return self._extend(key, cache_obj.get('version'))
+    
+    def _extend(self, key, version):
+        """
+        Mark an entry as validated now (metadata only)
+        
+        Returns:
+            False if the entry was replaced meanwhile or its metadata couldn't be written
+        """
+        validated_at = time.time()
+        try:
+            if self.using_redis:
+                meta = self._redis_entry_meta(key, self.redis_client.hget(META_HASH_KEY, key))
+                if meta is None or meta.get('version') != version:
+                    return False
+                meta['validated_at'] = validated_at
+                self.redis_client.hset(META_HASH_KEY, key, json.dumps(meta))
+            else:
+                cache_path = self._get_cache_path(key)
+                with self.file_locks.hold(cache_path.name):
+                    file_version = self._file_version(cache_path)
+                    meta = read_file_meta(cache_path, file_version)
+                    if meta is None or meta.get('version') != version:
+                        return False
+                    meta['validated_at'] = validated_at
+                    write_file_meta(cache_path, meta, file_version)
+        except Exception as e:
+            print(f"❌ Error extending cache entry {key}: {e}")
+            return False
+        
+        self._validated[key] = (version, validated_at, validated_at)
+        return True
+    
+    def _loaded_revisions(self, key, tags):
+        """Revisions to record on an entry being set (only inside a reload that probed all its sources)"""
+        if key not in getattr(self._refresh_local, 'keys', ()):
+            return None
+        probed = getattr(self._refresh_local, 'revisions', None)
+        sheet_ids = {tag.split('/', 1)[0] for tag in tags}
+        if not probed or not sheet_ids or not sheet_ids.issubset(probed):
+            return None
+        return {sheet_id: probed[sheet_id] for sheet_id in sorted(sheet_ids)}
+    
+    def set(self, key, data, metadata=None, tags=None):
+        """
+        Set cached data
+        
+        Args:
+            key: Cache key
+            data: Data to cache
+            metadata: Optional metadata to store with cache
+            tags: Sources the data was built from, as (sheet_id, worksheet) tuples
+                  (worksheet None = whole spreadsheet) - see invalidate_tags()
+        """
+        # If in no-cache mode, don't cache anything
+        if self.no_cache_mode:
+            return
+        
+        cached_at = time.time()
+        tags = normalize_tags(tags)
+        cache_data = {
+            'key': key,
+            'cached_at': cached_at,
+            'cached_at_readable': datetime.now().isoformat(),
+            'version': make_version(cached_at, self._version_bytes(data)),
+            'data': data,
+            'metadata': metadata or {},
+            'tags': tags
+        }
+        
+        # Source revisions the data was loaded at (lets the next reload be skipped)
+        revisions = self._loaded_revisions(key, tags)
+        if revisions:
+            cache_data['revisions'] = revisions
+        
+        # Use both Redis and File cache
+        try:
+            if self.using_redis:
+                version, size_bytes = self._set_redis(key, cache_data)
+            else:
+                version, size_bytes = self._set_file(key, cache_data)
+            
+            # Keep the decoded entry in memory so the next hits skip the backend
+            self.memory.put(key, cache_data, version, size_bytes)
+            if version is not None:
+                self.access_index.record_write(key)
+        finally:
+            # Waiting callers can read the new entry now
+            self.end_load(key)
+    
+    def _version_bytes(self, data):
+        """data encoded by the fast cache codec, for its version digest (b'' if it can't be)"""
+        try:
+            return self.codec.dumps(data)
+        except Exception:
+            return b''  # The write itself fails and reports it
+    
+    def _set_redis(self, key, cache_data):
+        """
+        Set to Redis cache
+        
+        Returns:
+            Tuple (version, size in bytes) - version is None if the write failed
+        """
+        try:
+            # Store encoded bytes in Redis, with the version stamp next to it
+            encoded, raw_size = self.codec.encode_sized(cache_data)
+            meta = build_entry_meta(cache_data, len(encoded), raw_size, self.codec.describe())
+            pipe = self.redis_binary.pipeline()
+            pipe.set(key, encoded)
+            pipe.set(f"{VERSION_KEY_PREFIX}{key}", cache_data['version'])
+            pipe.hset(META_HASH_KEY, key, json.dumps(meta))
+            for tag in cache_data['tags']:
+                pipe.sadd(f"{TAG_KEY_PREFIX}{tag}", key)
+            pipe.execute()
+            
+            data_size = len(encoded) / 1024  # KB
+            print(f"💾 Cached (Redis): {key} ({data_size:.1f} KB, {self.codec.describe()})")
+            return cache_data['version'], raw_size
+        
+        except Exception as e:
+            print(f"❌ Error caching to Redis {key}: {e}")
+            return None, 0
+    
+    def _set_file(self, key, cache_data):
+        """
+        Set to file-based cache
+        
+        Returns:
+            Tuple (version, size in bytes) - version is None if the write failed
+        """
+        cache_path = self._get_cache_path(key)
+        
+        try:
+            # Files keep the .json name, but hold encoded bytes (see cache_codec)
+            encoded, raw_size = self.codec.encode_sized(cache_data)
+            meta = build_entry_meta(cache_data, len(encoded), raw_size, self.codec.describe())
+            with self.file_locks.hold(cache_path.name):
+                atomic_write(cache_path, encoded)
+                version = self._file_version(cache_path)
+                write_file_meta(cache_path, meta, version)
+            
+            file_size = len(encoded) / 1024  # KB
+            print(f"💾 Cached (File): {key} ({file_size:.1f} KB, {self.codec.describe()})")
+            return version, raw_size
+        
+        except Exception as e:
+            print(f"❌ Error caching to file {key}: {e}")
+            return None, 0
+    
+    def invalidate_tags(self, tags):
+        """
+        Evict every entry built from the given sources (e.g. after a data-entry save)
+        
+        Entries tagged with the whole spreadsheet are evicted for any of its
+        worksheets, and a whole spreadsheet evicts the entries of every one of
+        its worksheets. Other entries stay cached.
+        
+        Args:
+            tags: (sheet_id, worksheet) tuples (worksheet None = whole spreadsheet)
+        
+        Returns:
+            List of evicted cache keys
+        """
+        if self.no_cache_mode:
+            return []
+        
+        changed = normalize_tags(tags)
+        tags = invalidation_tags(changed)
+        try:
+            if self.using_redis:
+                keys = self._invalidate_redis_tags(changed)
+            else:
+                keys = self._invalidate_file_tags(changed)
+        except Exception as e:
+            print(f"❌ Error invalidating cache tags {tags}: {e}")
+            return []
+        
+        for key in keys:
+            self.memory.pop(key)
+        print(f"🧹 Invalidated {len(keys)} cache entries for {', '.join(tags)}: {', '.join(keys) or '-'}")
+        return keys
+    
+    def _invalidate_redis_tags(self, changed):
+        """Unlink the members of the matching tag sets (and the sets themselves)"""
+        tag_keys = {f"{TAG_KEY_PREFIX}{tag}" for tag in invalidation_tags(changed)}
+        # A whole spreadsheet also covers the tag sets of each of its worksheets
+        for tag in changed:
+            if is_spreadsheet_tag(tag):
+                pattern = f"{TAG_KEY_PREFIX}{escape_glob(tag[:-1])}*"
+                tag_keys.update(self.redis_client.scan_iter(match=pattern, count=REDIS_SCAN_COUNT))
+        tag_keys = sorted(tag_keys)
+        keys = sorted(self.redis_client.sunion(tag_keys))
+        for start in range(0, len(keys), REDIS_BATCH_SIZE):
+            batch = keys[start:start + REDIS_BATCH_SIZE]
+            self._unlink_keys(batch + [f"{VERSION_KEY_PREFIX}{key}" for key in batch])
+        self.redis_client.unlink(*tag_keys)
+        return keys
+    
+    def _invalidate_file_tags(self, changed):
+        """Delete the cache files whose sidecar tags match the changed sources (see tags_match)"""
+        keys = []
+        for cache_file in self.cache_dir.glob('*.json'):
+            try:
+                meta = self._file_entry_meta(cache_file)
+            except Exception:
+                continue
+            if meta and tags_match(changed, meta.get('tags', ())):
+                if self._unlink_cache_file(cache_file):
+                    keys.append(meta['key'])
+        return sorted(keys)
+    
+    def clear(self, pattern=None):
+        """
+        Clear cache
+        
+        Args:
+            pattern: If provided, only clear cache keys containing this glob pattern
+                     (e.g. 'finals' or 'egypt*matches'), the same on both backends
+        """
+        # If in no-cache mode, nothing to clear
+        if self.no_cache_mode:
+            print("⚡ No-cache mode: Nothing to clear")
+            return
+        
+        # Memory entries are cheap to rebuild - drop them all
+        self.memory.clear()
+        if pattern is None:
+            self.access_index.clear()
+        
+        if self.using_redis:
+            self._clear_redis(pattern)
+        else:
+            self._clear_file(pattern)
+    
+    def _clear_redis(self, pattern=None):
+        """Clear Redis cache (batched UNLINKs, non-blocking on the server)"""
+        try:
+            # Convert pattern to Redis pattern (None = clear all keys, be careful!)
+            redis_pattern = None if pattern is None else f"*{pattern}*"
+            count = 0
+            batch = []
+            for key in self.redis_client.scan_iter(match=redis_pattern, count=REDIS_SCAN_COUNT):
+                batch.append(key)
+                if len(batch) >= REDIS_BATCH_SIZE:
+                    count += self._unlink_keys(batch)
+                    batch = []
+            if batch:
+                count += self._unlink_keys(batch)
+            
+            if pattern is None:
+                print(f"🧹 Cleared all cache (Redis, {count} keys)")
+            else:
+                print(f"🧹 Cleared cache matching '{pattern}' (Redis, {count} keys)")
+        except Exception as e:
+            print(f"❌ Error clearing Redis cache: {e}")
+    
+    def _unlink_keys(self, keys):
+        """Unlink Redis keys and their metadata in one round trip"""
+        entry_keys = [key for key in keys if not key.startswith(INTERNAL_KEY_PREFIXES)]
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.unlink(*keys)
+        if entry_keys:
+            pipe.hdel(META_HASH_KEY, *entry_keys)
+            pipe.hdel(HITS_HASH_KEY, *entry_keys)
+        return pipe.execute()[0]
+    
+    def _clear_file(self, pattern=None):
+        """Clear file-based cache"""
+        if pattern is None:
+            # Clear all cache
+            count = 0
+            for cache_file in self.cache_dir.glob('*.json'):
+                if self._unlink_cache_file(cache_file):
+                    count += 1
+            print(f"🧹 Cleared all cache (File, {count} files)")
+        else:
+            # Match cache keys (not file names, which PAGE_NAME_MAPPING renames) like Redis does
+            count = 0
+            key_pattern = f"*{pattern}*"
+            for cache_file in self.cache_dir.glob('*.json'):
+                try:
+                    meta = self._file_entry_meta(cache_file)
+                except Exception:
+                    meta = None
+                key = meta['key'] if meta else cache_file.stem
+                if fnmatch.fnmatchcase(key, key_pattern) and self._unlink_cache_file(cache_file):
+                    count += 1
+            print(f"🧹 Cleared cache matching '{pattern}' (File, {count} files)")
+    
+    def _unlink_cache_file(self, cache_file):
+        """Delete one cache file under its write lock (False if it was already gone)"""
+        try:
+            with self.file_locks.hold(cache_file.name):
+                remove_file_meta(cache_file)
+                cache_file.unlink()
+            return True
+        except FileNotFoundError:
+            return False
+    
+    @property
+    def cache_type(self):
+        """'Redis', 'File' or 'No Cache (Direct Fetch)'"""
+        if self.no_cache_mode:
+            return 'No Cache (Direct Fetch)'
+        return 'Redis' if self.using_redis else 'File'
+    
+    def get_cache_info(self):
+        """Get information about cached data (from entry metadata - payloads are not read)"""
+        # If in no-cache mode, return empty info
+        if self.no_cache_mode:
+            return {
+                'cache_type': self.cache_type,
+                'total_items': 0,
+                'note': 'Running on Vercel without Redis - data fetched directly from Google Sheets'
+            }
+        
+        if self.using_redis:
+            info = self._get_redis_info()
+        else:
+            info = self._get_file_info()
+        
+        info['memory'] = self.memory.get_stats()
+        info['revalidation'] = dict(self.revalidation_stats)
+        if self.janitor is not None:
+            info['janitor'] = self.janitor.get_status()
+        return info
+    
+    def get_entry_info(self, key):
+        """
+        Get info about one cached entry without reading its payload
+        
+        Returns:
+            Dictionary (key, size_kb, age_minutes, cached_at, version, codec, hits,
+            last_access) or None if the key isn't cached
+        """
+        if self.no_cache_mode:
+            return None
+        
+        try:
+            if self.using_redis:
+                self.flush_hit_counts()
+                pipe = self.redis_client.pipeline()
+                pipe.hget(META_HASH_KEY, key)
+                pipe.hget(HITS_HASH_KEY, key)
+                raw_meta, hits = pipe.execute()
+                meta = self._redis_entry_meta(key, raw_meta)
+                hits = int(hits or 0)
+            else:
+                meta = self._file_entry_meta(self._get_cache_path(key))
+                hits = None
+        except Exception as e:
+            print(f"❌ Error reading cache metadata for {key}: {e}")
+            return None
+        
+        if meta is None:
+            return None
+        access = self.access_index.get(key) or {}
+        return describe_entry(meta, access.get('hits', 0) if hits is None else hits, access.get('last_access'))
+    
+    def flush_hit_counts(self):
+        """Add this process's hit counts to the shared Redis hash"""
+        if not self.using_redis:
+            return
+        pending = self.access_index.take_pending_hits()
+        if not pending:
+            return
+        try:
+            pipe = self.redis_client.pipeline()
+            for key, count in pending.items():
+                pipe.hincrby(HITS_HASH_KEY, key, count)
+            pipe.execute()
+        except Exception as e:
+            print(f"⚠️ Could not save cache hit counts: {e}")
+    
+    def _redis_entry_meta(self, key, raw_meta):
+        """
+        Metadata of a Redis entry
+        
+        Entries written before the metadata hash existed are decoded once and
+        their metadata is backfilled.
+        """
+        if raw_meta:
+            return json.loads(raw_meta)
+        return self._backfill_redis_meta(key, self.redis_binary.get(key))
+    
+    def _backfill_redis_meta(self, key, cached_data):
+        """Build and store metadata from an entry's payload (None if the key is gone)"""
+        if not cached_data:
+            return None
+        meta = meta_from_envelope(self.codec.decode(cached_data), len(cached_data))
+        meta['key'] = key
+        self.redis_client.hset(META_HASH_KEY, key, json.dumps(meta))
+        return meta
+    
+    def _file_entry_meta(self, cache_path):
+        """
+        Metadata of a cache file from its sidecar
+        
+        Files without a current sidecar (older entries) are decoded once and
+        the sidecar is backfilled.
+        """
+        version = self._file_version(cache_path)
+        if version is None:
+            return None
+        
+        meta = read_file_meta(cache_path, version)
+        if meta is not None:
+            return meta
+        
+        cache_obj = read_decoded(cache_path, self.codec.decode)
+        meta = meta_from_envelope(cache_obj, int(version.rsplit('-', 1)[1]))
+        if meta['key'] is None:
+            meta['key'] = cache_path.stem
+        with self.file_locks.hold(cache_path.name):
+            if self._file_version(cache_path) == version:
+                write_file_meta(cache_path, meta, version)
+        return meta
+    
+    def _get_redis_info(self):
+        """Get Redis cache info"""
+        try:
+            self.flush_hit_counts()
+            keys = [k for k in self.redis_client.scan_iter(count=REDIS_SCAN_COUNT)
+                    if not k.startswith(INTERNAL_KEY_PREFIXES)]
+            total_keys = len(keys)
+            
+            pipe = self.redis_client.pipeline()
+            pipe.hgetall(META_HASH_KEY)
+            pipe.hgetall(HITS_HASH_KEY)
+            metas, hits = pipe.execute()
+            
+            info = {
+                'cache_type': 'Redis',
+                'total_items': total_keys,
+                'items': []
+            }
+            
+            # Entries without metadata (written by older versions): one MGET per batch
+            legacy = [key for key in keys if key not in metas]
+            for start in range(0, len(legacy), REDIS_BATCH_SIZE):
+                batch = legacy[start:start + REDIS_BATCH_SIZE]
+                for key, cached_data in zip(batch, self.redis_binary.mget(batch)):
+                    try:
+                        meta = self._backfill_redis_meta(key, cached_data)
+                        if meta:
+                            metas[key] = json.dumps(meta)
+                    except:
+                        pass
+            
+            for key in keys:
+                try:
+                    meta = json.loads(metas[key]) if key in metas else None
+                    if meta:
+                        access = self.access_index.get(key) or {}
+                        info['items'].append(describe_entry(
+                            meta, int(hits.get(key, 0)), access.get('last_access')  # last_access: this process only
+                        ))
+                except:
+                    pass
+            
+            return info
+        except Exception as e:
+            return {'cache_type': 'Redis', 'error': str(e)}
+    
+    def _get_file_info(self):
+        """Get file-based cache info"""
+        cache_files = list(self.cache_dir.glob('*.json'))
+        
+        info = {
+            'cache_type': 'File',
+            'cache_dir': str(self.cache_dir),
+            'total_files': len(cache_files),
+            'total_size_kb': 0,
+            'files': []
+        }
+        
+        for cache_file in cache_files:
+            try:
+                meta = self._file_entry_meta(cache_file)
+                if meta is None:
+                    continue
+                
+                access = self.access_index.get(meta['key']) or {}
+                info['files'].append(describe_entry(meta, access.get('hits', 0), access.get('last_access')))
+                info['total_size_kb'] += meta['size_bytes'] / 1024
+            except:
+                pass
+        
+        return info
+
+
+# Global cache manager instance
+_cache_manager = None
+_cache_manager_lock = threading.Lock()
+
+def get_cache_manager():
+    """Get or create global cache manager instance"""
+    global _cache_manager
+    if _cache_manager is None:
+        # One instance per process, so every thread shares the same single-flight state
+        with _cache_manager_lock:
+            if _cache_manager is None:
+                _cache_manager = CacheManager()
+    return _cache_manager
+
+def register_loader(key, loader, hard_ttl_hours=None):
+    """Register a stale-while-revalidate loader for a cache key (see CacheManager.register_loader)"""
+    _registered_loaders[key] = (loader, hard_ttl_hours)
+
+def register_revision_probe(probe):
+    """Register the spreadsheet revision probe reload() uses (see CacheManager._revalidate)"""
+    global _revision_probe
+    _revision_probe = probe
+
+def end_all_loads():
+    """Release single-flight slots held by the current thread (no-op before the cache is created)"""
+    if _cache_manager is not None:
+        _cache_manager.end_all_loads()
+
+
+if __name__ == '__main__':
+    # Contention test: many concurrent misses on one key hit a fake Sheets backend once
+    import tempfile
+    
+    class FakeSheetsBackend:
+        """Stands in for Google Sheets: slow reads, counts how often it is called"""
+        
+        def __init__(self, delay_seconds=0.5, fail_first=False):
+            self.delay_seconds = delay_seconds
+            self.fail_first = fail_first
+            self.calls = 0
+            self._lock = threading.Lock()
+        
+        def get_all_records(self):
+            with self._lock:
+                self.calls += 1
+                call_number = self.calls
+            time.sleep(self.delay_seconds)
+            if self.fail_first and call_number == 1:
+                raise RuntimeError("429 Quota exceeded")
+            return [{'MATCH_ID': i, 'RESULT': 'W'} for i in range(100)]
+    
+    def run_contention(cache, backend, key, threads=20):
+        """Simulate a route: cache.get, on miss load from the backend and cache.set"""
+        results = []
+        
+        def request_handler():
+            try:
+                data = cache.get(key, ttl_hours=6)
+                if data is None:
+                    data = {'matches': backend.get_all_records()}
+                    cache.set(key, data)
+                results.append(len(data['matches']))
+            except Exception:
+                results.append(None)
+            finally:
+                cache.end_all_loads()  # What Flask's teardown_request does
+        
+        workers = [threading.Thread(target=request_handler) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return results
+    
+    print("Testing single-flight cache loading...")
+    print("-" * 60)
+    
+    cache = CacheManager(cache_dir=tempfile.mkdtemp(prefix='cache_test_'))
+    
+    # 1. Cold cache: one loader, everyone else waits for its result
+    backend = FakeSheetsBackend()
+    results = run_contention(cache, backend, 'egypt_teams_matches')
+    assert backend.calls == 1, f"expected 1 backend call, got {backend.calls}"
+    assert results == [100] * 20, results
+    print(f"\n✅ Cold key: 20 requests, {backend.calls} backend call")
+    
+    # 2. Failing loader: the next waiter takes over instead of hanging
+    cache.clear()
+    backend = FakeSheetsBackend(fail_first=True)
+    results = run_contention(cache, backend, 'egypt_teams_matches')
+    assert backend.calls == 2, f"expected 2 backend calls, got {backend.calls}"
+    assert results.count(None) == 1 and results.count(100) == 19, results
+    print(f"\n✅ Failed loader: 20 requests, {backend.calls} backend calls, 1 error")
+    
+    # 3. Warm cache: no backend calls, no flights left behind
+    backend = FakeSheetsBackend()
+    results = run_contention(cache, backend, 'egypt_teams_matches')
+    assert backend.calls == 0 and not cache.flights.active()
+    print(f"\n✅ Warm key: 20 requests, {backend.calls} backend calls")
+    
+    # 4. Tag invalidation: a worksheet evicts its own and whole-spreadsheet entries,
+    #    a whole spreadsheet evicts every entry built from any of its worksheets
+    def tag_entries():
+        cache.clear()
+        cache.set('a', 1, tags=[('S', 'MATCHDETAILS')])
+        cache.set('b', 2, tags=[('S', None)])
+        cache.set('c', 3, tags=[('T', 'MATCHDETAILS')])
+        cache.set('d', 4, tags=[('S', 'PLAYERDETAILS')])
+    
+    tag_entries()
+    evicted = cache.invalidate_tags([('S', 'MATCHDETAILS')])
+    assert evicted == ['a', 'b'], evicted
+    tag_entries()
+    evicted = cache.invalidate_tags([('S', None)])
+    assert evicted == ['a', 'b', 'd'], evicted
+    assert cache.get('c') == 3
+    print(f"\n✅ Tag invalidation: worksheet -> ['a', 'b'], spreadsheet -> {evicted}")
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Cache Entry Metadata
+====================
+Small per-entry records (cached_at, version, codec, sizes) written next to each
+cache entry on set(), so status and info calls never load or decode payloads.
+They also hold validated_at: when the entry was last confirmed current (written,
+or revalidated against unchanged sources without rewriting the payload).
+
+Redis: one hash field per cache key. File: a `.{file name}.meta` sidecar per entry.
+"""
+
+import json
+import time
+
+from cache_files import atomic_write
+
+META_HASH_KEY = 'meta:entries'  # Redis hash: cache key -> JSON metadata
+HITS_HASH_KEY = 'meta:hits'  # Redis hash: cache key -> hit count (all workers)
+TAG_KEY_PREFIX = 'tag:'  # Redis sets: tag -> cache keys built from that source
+
+
+def sheet_tag(sheet_id, worksheet=None):
+    """Dependency tag for a worksheet (None = the whole spreadsheet)"""
+    return f"{sheet_id}/{worksheet or '*'}"
+
+
+def normalize_tags(tags):
+    """Tags as strings: accepts sheet_tag() strings or (sheet_id, worksheet) tuples"""
+    return sorted({sheet_tag(*tag) if isinstance(tag, (tuple, list)) else tag for tag in tags or ()})
+
+
+def invalidation_tags(tags):
+    """Tags to evict for changed sources: the worksheets plus their whole-spreadsheet tags"""
+    tags = normalize_tags(tags)
+    return sorted(set(tags) | {sheet_tag(tag.split('/', 1)[0]) for tag in tags})
+
+
+def is_spreadsheet_tag(tag):
+    """True for a whole-spreadsheet tag (sheet_tag(sheet_id) = 'sheet_id/*')"""
+    return tag.endswith('/*')
+
+
+def tags_match(changed, entry_tags):
+    """
+    True if an entry tagged entry_tags was built from one of the changed sources
+
+    A changed worksheet matches entries tagged with it or with its whole spreadsheet;
+    a changed spreadsheet matches entries tagged with it or with any of its worksheets.
+    """
+    for tag in normalize_tags(changed):
+        sheet_id, worksheet = tag.split('/', 1)
+        for entry_tag in entry_tags:
+            entry_sheet_id, entry_worksheet = entry_tag.split('/', 1)
+            if entry_sheet_id == sheet_id and (worksheet == '*' or entry_worksheet in (worksheet, '*')):
+                return True
+    return False
+
+
+def build_entry_meta(cache_data, size_bytes, raw_size, codec_name):
+    """
+    Metadata record for an envelope being written
+
+    Args:
+        cache_data: The envelope built by CacheManager.set()
+        size_bytes: Encoded (stored) size
+        raw_size: Uncompressed size
+        codec_name: e.g. 'orjson+zstd'
+    """
+    return {
+        'key': cache_data['key'],
+        'cached_at': cache_data['cached_at'],
+        'cached_at_readable': cache_data['cached_at_readable'],
+        'version': cache_data['version'],
+        'validated_at': cache_data['cached_at'],
+        'codec': codec_name,
+        'size_bytes': size_bytes,
+        'raw_size': raw_size,
+        'tags': cache_data.get('tags', []),
+        'revisions': cache_data.get('revisions')
+    }
+
+
+def meta_from_envelope(cache_obj, size_bytes):
+    """Metadata for an entry written before metadata existed (payload already decoded)"""
+    return {
+        'key': cache_obj.get('key'),
+        'cached_at': cache_obj.get('cached_at', 0),
+        'cached_at_readable': cache_obj.get('cached_at_readable', 'Unknown'),
+        'version': cache_obj.get('version'),
+        'validated_at': cache_obj.get('cached_at', 0),
+        'codec': None,
+        'size_bytes': size_bytes,
+        'raw_size': None,
+        'tags': cache_obj.get('tags', []),
+        'revisions': cache_obj.get('revisions')
+    }
+
+
+def describe_entry(meta, hits=0, last_access=None):
+    """Info record for status endpoints (age computed now, since the entry was last validated)"""
+    validated_at = meta.get('validated_at') or meta.get('cached_at') or 0
+    return {
+        'key': meta.get('key'),
+        'size_kb': (meta.get('size_bytes') or 0) / 1024,
+        'age_minutes': int((time.time() - validated_at) / 60),
+        'cached_at': meta.get('cached_at_readable', 'Unknown'),
+        'version': meta.get('version'),
+        'codec': meta.get('codec'),
+        'tags': meta.get('tags', []),
+        'revisions': meta.get('revisions'),
+        'hits': hits,
+        'last_access': last_access
+    }
+
+
+def meta_path(cache_path):
+    """Sidecar path for a cache file (dot-prefixed: not matched by *.json globs)"""
+    return cache_path.parent / f".{cache_path.name}.meta"
+
+
+def write_file_meta(cache_path, meta, file_version):
+    """Write the sidecar, tagged with the version of the cache file it describes"""
+    record = dict(meta, file_version=file_version)
+    atomic_write(meta_path(cache_path), json.dumps(record).encode('utf-8'))
+
+
+def read_file_meta(cache_path, file_version):
+    """
+    Read a cache file's sidecar
+
+    Returns:
+        Metadata dict, or None if missing or written for another version of the file
+        (e.g. the process died between writing the entry and its sidecar)
+    """
+    try:
+        with open(meta_path(cache_path), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if file_version is None or meta.get('file_version') != file_version:
+        return None
+    return meta
+
+
+def remove_file_meta(cache_path):
+    try:
+        meta_path(cache_path).unlink()
+    except OSError:
+        pass
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+Pre-Serialized Cached Responses
+===============================
+Serializes a cached payload to JSON once per cache version (plus gzip / brotli
+variants) and serves later hits as raw bytes, honoring Accept-Encoding.
+Responses carry ETag / Last-Modified from the cache entry, so repeat requests
+can be answered with 304 Not Modified.
+"""
+
+import gzip
+
+from flask import current_app, request
+
+# Try to import brotli (optional)
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Bodies smaller than this aren't worth compressing
+MIN_COMPRESS_BYTES = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def serialize_json(payload):
+    """Serialize a payload exactly like Flask's jsonify (same separators/indent and trailing newline)"""
+    provider = current_app.json
+    if (provider.compact is None and current_app.debug) or provider.compact is False:
+        body = provider.dumps(payload, indent=2)
+    else:
+        body = provider.dumps(payload, separators=(',', ':'))
+    return f"{body}\n".encode('utf-8')
+
+
+def build_variants(payload):
+    """
+    Build the response body in every supported encoding
+
+    Returns:
+        Dictionary {encoding: body bytes} ('identity' always present)
+    """
+    body = serialize_json(payload)
+    variants = {'identity': body}
+    if len(body) >= MIN_COMPRESS_BYTES:
+        variants['gzip'] = gzip.compress(body, compresslevel=GZIP_LEVEL)
+        if BROTLI_AVAILABLE:
+            variants['br'] = brotli.compress(body, quality=BROTLI_QUALITY)
+    return variants
+
+
+def choose_encoding(variants):
+    """Pick the smallest variant the client accepts"""
+    accepted = request.accept_encodings
+    best = 'identity'
+    for encoding in ('br', 'gzip'):
+        if encoding in variants and accepted[encoding] > 0 and len(variants[encoding]) < len(variants[best]):
+            best = encoding
+    return best
+
+
+def cached_json_response(key, data, payload=None, variant='default'):
+    """
+    JSON response for cached data, serialized and compressed once per cache version
+
+    Args:
+        key: Cache key the data was read from
+        data: Data as returned by cache.get(key, ...)
+        payload: Response body to send (default: data itself); built from data by the route
+        variant: Name for this payload shape (a route wrapping data as {'players': data}
+                 needs a different name than one returning data as-is)
+
+    Returns:
+        Flask Response with the JSON body (and Content-Encoding if compressed)
+    """
+    from cache_manager import get_cache_manager
+    cache = get_cache_manager()
+
+    if payload is None:
+        payload = data
+
+    extra_name = f"response:{variant}"
+    entry = cache.get_memory_entry(key, data)
+    cached_variants = entry.extras.get(extra_name) if entry is not None else None
+
+    if cached_variants is not None:
+        variants = cached_variants[0]
+    else:
+        variants = build_variants(payload)
+        if entry is not None:
+            cache.memory.set_extra(key, entry, extra_name, variants, sum(len(body) for body in variants.values()))
+
+    encoding = choose_encoding(variants)
+    body = variants[encoding]
+
+    response = current_app.response_class(body, mimetype=current_app.json.mimetype)
+    response.headers['Content-Length'] = str(len(body))
+    response.headers['Vary'] = 'Accept-Encoding'
+    if encoding != 'identity':
+        response.headers['Content-Encoding'] = encoding
+    if entry is not None:
+        set_validators(response, entry.cache_obj.get('version'), entry.cache_obj.get('cached_at'))
+    return response
+
+
+def set_validators(response, version, cached_at):
+    """Add ETag / Last-Modified for a cache entry (browsers revalidate on every use)"""
+    if not version or not cached_at:
+        return response
+    # Weak: gzip/br/identity bodies of the same entry share the tag
+    response.set_etag(version, weak=True)
+    response.last_modified = cached_at
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def is_not_modified(version, cached_at):
+    """Check the request's If-None-Match (preferred) or If-Modified-Since against an entry"""
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(version)
+    if request.if_modified_since:
+        # HTTP dates have second precision
+        return int(cached_at) <= request.if_modified_since.timestamp()
+    return False
+
+
+def not_modified_response(key, ttl_hours=None):
+    """
+    304 response for a conditional GET whose cached entry hasn't changed
+
+    Uses only the entry's version stamp, so the payload is neither read nor
+    serialized.
+
+    Returns:
+        Flask Response (304) or None if the route has to run
+    """
+    if not request.if_none_match and not request.if_modified_since:
+        return None
+
+    from cache_manager import get_cache_manager
+    validators = get_cache_manager().get_validators(key, ttl_hours)
+    if validators is None or not is_not_modified(*validators):
+        return None
+
+    response = current_app.response_class(status=304)
+    response.headers['Vary'] = 'Accept-Encoding'
+    return set_validators(response, *validators)
+
+
+def add_validators_for_key(response, key):
+    """Add validators to a freshly built response for `key` (e.g. after a cache miss filled it)"""
+    if response.status_code != 200 or response.headers.get('ETag'):
+        return response
+
+    from cache_manager import get_cache_manager
+    entry = get_cache_manager().memory.peek(key)
+    if entry is not None:
+        set_validators(response, entry.cache_obj.get('version'), entry.cache_obj.get('cached_at'))
+    return response
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+Dataset Registry
+================
+One declaration per cached dataset: its cache key, the loader that rebuilds it,
+how long it stays fresh and how urgently it should be warmed. The cache uses it
+for stale-while-revalidate refreshes, the scheduler to warm and refresh datasets.
+"""
+
+import threading
+
+# Lower runs first when warming / when several refreshes are due together
+PRIORITY_HIGH = 10
+PRIORITY_NORMAL = 50
+PRIORITY_LOW = 90
+
+
+class Dataset:
+    """A cached dataset and how to rebuild it"""
+
+    def __init__(self, key, loader, ttl_hours=None, interval_hours=None, priority=PRIORITY_NORMAL,
+                 jitter_minutes=None):
+        """
+        Args:
+            key: Cache key the loader fills
+            loader: Callable that rebuilds the data and stores it with cache.set()
+            ttl_hours: TTL readers use (None = permanent entry)
+            interval_hours: Scheduled refresh interval (None = ttl_hours; permanent
+                            entries are only warmed when missing)
+            priority: PRIORITY_HIGH / NORMAL / LOW (or any int, lower first)
+            jitter_minutes: Random delay added to each scheduled refresh so datasets
+                            sharing an interval don't all hit Sheets at once
+                            (None = scheduler default)
+        """
+        self.key = key
+        self.loader = loader
+        self.ttl_hours = ttl_hours
+        self.interval_hours = interval_hours if interval_hours is not None else ttl_hours
+        self.priority = priority
+        self.jitter_minutes = jitter_minutes
+
+    def __repr__(self):
+        return f"Dataset({self.key!r}, every={self.interval_hours}h, priority={self.priority})"
+
+
+_datasets = {}
+_datasets_lock = threading.Lock()
+_listeners = []
+
+def register_dataset(key, loader, ttl_hours=None, interval_hours=None, priority=PRIORITY_NORMAL,
+                     jitter_minutes=None):
+    """
+    Register a dataset (replaces an earlier registration of the same key)
+
+    Non-permanent datasets also get their loader registered with the cache, so
+    stale entries are served while the loader runs in the background.
+
+    Returns:
+        The Dataset
+    """
+    from cache_manager import register_loader
+
+    dataset = Dataset(key, loader, ttl_hours, interval_hours, priority, jitter_minutes)
+    with _datasets_lock:
+        _datasets[key] = dataset
+        listeners = list(_listeners)
+    if ttl_hours is not None:
+        register_loader(key, loader)
+    for listener in listeners:
+        try:
+            listener(dataset)
+        except Exception as e:
+            print(f"⚠️ Dataset listener failed for {key}: {e}")
+    return dataset
+
+def add_dataset_listener(listener):
+    """Call listener(dataset) on every later registration (e.g. to schedule it)"""
+    with _datasets_lock:
+        if listener not in _listeners:
+            _listeners.append(listener)
+
+def remove_dataset_listener(listener):
+    """Stop notifying a listener added with add_dataset_listener()"""
+    with _datasets_lock:
+        if listener in _listeners:
+            _listeners.remove(listener)
+
+def get_dataset(key):
+    """Get a registered dataset (None if unknown)"""
+    return _datasets.get(key)
+
+def get_datasets():
+    """All registered datasets, highest priority first"""
+    with _datasets_lock:
+        return sorted(_datasets.values(), key=lambda dataset: (dataset.priority, dataset.key))
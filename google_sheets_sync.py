@@ -1,376 +1,579 @@
-# -*- coding: utf-8 -*-
-"""
-Google Sheets Auto-Sync Service for Al Ahly Stats
-==================================================
-Automatically syncs data from Google Sheets to local cache
-"""
-
-import os
-import sys
-import time
-import json
-import gspread
-from google.oauth2.service_account import Credentials
-from datetime import datetime
-from cache_manager import get_cache_manager
-
-# Helper function to get resource path (works with PyInstaller)
-def get_resource_path(relative_path):
-    """Get absolute path to resource, works for dev and for PyInstaller"""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
-
-# Fix Unicode printing on Windows
-def safe_print(msg):
-    """Safe print that handles Unicode errors on Windows"""
-    try:
-        print(msg)
-    except (UnicodeEncodeError, UnicodeDecodeError):
-        # Remove emojis and print ASCII only
-        cleaned = msg.encode('ascii', 'ignore').decode('ascii')
-        print(cleaned)
-
-# Google Sheets Configuration
-AHLY_STATS_SHEET_ID = os.environ.get('AHLY_MATCH_SHEET_ID', '1zeSlEN7VS2S6KPZH7_uvQeeY3Iu5INUyi12V0_Wi9G4')
-CREDENTIALS_FILE = get_resource_path('credentials/ahlymatch.json')
-
-# Cache configuration
-CACHE_KEY_PREFIX = 'ahly_stats_'
-CACHE_TTL_HOURS = 6  # Cache validity: 6 hours
-
-class GoogleSheetsSync:
-    """Handles automatic synchronization with Google Sheets"""
-    
-    def __init__(self, credentials_file=CREDENTIALS_FILE, sheet_id=AHLY_STATS_SHEET_ID):
-        """
-        Initialize Google Sheets sync service
-        
-        Args:
-            credentials_file: Path to service account JSON credentials
-            sheet_id: Google Sheets ID to sync from
-        """
-        self.sheet_id = sheet_id
-        self.credentials_file = credentials_file
-        self.client = None
-        self.cache_manager = get_cache_manager()
-        self.last_sync_time = None
-        
-        safe_print(f"[INIT] Initializing Google Sheets Sync Service")
-        safe_print(f"   Sheet ID: {sheet_id}")
-        safe_print(f"   Credentials: {credentials_file}")
-    
-    def authenticate(self):
-        """Authenticate with Google Sheets API"""
-        try:
-            # Define the required scopes
-            scopes = [
-                'https://www.googleapis.com/auth/spreadsheets.readonly',
-                'https://www.googleapis.com/auth/drive.readonly'
-            ]
-            
-            # Try to get credentials from environment variable first (for Render/Production)
-            # Try the specific AHLY_MATCH credentials first, then fallback to generic
-            credentials_json = os.environ.get('GOOGLE_CREDENTIALS_JSON_AHLY_MATCH') or os.environ.get('GOOGLE_CREDENTIALS_JSON')
-            
-            if credentials_json:
-                # Load credentials from environment variable
-                safe_print("[INFO] Using credentials from environment variable")
-                credentials_info = json.loads(credentials_json)
-                credentials = Credentials.from_service_account_info(
-                    credentials_info,
-                    scopes=scopes
-                )
-            else:
-                # Fallback to file (for local development)
-                if not os.path.exists(self.credentials_file):
-                    raise FileNotFoundError(
-                        f"Credentials file not found: {self.credentials_file}\n"
-                        "Please set GOOGLE_CREDENTIALS_JSON environment variable or provide credentials file."
-                    )
-                
-                safe_print(f"[INFO] Using credentials from file: {self.credentials_file}")
-                credentials = Credentials.from_service_account_file(
-                    self.credentials_file,
-                    scopes=scopes
-                )
-            
-            # Create gspread client
-            self.client = gspread.authorize(credentials)
-            
-            safe_print("[OK] Successfully authenticated with Google Sheets")
-            return True
-            
-        except Exception as e:
-            safe_print(f"[ERROR] Failed to authenticate: {e}")
-            return False
-    
-    def fetch_sheet_data(self, sheet_name):
-        """
-        Fetch data from a specific sheet/tab
-        
-        Args:
-            sheet_name: Name of the sheet/tab to fetch
-            
-        Returns:
-            List of dictionaries representing rows
-        """
-        try:
-            if not self.client:
-                if not self.authenticate():
-                    return None
-            
-            # Open the spreadsheet
-            spreadsheet = self.client.open_by_key(self.sheet_id)
-            
-            # Get the specific worksheet
-            worksheet = spreadsheet.worksheet(sheet_name)
-            
-            # Get all records as list of dictionaries
-            records = worksheet.get_all_records()
-            
-            safe_print(f"[OK] Fetched {len(records)} records from sheet: {sheet_name}")
-            return records
-            
-        except gspread.exceptions.WorksheetNotFound:
-            safe_print(f"[WARN] Sheet not found: {sheet_name}")
-            return None
-        except Exception as e:
-            safe_print(f"[ERROR] Error fetching sheet data from {sheet_name}: {e}")
-            return None
-    
-    def fetch_all_sheets(self):
-        """
-        Fetch data from all sheets in the spreadsheet
-        
-        Returns:
-            Dictionary with sheet names as keys and data as values
-        """
-        try:
-            if not self.client:
-                if not self.authenticate():
-                    return None
-            
-            # Open the spreadsheet
-            spreadsheet = self.client.open_by_key(self.sheet_id)
-            
-            # Get all worksheets
-            worksheets = spreadsheet.worksheets()
-            
-            all_data = {}
-            
-            for worksheet in worksheets:
-                sheet_name = worksheet.title
-                safe_print(f"[FETCH] Fetching sheet: {sheet_name}")
-                
-                try:
-                    records = worksheet.get_all_records()
-                    all_data[sheet_name] = records
-                    safe_print(f"   [OK] {len(records)} records")
-                except Exception as e:
-                    safe_print(f"   [WARN] Error: {e}")
-                    all_data[sheet_name] = []
-            
-            return all_data
-            
-        except Exception as e:
-            safe_print(f"[ERROR] Error fetching all sheets: {e}")
-            return None
-    
-    def sync_to_cache(self):
-        """
-        Main sync function: Fetch data from Google Sheets and save to cache
-        
-        Returns:
-            dict with fetched data if successful, None otherwise
-        """
-        safe_print("\n" + "="*60)
-        safe_print("[SYNC] Starting Google Sheets Auto-Sync")
-        safe_print("="*60)
-        
-        start_time = time.time()
-        
-        try:
-            # Fetch all sheets
-            all_sheets_data = self.fetch_all_sheets()
-            
-            if not all_sheets_data:
-                safe_print("[ERROR] No data fetched from Google Sheets")
-                return None
-            
-            # Save to cache
-            cache_key = f"{CACHE_KEY_PREFIX}all_sheets"
-            
-            metadata = {
-                'sheet_id': self.sheet_id,
-                'sheets_count': len(all_sheets_data),
-                'sheet_names': list(all_sheets_data.keys()),
-                'sync_timestamp': datetime.now().isoformat(),
-                'records_count': {
-                    sheet_name: len(data) 
-                    for sheet_name, data in all_sheets_data.items()
-                }
-            }
-            
-            # Save to cache (will be skipped in no-cache mode)
-            self.cache_manager.set(cache_key, all_sheets_data, metadata)
-            
-            # Update last sync time
-            self.last_sync_time = datetime.now()
-            
-            elapsed = time.time() - start_time
-            
-            safe_print("\n" + "="*60)
-            safe_print(f"[OK] Sync completed successfully in {elapsed:.2f}s")
-            safe_print(f"   Total sheets: {len(all_sheets_data)}")
-            safe_print(f"   Sheet names: {', '.join(all_sheets_data.keys())}")
-            safe_print(f"   Last sync: {self.last_sync_time.strftime('%Y-%m-%d %H:%M:%S')}")
-            safe_print("="*60 + "\n")
-            
-            # Return the data directly (important for no-cache mode)
-            return all_sheets_data
-            
-        except Exception as e:
-            safe_print(f"[ERROR] Sync failed: {e}")
-            return None
-    
-    def get_cached_data(self):
-        """
-        Get cached data from the cache manager
-        
-        Returns:
-            Cached sheets data or None
-        """
-        cache_key = f"{CACHE_KEY_PREFIX}all_sheets"
-        cached = self.cache_manager.get(cache_key, ttl_hours=CACHE_TTL_HOURS)
-        
-        if cached:
-            safe_print("[OK] Retrieved data from cache")
-        else:
-            safe_print("[WARN] No cached data available")
-        
-        return cached
-    
-    def get_or_sync(self):
-        """
-        Get data from cache, or sync if cache is empty/expired
-        
-        Returns:
-            Sheets data (from cache or fresh sync)
-        """
-        # Try to get from cache first
-        cached_data = self.get_cached_data()
-        
-        if cached_data:
-            safe_print("[CACHE] Using cached data")
-            return cached_data
-        
-        # Cache miss or expired - sync now
-        safe_print("[SYNC] Cache miss - syncing from Google Sheets")
-        synced_data = self.sync_to_cache()
-        
-        # Return synced data directly (important for no-cache mode)
-        # In no-cache mode, sync_to_cache returns data but doesn't cache it
-        # In cache mode, sync_to_cache caches data and we can also return it directly
-        return synced_data
-    
-    def get_sync_status(self):
-        """
-        Get current sync status
-        
-        Returns:
-            Dictionary with sync status information
-        """
-        cache_key = f"{CACHE_KEY_PREFIX}all_sheets"
-        cache_info = self.cache_manager.get_cache_info()
-        
-        # Find our cache entry
-        cache_entry = None
-        if cache_info.get('cache_type') == 'Redis':
-            for item in cache_info.get('items', []):
-                if item.get('key') == cache_key:
-                    cache_entry = item
-                    break
-        else:  # File cache
-            for item in cache_info.get('files', []):
-                if item.get('key') == cache_key:
-                    cache_entry = item
-                    break
-        
-        status = {
-            'cache_type': cache_info.get('cache_type'),
-            'is_cached': cache_entry is not None,
-            'last_sync': None,
-            'age_minutes': None,
-            'next_sync_in_hours': None
-        }
-        
-        if cache_entry:
-            status['last_sync'] = cache_entry.get('cached_at')
-            status['age_minutes'] = cache_entry.get('age_minutes')
-            
-            # Calculate when next sync is due
-            age_hours = status['age_minutes'] / 60
-            next_sync_hours = max(0, CACHE_TTL_HOURS - age_hours)
-            status['next_sync_in_hours'] = round(next_sync_hours, 1)
-        
-        return status
-
-
-# Global sync service instance
-_sync_service = None
-
-def get_sync_service():
-    """Get or create global sync service instance"""
-    global _sync_service
-    if _sync_service is None:
-        _sync_service = GoogleSheetsSync()
-    return _sync_service
-
-
-# Convenience functions
-def sync_now():
-    """Trigger immediate sync"""
-    service = get_sync_service()
-    return service.sync_to_cache()
-
-def get_sheets_data():
-    """Get sheets data (from cache or sync)"""
-    service = get_sync_service()
-    return service.get_or_sync()
-
-def get_sync_status():
-    """Get sync status"""
-    service = get_sync_service()
-    return service.get_sync_status()
-
-
-if __name__ == '__main__':
-    # Test the sync service
-    safe_print("Testing Google Sheets Sync Service...")
-    safe_print("-" * 60)
-    
-    service = GoogleSheetsSync()
-    
-    # Test sync
-    if service.sync_to_cache():
-        safe_print("\n[OK] Sync test successful!")
-        
-        # Test retrieval
-        data = service.get_cached_data()
-        if data:
-            safe_print(f"\n[OK] Cache retrieval successful!")
-            safe_print(f"   Available sheets: {list(data.keys())}")
-        
-        # Test status
-        status = service.get_sync_status()
-        safe_print(f"\n[STATUS] Sync Status:")
-        safe_print(f"   Cache Type: {status['cache_type']}")
-        safe_print(f"   Is Cached: {status['is_cached']}")
-        safe_print(f"   Age: {status['age_minutes']} minutes")
-    else:
-        safe_print("\n[ERROR] Sync test failed")
-
+# -*- coding: utf-8 -*-
+"""
+Google Sheets Auto-Sync Service for Al Ahly Stats
+==================================================
+Automatically syncs data from Google Sheets to local cache
+"""
+
+import os
+import sys
+import time
+import json
+import threading
+import gspread
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+from cache_manager import get_cache_manager
+from sheets_client_registry import get_sheets_client, open_spreadsheet
+from sheets_snapshot import fetch_sheet_snapshot
+from dataset_registry import register_dataset, PRIORITY_HIGH
+from sync_jobs import get_job_tracker
+
+# Helper function to get resource path (works with PyInstaller)
+def get_resource_path(relative_path):
+    """Get absolute path to resource, works for dev and for PyInstaller"""
+    try:
+        # PyInstaller creates a temp folder and stores path in _MEIPASS
+        base_path = sys._MEIPASS
+    except Exception:
+        base_path = os.path.abspath(".")
+    return os.path.join(base_path, relative_path)
+
+# Fix Unicode printing on Windows
+def safe_print(msg):
+    """Safe print that handles Unicode errors on Windows"""
+    try:
+        print(msg)
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        # Remove emojis and print ASCII only
+        cleaned = msg.encode('ascii', 'ignore').decode('ascii')
+        print(cleaned)
+
+# Google Sheets Configuration
+AHLY_STATS_SHEET_ID = os.environ.get('AHLY_MATCH_SHEET_ID', '1zeSlEN7VS2S6KPZH7_uvQeeY3Iu5INUyi12V0_Wi9G4')
+CREDENTIALS_FILE = get_resource_path('credentials/ahlymatch.json')
+
+# Cache configuration
+CACHE_KEY_PREFIX = 'ahly_stats_'
+CACHE_TTL_HOURS = 6  # Cache validity: 6 hours
+SYNC_JOB_NAME = f"{CACHE_KEY_PREFIX}all_sheets"  # One running sync job at a time (see sync_jobs)
+SYNC_INTERVAL_HOURS = float(os.environ.get('AHLY_STATS_SYNC_INTERVAL_HOURS', '2'))  # Scheduled refresh (match data changes often)
+
+# Concurrent fetch configuration (used when the single batch request isn't possible)
+FETCH_MAX_WORKERS = int(os.environ.get('SHEETS_FETCH_MAX_WORKERS', '6'))  # Threads shared by all syncs
+FETCH_PER_SPREADSHEET = int(os.environ.get('SHEETS_FETCH_PER_SPREADSHEET', '4'))  # In-flight reads per spreadsheet (Sheets quota)
+FETCH_SHEET_TIMEOUT = float(os.environ.get('SHEETS_FETCH_SHEET_TIMEOUT', '60'))  # Seconds per worksheet
+FETCH_TOTAL_TIMEOUT = float(os.environ.get('SHEETS_FETCH_TOTAL_TIMEOUT', '300'))  # Seconds for all worksheets (queued ones included)
+
+# Shared fetch pool and per-spreadsheet limits
+_fetch_executor = None
+_spreadsheet_limits = {}
+_fetch_lock = threading.Lock()
+
+def get_fetch_executor():
+    """Get or create the bounded thread pool used for worksheet fetches"""
+    global _fetch_executor
+    if _fetch_executor is None:
+        with _fetch_lock:
+            if _fetch_executor is None:
+                _fetch_executor = ThreadPoolExecutor(
+                    max_workers=max(1, FETCH_MAX_WORKERS),
+                    thread_name_prefix='sheets-fetch'
+                )
+    return _fetch_executor
+
+def get_spreadsheet_limit(sheet_id):
+    """Get the semaphore that caps concurrent reads against one spreadsheet"""
+    with _fetch_lock:
+        if sheet_id not in _spreadsheet_limits:
+            _spreadsheet_limits[sheet_id] = threading.BoundedSemaphore(max(1, FETCH_PER_SPREADSHEET))
+        return _spreadsheet_limits[sheet_id]
+
+class GoogleSheetsSync:
+    """Handles automatic synchronization with Google Sheets"""
+    
+    def __init__(self, credentials_file=CREDENTIALS_FILE, sheet_id=AHLY_STATS_SHEET_ID):
+        """
+        Initialize Google Sheets sync service
+        
+        Args:
+            credentials_file: Path to service account JSON credentials
+            sheet_id: Google Sheets ID to sync from
+        """
+        self.sheet_id = sheet_id
+        self.credentials_file = credentials_file
+        self.client = None
+        self.cache_manager = get_cache_manager()
+        self.last_sync_time = None
+        self.fetch_mode = None
+        self.sheet_timings = {}
+        
+        # Warmed/refreshed by the scheduler; stale data is served while a background sync runs
+        register_dataset(f"{CACHE_KEY_PREFIX}all_sheets", self.sync_to_cache,
+                         ttl_hours=CACHE_TTL_HOURS, interval_hours=SYNC_INTERVAL_HOURS,
+                         priority=PRIORITY_HIGH)
+        
+        safe_print(f"[INIT] Initializing Google Sheets Sync Service")
+        safe_print(f"   Sheet ID: {sheet_id}")
+        safe_print(f"   Credentials: {credentials_file}")
+    
+    def authenticate(self):
+        """Authenticate with Google Sheets API"""
+        try:
+            # Define the required scopes
+            scopes = [
+                'https://www.googleapis.com/auth/spreadsheets.readonly',
+                'https://www.googleapis.com/auth/drive.readonly'
+            ]
+            
+            # Try to get credentials from environment variable first (for Render/Production)
+            # Try the specific AHLY_MATCH credentials first, then fallback to generic
+            credentials_json = os.environ.get('GOOGLE_CREDENTIALS_JSON_AHLY_MATCH') or os.environ.get('GOOGLE_CREDENTIALS_JSON')
+            
+            if credentials_json:
+                safe_print("[INFO] Using credentials from environment variable")
+            else:
+                # Fallback to file (for local development)
+                if not os.path.exists(self.credentials_file):
+                    raise FileNotFoundError(
+                        f"Credentials file not found: {self.credentials_file}\n"
+                        "Please set GOOGLE_CREDENTIALS_JSON environment variable or provide credentials file."
+                    )
+                
+                safe_print(f"[INFO] Using credentials from file: {self.credentials_file}")
+            
+            # Get pooled gspread client (shared with the web routes, token kept fresh)
+            self.client = get_sheets_client(
+                credentials_json=credentials_json,
+                credentials_file=self.credentials_file,
+                scopes=scopes
+            )
+            
+            safe_print("[OK] Successfully authenticated with Google Sheets")
+            return True
+            
+        except Exception as e:
+            safe_print(f"[ERROR] Failed to authenticate: {e}")
+            return False
+    
+    def fetch_sheet_data(self, sheet_name):
+        """
+        Fetch data from a specific sheet/tab
+        
+        Args:
+            sheet_name: Name of the sheet/tab to fetch
+            
+        Returns:
+            List of dictionaries representing rows
+        """
+        try:
+            if not self.client:
+                if not self.authenticate():
+                    return None
+            
+            # Open the spreadsheet
+            spreadsheet = open_spreadsheet(self.client, self.sheet_id)
+            
+            # Get the specific worksheet
+            worksheet = spreadsheet.worksheet(sheet_name)
+            
+            # Get all records as list of dictionaries
+            records = worksheet.get_all_records()
+            
+            safe_print(f"[OK] Fetched {len(records)} records from sheet: {sheet_name}")
+            return records
+            
+        except gspread.exceptions.WorksheetNotFound:
+            safe_print(f"[WARN] Sheet not found: {sheet_name}")
+            return None
+        except Exception as e:
+            safe_print(f"[ERROR] Error fetching sheet data from {sheet_name}: {e}")
+            return None
+    
+    def fetch_all_sheets(self, job=None):
+        """
+        Fetch data from all sheets in the spreadsheet
+        
+        Uses one batchGet request for every tab; falls back to reading
+        the worksheets concurrently if the batch request fails.
+        Per-sheet timings are kept in self.sheet_timings.
+        
+        Args:
+            job: Optional SyncJob that receives per-worksheet progress
+        
+        Returns:
+            Dictionary with sheet names as keys and data as values
+        """
+        try:
+            if not self.client:
+                if not self.authenticate():
+                    return None
+            
+            # Single round trip for all worksheets
+            try:
+                safe_print("[FETCH] Fetching all sheets in one batch request")
+                batch_start = time.time()
+                all_data = fetch_sheet_snapshot(self.client, self.sheet_id)
+                batch_elapsed = round(time.time() - batch_start, 3)
+                
+                self.fetch_mode = 'batch'
+                # One shared request - every sheet took the same round trip
+                self.sheet_timings = {sheet_name: batch_elapsed for sheet_name in all_data}
+                if job:
+                    job.fetch_mode = 'batch'
+                for sheet_name, records in all_data.items():
+                    safe_print(f"   [OK] {sheet_name}: {len(records)} records")
+                    if job:
+                        job.sheet_finished(sheet_name, len(records), batch_elapsed)
+                return all_data
+            except Exception as e:
+                safe_print(f"[WARN] Batch fetch failed ({e}), fetching sheets concurrently")
+            
+            return self._fetch_sheets_concurrent(job=job)
+            
+        except Exception as e:
+            safe_print(f"[ERROR] Error fetching all sheets: {e}")
+            return None
+    
+    def _fetch_worksheet(self, worksheet, started_at, deadline, job=None):
+        """Read one worksheet (runs in the fetch pool, limited per spreadsheet)"""
+        with get_spreadsheet_limit(self.sheet_id):
+            # The sync already gave up on this sheet while it waited for a slot
+            if time.time() > deadline:
+                raise TimeoutError("Fetch deadline passed before the read started")
+            started_at[worksheet.title] = time.time()
+            if job:
+                job.sheet_started(worksheet.title)
+            return worksheet.get_all_records()
+    
+    def _fetch_sheets_concurrent(self, timeout=FETCH_SHEET_TIMEOUT, total_timeout=FETCH_TOTAL_TIMEOUT, job=None):
+        """
+        Fetch every worksheet with its own get_all_records() call, in parallel
+        
+        A sheet that fails or runs longer than timeout seconds (counted from
+        when its read starts, not while it waits for a slot) is stored as [].
+        Sheets still pending total_timeout seconds after submission (running
+        or still queued behind hung reads) are given up on the same way.
+        
+        Args:
+            timeout: Per-sheet timeout in seconds
+            total_timeout: Timeout for the whole fetch in seconds
+            job: Optional SyncJob that receives per-worksheet progress
+            
+        Returns:
+            Dictionary with sheet names as keys and data as values (tab order)
+        """
+        # Open the spreadsheet
+        spreadsheet = open_spreadsheet(self.client, self.sheet_id)
+        
+        # Get all worksheets
+        worksheets = spreadsheet.worksheets()
+        
+        if job:
+            job.fetch_mode = 'concurrent'
+            job.add_sheets([ws.title for ws in worksheets])
+        
+        executor = get_fetch_executor()
+        started_at = {}
+        futures = {}
+        submitted_at = time.time()
+        deadline = submitted_at + total_timeout
+        for worksheet in worksheets:
+            safe_print(f"[FETCH] Fetching sheet: {worksheet.title}")
+            futures[executor.submit(self._fetch_worksheet, worksheet, started_at, deadline, job)] = worksheet.title
+        
+        results = {}
+        timings = {}
+        pending = set(futures)
+        
+        while pending:
+            done, pending = wait(pending, timeout=1, return_when=FIRST_COMPLETED)
+            now = time.time()
+            
+            for future in done:
+                sheet_name = futures[future]
+                timings[sheet_name] = round(now - started_at.get(sheet_name, now), 3)
+                try:
+                    records = future.result()
+                    results[sheet_name] = records
+                    safe_print(f"   [OK] {sheet_name}: {len(records)} records ({timings[sheet_name]:.2f}s)")
+                    if job:
+                        job.sheet_finished(sheet_name, len(records), timings[sheet_name])
+                except Exception as e:
+                    safe_print(f"   [WARN] {sheet_name}: Error: {e}")
+                    results[sheet_name] = []
+                    if job:
+                        job.sheet_finished(sheet_name, seconds=timings[sheet_name], error=str(e))
+            
+            # Give up on reads that started too long ago, and on everything once the
+            # overall deadline passes (threads still reading finish in the background,
+            # bounded by the client's HTTP timeout; queued reads are cancelled)
+            for future in list(pending):
+                sheet_name = futures[future]
+                sheet_start = started_at.get(sheet_name)
+                if sheet_start is not None and now - sheet_start > timeout:
+                    limit = timeout
+                elif now > deadline:
+                    limit = total_timeout
+                else:
+                    continue
+                pending.discard(future)
+                future.cancel()
+                timings[sheet_name] = round(now - (sheet_start or submitted_at), 3)
+                safe_print(f"   [WARN] {sheet_name}: Timed out after {limit:.0f}s")
+                results[sheet_name] = []
+                if job:
+                    job.sheet_finished(sheet_name, seconds=timings[sheet_name], error=f"Timed out after {limit:.0f}s")
+        
+        self.fetch_mode = 'concurrent'
+        self.sheet_timings = {ws.title: timings.get(ws.title) for ws in worksheets}
+        
+        # Keep tab order like the serial loop did
+        return {ws.title: results.get(ws.title, []) for ws in worksheets}
+    
+    def sync_to_cache(self, trigger='background'):
+        """
+        Main sync function: Fetch data from Google Sheets and save to cache
+        
+        Runs as a sync job (see sync_jobs). If a sync is already running in this
+        process, waits for it and returns its data instead of syncing again.
+        
+        Args:
+            trigger: Who asked for the sync ('background' = scheduler or stale refresh,
+                     'manual', 'cache-miss')
+        
+        Returns:
+            dict with fetched data if successful, None otherwise
+        """
+        job, created = get_job_tracker().begin(SYNC_JOB_NAME, trigger)
+        if not created:
+            safe_print(f"[SYNC] Sync {job.id} already running - waiting for it")
+            job.wait()
+            return job.result
+        return self._run_sync_job(job)
+    
+    def start_sync_job(self, trigger='manual'):
+        """
+        Start a sync in a background thread, or attach to the one already running
+        (in this process or, with Redis, another worker)
+        
+        Returns:
+            Tuple (job status dict, created)
+        """
+        tracker = get_job_tracker()
+        running = tracker.running_elsewhere(SYNC_JOB_NAME)
+        if running:
+            return running, False
+        
+        job, created = tracker.begin(SYNC_JOB_NAME, trigger)
+        if created:
+            thread = threading.Thread(target=self._run_background_job, args=(job,),
+                                      daemon=True, name=f"sync-job-{job.id}")
+            thread.start()
+        return job.to_dict(), created
+    
+    def _run_background_job(self, job):
+        """Run a job through the cache's single-flight reload so readers wait for it"""
+        try:
+            cache_key = f"{CACHE_KEY_PREFIX}all_sheets"
+            # A manual sync always downloads, even if the spreadsheet looks unchanged
+            if not self.cache_manager.reload(cache_key, lambda: self._run_sync_job(job), revalidate=False):
+                job.finish(error='A sync is already running elsewhere')
+        except Exception as e:
+            if not job.done:
+                job.finish(error=str(e))
+        finally:
+            get_job_tracker().end(job)
+    
+    def _run_sync_job(self, job):
+        """Fetch every worksheet into the cache, reporting progress on job"""
+        job.start()
+        safe_print("\n" + "="*60)
+        safe_print("[SYNC] Starting Google Sheets Auto-Sync")
+        safe_print("="*60)
+        
+        start_time = time.time()
+        
+        try:
+            # Fetch all sheets
+            all_sheets_data = self.fetch_all_sheets(job)
+            
+            if not all_sheets_data:
+                safe_print("[ERROR] No data fetched from Google Sheets")
+                job.finish(error='No data fetched from Google Sheets')
+                return None
+            
+            # Save to cache
+            cache_key = f"{CACHE_KEY_PREFIX}all_sheets"
+            
+            metadata = {
+                'sheet_id': self.sheet_id,
+                'sheets_count': len(all_sheets_data),
+                'sheet_names': list(all_sheets_data.keys()),
+                'sync_timestamp': datetime.now().isoformat(),
+                'records_count': {
+                    sheet_name: len(data) 
+                    for sheet_name, data in all_sheets_data.items()
+                },
+                'fetch_mode': self.fetch_mode,
+                'sheet_timings': dict(self.sheet_timings)
+            }
+            
+            # Save to cache (will be skipped in no-cache mode)
+            # Built from every worksheet - any save to this spreadsheet evicts it
+            self.cache_manager.set(cache_key, all_sheets_data, metadata, tags=[(self.sheet_id, None)])
+            
+            # Update last sync time
+            self.last_sync_time = datetime.now()
+            
+            elapsed = time.time() - start_time
+            
+            safe_print("\n" + "="*60)
+            safe_print(f"[OK] Sync completed successfully in {elapsed:.2f}s")
+            safe_print(f"   Total sheets: {len(all_sheets_data)}")
+            safe_print(f"   Sheet names: {', '.join(all_sheets_data.keys())}")
+            safe_print(f"   Last sync: {self.last_sync_time.strftime('%Y-%m-%d %H:%M:%S')}")
+            safe_print("="*60 + "\n")
+            
+            job.finish(result=all_sheets_data)
+            
+            # Return the data directly (important for no-cache mode)
+            return all_sheets_data
+            
+        except Exception as e:
+            safe_print(f"[ERROR] Sync failed: {e}")
+            job.finish(error=str(e))
+            return None
+        finally:
+            get_job_tracker().end(job)
+    
+    def get_cached_data(self):
+        """
+        Get cached data from the cache manager
+        
+        Returns:
+            Cached sheets data or None
+        """
+        cache_key = f"{CACHE_KEY_PREFIX}all_sheets"
+        cached = self.cache_manager.get(cache_key, ttl_hours=CACHE_TTL_HOURS)
+        
+        if cached:
+            safe_print("[OK] Retrieved data from cache")
+        else:
+            safe_print("[WARN] No cached data available")
+        
+        return cached
+    
+    def get_or_sync(self):
+        """
+        Get data from cache, or sync if cache is empty/expired
+        
+        Returns:
+            Sheets data (from cache or fresh sync)
+        """
+        # Try to get from cache first
+        cached_data = self.get_cached_data()
+        
+        if cached_data:
+            safe_print("[CACHE] Using cached data")
+            return cached_data
+        
+        # Cache miss or expired - sync now
+        safe_print("[SYNC] Cache miss - syncing from Google Sheets")
+        synced_data = self.sync_to_cache(trigger='cache-miss')
+        
+        if synced_data is None:
+            # Nothing was cached - let the next caller try instead of waiting on us
+            self.cache_manager.end_load(f"{CACHE_KEY_PREFIX}all_sheets")
+        
+        # Return synced data directly (important for no-cache mode)
+        # In no-cache mode, sync_to_cache returns data but doesn't cache it
+        # In cache mode, sync_to_cache caches data and we can also return it directly
+        return synced_data
+    
+    def get_sync_status(self):
+        """
+        Get current sync status
+        
+        Returns:
+            Dictionary with sync status information
+        """
+        cache_key = f"{CACHE_KEY_PREFIX}all_sheets"
+        
+        # Only our entry's metadata - no other entries (or payloads) are read
+        cache_entry = self.cache_manager.get_entry_info(cache_key)
+        
+        status = {
+            'cache_type': self.cache_manager.cache_type,
+            'is_cached': cache_entry is not None,
+            'last_sync': None,
+            'age_minutes': None,
+            'next_sync_in_hours': None,
+            'recent_jobs': get_job_tracker().recent()
+        }
+        
+        if cache_entry:
+            status['last_sync'] = cache_entry.get('cached_at')
+            status['age_minutes'] = cache_entry.get('age_minutes')
+            
+            # Calculate when next sync is due
+            age_hours = status['age_minutes'] / 60
+            next_sync_hours = max(0, CACHE_TTL_HOURS - age_hours)
+            status['next_sync_in_hours'] = round(next_sync_hours, 1)
+        
+        return status
+
+
+# Global sync service instance
+_sync_service = None
+
+def get_sync_service():
+    """Get or create global sync service instance"""
+    global _sync_service
+    if _sync_service is None:
+        _sync_service = GoogleSheetsSync()
+    return _sync_service
+
+
+# Convenience functions
+def sync_now():
+    """Trigger immediate sync (blocks until it finishes)"""
+    service = get_sync_service()
+    return service.sync_to_cache(trigger='manual')
+
+def start_sync_job(trigger='manual'):
+    """Start a background sync, or attach to the running one. Returns (job status, created)"""
+    service = get_sync_service()
+    return service.start_sync_job(trigger)
+
+def get_sync_job(job_id):
+    """Status of a sync job (None if unknown)"""
+    return get_job_tracker().get(job_id)
+
+def get_sheets_data():
+    """Get sheets data (from cache or sync)"""
+    service = get_sync_service()
+    return service.get_or_sync()
+
+def get_sync_status():
+    """Get sync status"""
+    service = get_sync_service()
+    return service.get_sync_status()
+
+
+if __name__ == '__main__':
+    # Test the sync service
+    safe_print("Testing Google Sheets Sync Service...")
+    safe_print("-" * 60)
+    
+    service = GoogleSheetsSync()
+    
+    # Test sync
+    if service.sync_to_cache():
+        safe_print("\n[OK] Sync test successful!")
+        
+        # Test retrieval
+        data = service.get_cached_data()
+        if data:
+            safe_print(f"\n[OK] Cache retrieval successful!")
+            safe_print(f"   Available sheets: {list(data.keys())}")
+        
+        # Test status
+        status = service.get_sync_status()
+        safe_print(f"\n[STATUS] Sync Status:")
+        safe_print(f"   Cache Type: {status['cache_type']}")
+        safe_print(f"   Is Cached: {status['is_cached']}")
+        safe_print(f"   Age: {status['age_minutes']} minutes")
+    else:
+        safe_print("\n[ERROR] Sync test failed")
+
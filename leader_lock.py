@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+Leader Election
+===============
+Makes sure only one process (gunicorn worker, Render instance or desktop app)
+runs a singleton job such as the sync scheduler. Uses a renewed Redis lease when
+the cache runs on Redis, and an exclusive lock file in file-cache mode.
+"""
+
+import os
+import uuid
+import socket
+import threading
+
+from cache_files import try_lock_file
+from cache_manager import LEADER_KEY_PREFIX
+
+# Lease length (the leader renews it every third of that, followers retry as often)
+LEADER_LEASE_SECONDS = int(os.environ.get('LEADER_LEASE_SECONDS', '60'))
+
+# Extend our lease, or take it over if it is gone (e.g. wiped by a full cache clear)
+_RENEW_LEASE_SCRIPT = """
+local current = redis.call('get', KEYS[1])
+if current == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+if not current then
+    redis.call('set', KEYS[1], ARGV[1], 'PX', ARGV[2])
+    return 1
+end
+return 0
+"""
+
+# Give the lease up only if we still hold it
+_RELEASE_LEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+else
+    return 0
+end
+"""
+
+
+def process_identity():
+    """Readable id of this process: host:pid:random"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaderLock:
+    """Leader election for one named role, kept alive by a renewal thread"""
+
+    def __init__(self, name, cache_manager, lease_seconds=LEADER_LEASE_SECONDS):
+        """
+        Args:
+            name: Role name (e.g. 'scheduler')
+            cache_manager: Decides the backend - Redis lease, lock file in the
+                           cache directory, or always-leader in no-cache mode
+            lease_seconds: Redis lease length (a dead leader is replaced after this)
+        """
+        self.name = name
+        self.cache = cache_manager
+        self.lease_seconds = lease_seconds
+        self.renew_seconds = max(1, lease_seconds // 3)
+        self.identity = process_identity()
+        self.is_leader = False
+        self.on_change = None  # Optional callable(is_leader)
+        self.thread = None
+        self._stop = threading.Event()
+        self._lock_file = None
+
+        if self.cache.using_redis:
+            self.backend = 'redis'
+            self.redis_key = f"{LEADER_KEY_PREFIX}{name}"
+        elif self.cache.no_cache_mode:
+            self.backend = 'local'
+        else:
+            self.backend = 'file'
+            self.lock_path = os.path.join(str(self.cache.cache_dir), f".leader.{name}.lock")
+
+    def start(self):
+        """Try to become leader now, then keep renewing / retrying in the background"""
+        self._check()
+        if self.thread and self.thread.is_alive():
+            return
+        self._stop.clear()
+        self.thread = threading.Thread(target=self._loop, daemon=True, name=f"leader-{self.name}")
+        self.thread.start()
+
+    def stop(self):
+        """Stop renewing and give up leadership"""
+        self._stop.set()
+        self._release()
+        self._set_leader(False)
+
+    def _loop(self):
+        while not self._stop.wait(self.renew_seconds):
+            self._check()
+
+    def _check(self):
+        """Acquire or renew leadership (one attempt)"""
+        try:
+            if self.backend == 'redis':
+                leader = self._renew_redis()
+            elif self.backend == 'file':
+                leader = self.is_leader or self._acquire_file()
+            else:
+                leader = True
+        except Exception as e:
+            print(f"⚠️ Leader check failed for {self.name}: {e}")
+            leader = False
+        self._set_leader(leader)
+
+    def _set_leader(self, leader):
+        if leader == self.is_leader:
+            return
+        self.is_leader = leader
+        if leader:
+            print(f"👑 {self.identity} is now the {self.name} leader")
+        else:
+            print(f"👥 {self.identity} is no longer the {self.name} leader")
+        if self.on_change:
+            try:
+                self.on_change(leader)
+            except Exception as e:
+                print(f"⚠️ Leader change callback failed: {e}")
+
+    def _renew_redis(self):
+        result = self.cache.redis_client.eval(
+            _RENEW_LEASE_SCRIPT, 1, self.redis_key, self.identity, int(self.lease_seconds * 1000)
+        )
+        return bool(result)
+
+    def _acquire_file(self):
+        """Hold an exclusive lock on the leader file for the life of the process"""
+        lock_file = open(self.lock_path, 'a+b')
+        if not try_lock_file(lock_file):
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+        # Record who holds it (read by followers for status)
+        with open(f"{self.lock_path}.holder", 'w', encoding='utf-8') as f:
+            f.write(self.identity)
+        return True
+
+    def _release(self):
+        try:
+            if self.backend == 'redis' and self.is_leader:
+                self.cache.redis_client.eval(_RELEASE_LEASE_SCRIPT, 1, self.redis_key, self.identity)
+            elif self.backend == 'file' and self._lock_file is not None:
+                # Closing the file drops the lock
+                self._lock_file.close()
+                self._lock_file = None
+        except Exception as e:
+            print(f"⚠️ Could not release {self.name} leadership: {e}")
+
+    def get_leader(self):
+        """Identity of the current leader (None if unknown / no leader)"""
+        if self.is_leader:
+            return self.identity
+        try:
+            if self.backend == 'redis':
+                return self.cache.redis_client.get(self.redis_key)
+            if self.backend == 'file':
+                with open(f"{self.lock_path}.holder", 'r', encoding='utf-8') as f:
+                    return f.read().strip() or None
+        except Exception:
+            pass
+        return None
+
+    def get_status(self):
+        return {
+            'backend': self.backend,
+            'is_leader': self.is_leader,
+            'identity': self.identity,
+            'leader': self.get_leader()
+        }
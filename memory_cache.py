@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+In-Process Memory Cache (L1)
+============================
+Byte-bounded LRU of decoded cache entries that sits in front of Redis / file cache.
+Each entry carries the version stamp it had in the backend, so a hit only needs a
+cheap version check (or none at all, within verify_seconds) instead of a full read.
+"""
+
+import os
+import time
+import threading
+from collections import OrderedDict
+
+# L1 configuration
+L1_MAX_BYTES = int(float(os.environ.get('CACHE_L1_MAX_MB', '128')) * 1024 * 1024)
+L1_VERIFY_SECONDS = float(os.environ.get('CACHE_L1_VERIFY_SECONDS', '5'))  # Trust an entry this long without asking L2
+
+
+class MemoryEntry:
+    """One decoded cache envelope plus its backend version stamp"""
+
+    __slots__ = ('cache_obj', 'version', 'size_bytes', 'checked_at', 'extras')
+
+    def __init__(self, cache_obj, version, size_bytes):
+        self.cache_obj = cache_obj
+        self.version = version
+        self.size_bytes = size_bytes
+        self.checked_at = time.time()
+        self.extras = {}  # name -> (value, size_bytes), built once per version (e.g. serialized responses)
+
+
+class MemoryCache:
+    """Thread-safe LRU cache bounded by the (serialized) size of its entries"""
+
+    def __init__(self, max_bytes=L1_MAX_BYTES, verify_seconds=L1_VERIFY_SECONDS):
+        """
+        Initialize memory cache
+
+        Args:
+            max_bytes: Total size budget (sum of the entries' serialized sizes)
+            verify_seconds: How long an entry is trusted before its version is re-checked
+        """
+        self.max_bytes = max_bytes
+        self.verify_seconds = verify_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, current_version=None):
+        """
+        Get an entry if it is still current
+
+        Args:
+            key: Cache key
+            current_version: Callable returning the backend's version for key.
+                             Only called when the entry hasn't been verified recently.
+
+        Returns:
+            MemoryEntry or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        now = time.time()
+        if now - entry.checked_at > self.verify_seconds and current_version is not None:
+            if current_version() != entry.version:
+                # Another thread/process replaced or deleted the entry
+                self.pop(key, entry)
+                self.misses += 1
+                return None
+            entry.checked_at = now
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, cache_obj, version, size_bytes):
+        """Store a decoded envelope (skipped if it alone exceeds the budget)"""
+        if version is None or size_bytes > self.max_bytes:
+            self.pop(key)
+            return None
+
+        entry = MemoryEntry(cache_obj, version, size_bytes)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old.size_bytes
+            self._entries[key] = entry
+            self.total_bytes += size_bytes
+
+            # Evict least recently used entries
+            while self.total_bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self.total_bytes -= evicted.size_bytes
+                self.evictions += 1
+        return entry
+
+    def peek(self, key):
+        """Get an entry without version checks or LRU/stat updates"""
+        with self._lock:
+            return self._entries.get(key)
+
+    def set_extra(self, key, entry, name, value, size_bytes=0):
+        """Attach a derived value to an entry (counted against the size budget)"""
+        with self._lock:
+            if self._entries.get(key) is not entry:
+                return False  # Entry was replaced or evicted meanwhile
+            old_value = entry.extras.get(name)
+            delta = size_bytes - (old_value[1] if old_value is not None else 0)
+            if entry.size_bytes + delta > self.max_bytes:
+                return False  # Entry plus extra would never fit
+            entry.extras[name] = (value, size_bytes)
+            entry.size_bytes += delta
+            self.total_bytes += delta
+
+            # Evict least recently used entries (never the one just extended)
+            while self.total_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                if oldest == key:
+                    self._entries.move_to_end(key)
+                    continue
+                evicted = self._entries.pop(oldest)
+                self.total_bytes -= evicted.size_bytes
+                self.evictions += 1
+        return True
+
+    def pop(self, key, expected=None):
+        """Drop an entry (only if it is still `expected`, when given)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (expected is not None and entry is not expected):
+                return
+            del self._entries[key]
+            self.total_bytes -= entry.size_bytes
+
+    def clear(self):
+        """Drop everything"""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def get_stats(self):
+        """Get memory cache statistics"""
+        with self._lock:
+            items = len(self._entries)
+        lookups = self.hits + self.misses
+        return {
+            'items': items,
+            'size_kb': round(self.total_bytes / 1024, 1),
+            'max_size_kb': round(self.max_bytes / 1024, 1),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else None,
+            'evictions': self.evictions
+        }
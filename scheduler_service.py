@@ -1,160 +1,417 @@
-# -*- coding: utf-8 -*-
-"""
-Background Scheduler Service
-============================
-Handles scheduled tasks like auto-syncing Google Sheets
-"""
-
-import threading
-import time
-from datetime import datetime, timedelta
-from google_sheets_sync import get_sync_service
-
-class SchedulerService:
-    """Background scheduler for recurring tasks"""
-    
-    def __init__(self, sync_interval_hours=6):
-        """
-        Initialize scheduler
-        
-        Args:
-            sync_interval_hours: How often to sync (in hours)
-        """
-        self.sync_interval_hours = sync_interval_hours
-        self.sync_interval_seconds = sync_interval_hours * 3600
-        self.running = False
-        self.thread = None
-        self.next_sync_time = None
-        
-        print(f"📅 Scheduler initialized (sync every {sync_interval_hours} hours)")
-    
-    def _scheduler_loop(self):
-        """Main scheduler loop (runs in background thread)"""
-        print("🚀 Scheduler thread started")
-        
-        # Do initial sync on startup
-        print("🔄 Performing initial sync on startup...")
-        sync_service = get_sync_service()
-        sync_service.sync_to_cache()
-        
-        # Calculate next sync time
-        self.next_sync_time = datetime.now() + timedelta(hours=self.sync_interval_hours)
-        print(f"⏰ Next sync scheduled for: {self.next_sync_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        
-        while self.running:
-            try:
-                # Check if it's time to sync
-                if datetime.now() >= self.next_sync_time:
-                    print("\n" + "="*60)
-                    print("⏰ Scheduled sync triggered")
-                    print("="*60)
-                    
-                    # Perform sync
-                    sync_service.sync_to_cache()
-                    
-                    # Schedule next sync
-                    self.next_sync_time = datetime.now() + timedelta(hours=self.sync_interval_hours)
-                    print(f"⏰ Next sync scheduled for: {self.next_sync_time.strftime('%Y-%m-%d %H:%M:%S')}")
-                
-                # Sleep for 1 minute before checking again
-                time.sleep(60)
-                
-            except Exception as e:
-                print(f"❌ Error in scheduler loop: {e}")
-                time.sleep(60)  # Wait before retrying
-        
-        print("🛑 Scheduler thread stopped")
-    
-    def start(self):
-        """Start the background scheduler"""
-        if self.running:
-            print("⚠️ Scheduler already running")
-            return
-        
-        self.running = True
-        self.thread = threading.Thread(target=self._scheduler_loop, daemon=True)
-        self.thread.start()
-        
-        print("✅ Scheduler started successfully")
-    
-    def stop(self):
-        """Stop the background scheduler"""
-        if not self.running:
-            print("⚠️ Scheduler not running")
-            return
-        
-        print("🛑 Stopping scheduler...")
-        self.running = False
-        
-        if self.thread:
-            self.thread.join(timeout=5)
-        
-        print("✅ Scheduler stopped")
-    
-    def get_status(self):
-        """Get scheduler status"""
-        if not self.running:
-            return {
-                'running': False,
-                'sync_interval_hours': self.sync_interval_hours,
-                'next_sync': None
-            }
-        
-        return {
-            'running': True,
-            'sync_interval_hours': self.sync_interval_hours,
-            'next_sync': self.next_sync_time.isoformat() if self.next_sync_time else None,
-            'minutes_until_next_sync': int((self.next_sync_time - datetime.now()).total_seconds() / 60) if self.next_sync_time else None
-        }
-
-
-# Global scheduler instance
-_scheduler = None
-
-def get_scheduler(sync_interval_hours=6):
-    """Get or create global scheduler instance"""
-    global _scheduler
-    if _scheduler is None:
-        _scheduler = SchedulerService(sync_interval_hours)
-    return _scheduler
-
-def start_scheduler(sync_interval_hours=6):
-    """Start the global scheduler"""
-    scheduler = get_scheduler(sync_interval_hours)
-    scheduler.start()
-    return scheduler
-
-def stop_scheduler():
-    """Stop the global scheduler"""
-    global _scheduler
-    if _scheduler:
-        _scheduler.stop()
-
-def get_scheduler_status():
-    """Get scheduler status"""
-    if _scheduler:
-        return _scheduler.get_status()
-    return {'running': False}
-
-
-if __name__ == '__main__':
-    # Test the scheduler
-    print("Testing Scheduler Service...")
-    print("-" * 60)
-    
-    # Start scheduler with 1-minute interval for testing
-    scheduler = SchedulerService(sync_interval_hours=0.016667)  # ~1 minute
-    scheduler.start()
-    
-    # Let it run for a few minutes
-    try:
-        print("\nScheduler is running. Press Ctrl+C to stop...\n")
-        while True:
-            status = scheduler.get_status()
-            print(f"Status: {status}")
-            time.sleep(30)
-    except KeyboardInterrupt:
-        print("\n\nStopping scheduler...")
-        scheduler.stop()
-        print("✅ Test completed")
-
+# -*- coding: utf-8 -*-
+"""
+Background Scheduler Service
+============================
+Handles scheduled tasks like auto-syncing Google Sheets: warms every registered
+dataset (see dataset_registry) at startup and refreshes each on its own interval. Only the
+elected leader (see leader_lock) loads anything; other workers read the shared cache.
+
+Runs are kept in a timer heap; the scheduler thread sleeps on a condition variable
+until the next one is due, and is woken early by trigger(), new registrations,
+leadership changes and stop().
+"""
+
+import os
+import heapq
+import random
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from cache_manager import get_cache_manager
+from google_sheets_sync import get_sync_service
+from dataset_registry import get_dataset, get_datasets, add_dataset_listener, remove_dataset_listener
+from leader_lock import LeaderLock
+
+# Datasets loaded at the same time (each one reads Google Sheets - keep quota in mind)
+SCHEDULER_MAX_CONCURRENT = int(os.environ.get('SCHEDULER_MAX_CONCURRENT', '2'))
+# Failed loads are retried after this long instead of waiting a full interval
+SCHEDULER_RETRY_MINUTES = 15
+# Default random delay added to scheduled refreshes (capped at a tenth of the interval)
+SCHEDULER_JITTER_MINUTES = float(os.environ.get('SCHEDULER_JITTER_MINUTES', '5'))
+
+class SchedulerService:
+    """Background scheduler for recurring tasks"""
+    
+    def __init__(self, sync_interval_hours=6, max_concurrent=SCHEDULER_MAX_CONCURRENT):
+        """
+        Initialize scheduler
+        
+        Args:
+            sync_interval_hours: Refresh interval for datasets that don't declare one (in hours)
+            max_concurrent: Datasets loaded in parallel
+        """
+        self.sync_interval_hours = sync_interval_hours
+        self.sync_interval_seconds = sync_interval_hours * 3600
+        self.max_concurrent = max(1, max_concurrent)
+        self.running = False
+        self.thread = None
+        self.next_sync_time = None
+        self.executor = None
+        self.leader = None
+        
+        # Per-dataset state: key -> {'next_run', 'last_run', 'last_duration', 'last_error', 'runs'}
+        self.datasets = {}
+        # Timer heap of (run_at, priority, seq, key, warm); an entry is live only while
+        # _scheduled[key] == seq, so rescheduling just pushes a new entry
+        self._heap = []
+        self._scheduled = {}
+        self._seq = itertools.count()
+        # Keys handed to the executor (queued or loading) / currently loading
+        self._active = set()
+        self._loading = set()
+        self._cond = threading.Condition()
+        
+        print(f"📅 Scheduler initialized (sync every {sync_interval_hours} hours, {self.max_concurrent} at a time)")
+    
+    def _interval_hours(self, dataset):
+        """Refresh interval of a dataset (None = permanent, only warmed when missing)"""
+        if dataset.interval_hours is not None:
+            return dataset.interval_hours
+        return None if dataset.ttl_hours is None else self.sync_interval_hours
+    
+    def _jitter_seconds(self, dataset, interval_hours):
+        """Random delay for the next scheduled run of a dataset"""
+        jitter_minutes = dataset.jitter_minutes if dataset.jitter_minutes is not None else SCHEDULER_JITTER_MINUTES
+        jitter_seconds = min(jitter_minutes * 60, interval_hours * 360)
+        return random.uniform(0, jitter_seconds) if jitter_seconds > 0 else 0
+    
+    def _is_warm(self, cache, dataset):
+        """True if the dataset is already cached and younger than its interval"""
+        info = cache.get_entry_info(dataset.key)
+        if info is None:
+            return False
+        interval_hours = self._interval_hours(dataset)
+        return interval_hours is None or info['age_minutes'] < interval_hours * 60
+    
+    def _run_dataset(self, dataset, warm=False):
+        """
+        Load one dataset into the cache
+        
+        Args:
+            dataset: Dataset to load
+            warm: Skip it if the cache already holds a fresh copy (startup warming)
+        """
+        cache = get_cache_manager()
+        
+        if warm and self._is_warm(cache, dataset):
+            print(f"✅ Already warm: {dataset.key}")
+            return
+        
+        start_time = time.time()
+        error = None
+        try:
+            cache.reload(dataset.key, dataset.loader)
+            print(f"♻️ Loaded {dataset.key} ({time.time() - start_time:.2f}s)")
+        except Exception as e:
+            error = str(e)
+            print(f"❌ Failed to load {dataset.key}: {e}")
+        
+        with self._cond:
+            state = self.datasets.setdefault(dataset.key, {'runs': 0})
+            state['runs'] += 1
+            state['last_run'] = datetime.now()
+            state['last_duration'] = round(time.time() - start_time, 2)
+            state['last_error'] = error
+    
+    def _execute(self, dataset, warm):
+        """Executor job: load a dataset, then schedule its next run"""
+        with self._cond:
+            if not self.running:
+                self._active.discard(dataset.key)
+                return
+            self._loading.add(dataset.key)
+        try:
+            self._run_dataset(dataset, warm)
+        finally:
+            with self._cond:
+                self._active.discard(dataset.key)
+                self._loading.discard(dataset.key)
+                if self.running and self.leader.is_leader:
+                    self._schedule_next(dataset)
+    
+    def _push(self, dataset, delay_seconds=0, warm=False):
+        """Schedule the next run of a dataset, replacing any earlier one (call with _cond held)"""
+        seq = next(self._seq)
+        run_at = time.time() + delay_seconds
+        heapq.heappush(self._heap, (run_at, dataset.priority, seq, dataset.key, warm))
+        self._scheduled[dataset.key] = seq
+        state = self.datasets.setdefault(dataset.key, {'runs': 0})
+        state['next_run'] = datetime.fromtimestamp(run_at)
+        self._update_next_sync_time()
+        self._cond.notify_all()
+    
+    def _schedule_next(self, dataset):
+        """Set the next refresh of a dataset after a run (permanent ones aren't rescheduled)"""
+        interval_hours = self._interval_hours(dataset)
+        state = self.datasets.setdefault(dataset.key, {'runs': 0})
+        if state.get('last_error'):
+            self._push(dataset, SCHEDULER_RETRY_MINUTES * 60)
+        elif interval_hours is not None:
+            self._push(dataset, interval_hours * 3600 + self._jitter_seconds(dataset, interval_hours))
+        else:
+            self._scheduled.pop(dataset.key, None)
+            state['next_run'] = None
+            self._update_next_sync_time()
+    
+    def _update_next_sync_time(self):
+        next_runs = [s['next_run'] for s in self.datasets.values() if s.get('next_run')]
+        self.next_sync_time = min(next_runs) if next_runs else None
+    
+    def _on_dataset_registered(self, dataset):
+        """Warm datasets registered while the scheduler runs"""
+        with self._cond:
+            if self.running and dataset.key not in self.datasets and dataset.key not in self._active:
+                self._push(dataset, warm=True)
+    
+    def _schedule_unknown_datasets(self):
+        """Queue a warm run for every dataset without state (startup / new leader) (call with _cond held)"""
+        for dataset in get_datasets():
+            if dataset.key not in self.datasets and dataset.key not in self._active:
+                self._push(dataset, warm=True)
+    
+    def _pop_due(self):
+        """Pop every live entry that is due (call with _cond held). Returns [(dataset, warm)]"""
+        now = time.time()
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, seq, key, warm = heapq.heappop(self._heap)
+            if self._scheduled.get(key) != seq:
+                continue  # Replaced by a later schedule
+            del self._scheduled[key]
+            dataset = get_dataset(key)
+            if dataset is None or key in self._active:
+                continue  # Unregistered, or already loading (it reschedules itself)
+            due.append((dataset, warm))
+        return sorted(due, key=lambda job: (job[0].priority, job[0].key))
+    
+    def _next_wakeup(self):
+        """Seconds until the next heap entry is due (None = nothing scheduled)"""
+        if not self._heap:
+            return None
+        return max(0, self._heap[0][0] - time.time())
+    
+    def _scheduler_loop(self):
+        """Main scheduler loop (runs in background thread)"""
+        print("🚀 Scheduler thread started")
+        
+        # Registers the Ahly stats dataset; the web app registers its cached routes on import
+        get_sync_service()
+        
+        announced = None
+        with self._cond:
+            while self.running:
+                try:
+                    # Followers leave loading to the leader; a leadership change wakes us
+                    if not self.leader.is_leader:
+                        self._cond.wait()
+                        continue
+                    
+                    # Datasets without state (startup, just became leader) are warmed,
+                    # skipping ones already cached
+                    self._schedule_unknown_datasets()
+                    
+                    due = self._pop_due()
+                    if due:
+                        warming = sum(1 for _, warm in due if warm)
+                        print("\n" + "="*60)
+                        if warming:
+                            print(f"🔄 Warming {warming} datasets...")
+                        print(f"⏰ Scheduled sync triggered: {', '.join(dataset.key for dataset, _ in due)}")
+                        print("="*60)
+                        
+                        # Highest priority first; the executor runs at most max_concurrent
+                        for dataset, warm in due:
+                            self._active.add(dataset.key)
+                            self.executor.submit(self._execute, dataset, warm)
+                        continue
+                    
+                    if self.next_sync_time and self.next_sync_time != announced:
+                        announced = self.next_sync_time
+                        print(f"⏰ Next sync scheduled for: {self.next_sync_time.strftime('%Y-%m-%d %H:%M:%S')}")
+                    self._cond.wait(self._next_wakeup())
+                
+                except Exception as e:
+                    print(f"❌ Error in scheduler loop: {e}")
+                    self._cond.wait(60)  # Wait before retrying
+        
+        print("🛑 Scheduler thread stopped")
+    
+    def trigger(self, keys=None):
+        """
+        Queue an immediate refresh and wake the scheduler (returns without waiting)
+        
+        Args:
+            keys: Dataset keys to refresh (None = every registered dataset)
+        
+        Returns:
+            Keys queued (empty if this process isn't running the scheduler as leader)
+        """
+        if keys is None:
+            datasets = get_datasets()
+        else:
+            datasets = [get_dataset(key) for key in keys]
+        
+        queued = []
+        with self._cond:
+            if not self.running or not self.leader.is_leader:
+                return queued
+            for dataset in datasets:
+                if dataset is None:
+                    continue
+                if dataset.key not in self._active:
+                    self._push(dataset)
+                queued.append(dataset.key)
+        if queued:
+            print(f"⚡ Sync queued: {', '.join(queued)}")
+        return queued
+    
+    def _on_leader_change(self, is_leader):
+        """Forget the schedule on a leadership change so a new leader re-warms everything"""
+        with self._cond:
+            self.datasets = {}
+            self._heap = []
+            self._scheduled = {}
+            self.next_sync_time = None
+            self._cond.notify_all()
+    
+    def start(self):
+        """Start the background scheduler"""
+        if self.running:
+            print("⚠️ Scheduler already running")
+            return
+        
+        self.running = True
+        self.leader = LeaderLock('scheduler', get_cache_manager())
+        self.leader.on_change = self._on_leader_change
+        self.leader.start()
+        self.executor = ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix='scheduler-load')
+        add_dataset_listener(self._on_dataset_registered)
+        self.thread = threading.Thread(target=self._scheduler_loop, daemon=True)
+        self.thread.start()
+        
+        print("✅ Scheduler started successfully")
+    
+    def stop(self):
+        """Stop the background scheduler (loads already running finish in the background)"""
+        if not self.running:
+            print("⚠️ Scheduler not running")
+            return
+        
+        print("🛑 Stopping scheduler...")
+        with self._cond:
+            self.running = False
+            self._cond.notify_all()
+        remove_dataset_listener(self._on_dataset_registered)
+        
+        if self.thread:
+            self.thread.join(timeout=5)
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        if self.leader:
+            self.leader.stop()
+        
+        print("✅ Scheduler stopped")
+    
+    def get_status(self):
+        """Get scheduler status"""
+        if not self.running:
+            return {
+                'running': False,
+                'sync_interval_hours': self.sync_interval_hours,
+                'next_sync': None
+            }
+        
+        with self._cond:
+            datasets = {}
+            for key, state in self.datasets.items():
+                if key in self._loading:
+                    status = 'loading'
+                elif key in self._active:
+                    status = 'queued'
+                elif key in self._scheduled:
+                    status = 'scheduled'
+                else:
+                    status = 'idle'
+                dataset = get_dataset(key)
+                datasets[key] = {
+                    'status': status,
+                    'interval_hours': self._interval_hours(dataset) if dataset else None,
+                    'next_run': state['next_run'].isoformat() if state.get('next_run') else None,
+                    'last_run': state['last_run'].isoformat() if state.get('last_run') else None,
+                    'last_duration': state.get('last_duration'),
+                    'last_error': state.get('last_error'),
+                    'runs': state['runs']
+                }
+            queue_depth = len(self._active) - len(self._loading)
+            loading = sorted(self._loading)
+        
+        return {
+            'running': True,
+            'sync_interval_hours': self.sync_interval_hours,
+            'max_concurrent': self.max_concurrent,
+            'next_sync': self.next_sync_time.isoformat() if self.next_sync_time else None,
+            'minutes_until_next_sync': int((self.next_sync_time - datetime.now()).total_seconds() / 60) if self.next_sync_time else None,
+            'queue_depth': queue_depth,
+            'loading': loading,
+            'leader': self.leader.get_status() if self.leader else None,
+            'datasets': datasets
+        }
+
+
+# Global scheduler instance
+_scheduler = None
+
+def get_scheduler(sync_interval_hours=6):
+    """Get or create global scheduler instance"""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = SchedulerService(sync_interval_hours)
+    return _scheduler
+
+def start_scheduler(sync_interval_hours=6):
+    """Start the global scheduler"""
+    scheduler = get_scheduler(sync_interval_hours)
+    scheduler.start()
+    return scheduler
+
+def stop_scheduler():
+    """Stop the global scheduler"""
+    global _scheduler
+    if _scheduler:
+        _scheduler.stop()
+
+def get_scheduler_status():
+    """Get scheduler status"""
+    if _scheduler:
+        return _scheduler.get_status()
+    return {'running': False}
+
+def trigger_sync(keys=None):
+    """Queue an immediate refresh on the running scheduler (returns the keys queued)"""
+    if _scheduler:
+        return _scheduler.trigger(keys)
+    return []
+
+
+if __name__ == '__main__':
+    # Test the scheduler
+    print("Testing Scheduler Service...")
+    print("-" * 60)
+    
+    # Start scheduler with 1-minute interval for testing
+    scheduler = SchedulerService(sync_interval_hours=0.016667)  # ~1 minute
+    scheduler.start()
+    
+    # Let it run for a few minutes
+    try:
+        print("\nScheduler is running. Press Ctrl+C to stop...\n")
+        while True:
+            status = scheduler.get_status()
+            print(f"Status: {status}")
+            time.sleep(30)
+    except KeyboardInterrupt:
+        print("\n\nStopping scheduler...")
+        scheduler.stop()
+        print("✅ Test completed")
@@ -0,0 +1,413 @@
+# -*- coding: utf-8 -*-
+"""
+Google Sheets Client Registry
+=============================
+Keeps one authorized gspread client per credential source, so requests reuse
+the same OAuth token and HTTP connection pool instead of re-authenticating
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from datetime import datetime, timedelta
+
+import gspread
+from google.oauth2.service_account import Credentials
+from google.auth.transport.requests import AuthorizedSession, Request
+from requests.adapters import HTTPAdapter
+
+from cache_manager import register_revision_probe
+
+# Full access scopes (data entry + reading)
+DEFAULT_SCOPES = (
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive"
+)
+
+# Refresh the access token this long before Google says it expires
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+# Connection pool size per client (waitress runs 4 threads, gunicorn may run more)
+HTTP_POOL_SIZE = int(os.environ.get('SHEETS_HTTP_POOL_SIZE', '10'))
+
+# Seconds to wait for Google to answer a request (gspread waits forever by default)
+HTTP_TIMEOUT_SECONDS = float(os.environ.get('SHEETS_HTTP_TIMEOUT', '60'))
+
+# How long spreadsheet/worksheet handles are reused before metadata is fetched again
+HANDLE_TTL_SECONDS = int(os.environ.get('SHEETS_HANDLE_TTL_SECONDS', '1800'))
+
+# How long a probed spreadsheet revision is reused (datasets sharing a spreadsheet refresh together)
+REVISION_PROBE_TTL_SECONDS = int(os.environ.get('SHEETS_REVISION_PROBE_TTL', '30'))
+DRIVE_FILES_URL = 'https://www.googleapis.com/drive/v3/files'
+
+
+class _PooledClient:
+    """An authorized gspread client plus the credentials it was built from"""
+
+    def __init__(self, credentials):
+        self.credentials = credentials
+        self.session = AuthorizedSession(credentials)
+
+        # Bigger pool than the requests default so concurrent threads share warm connections
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount('https://', adapter)
+
+        self.client = gspread.Client(auth=credentials, session=self.session)
+        self.client.set_timeout(HTTP_TIMEOUT_SECONDS)
+        # Token refreshes go through a plain session: refreshing through the authorized
+        # one would first make it refresh its own (expired) token as well
+        self.token_request = Request()
+        self.refresh_lock = threading.Lock()
+        self.created_at = datetime.now()
+        self.hits = 0
+
+    def needs_refresh(self):
+        """True if the token is missing or about to expire"""
+        if not self.credentials.token or not self.credentials.expiry:
+            return True
+        # google-auth stores expiry as a naive UTC datetime
+        return datetime.utcnow() + TOKEN_REFRESH_MARGIN >= self.credentials.expiry
+
+    def ensure_fresh_token(self):
+        """Refresh the access token ahead of expiry (once, even with many threads waiting)"""
+        if not self.needs_refresh():
+            return
+        with self.refresh_lock:
+            if self.needs_refresh():
+                self.credentials.refresh(self.token_request)
+
+
+class SheetsClientRegistry:
+    """Thread-safe registry of authorized Google Sheets clients keyed by credential source"""
+
+    def __init__(self):
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def _make_key(self, credentials_json=None, credentials_file=None, scopes=DEFAULT_SCOPES):
+        """Build a registry key that changes when the credentials themselves change"""
+        scopes_key = ','.join(sorted(scopes))
+        if credentials_json:
+            digest = hashlib.sha256(credentials_json.encode('utf-8')).hexdigest()
+            return ('json', digest, scopes_key)
+        # Include mtime so a replaced credentials file is picked up without a restart
+        mtime = os.path.getmtime(credentials_file)
+        return ('file', os.path.abspath(credentials_file), mtime, scopes_key)
+
+    def _build_credentials(self, credentials_json=None, credentials_file=None, scopes=DEFAULT_SCOPES):
+        """Parse service account credentials (only done once per source)"""
+        if credentials_json:
+            creds_info = json.loads(credentials_json)
+            return Credentials.from_service_account_info(creds_info, scopes=list(scopes))
+        return Credentials.from_service_account_file(credentials_file, scopes=list(scopes))
+
+    def get_client(self, credentials_json=None, credentials_file=None, scopes=DEFAULT_SCOPES):
+        """
+        Get an authorized gspread client for a credential source
+
+        Args:
+            credentials_json: Service account JSON string (e.g. from an env variable)
+            credentials_file: Path to a service account JSON file (used if no JSON string)
+            scopes: OAuth scopes to request
+
+        Returns:
+            gspread.Client with a fresh token and pooled HTTP session
+
+        Raises:
+            FileNotFoundError: if neither source is available
+        """
+        if not credentials_json and not (credentials_file and os.path.exists(credentials_file)):
+            raise FileNotFoundError("No credentials found")
+
+        key = self._make_key(credentials_json, credentials_file, scopes)
+
+        pooled = self._clients.get(key)
+        if pooled is None:
+            with self._lock:
+                pooled = self._clients.get(key)
+                if pooled is None:
+                    credentials = self._build_credentials(credentials_json, credentials_file, scopes)
+                    pooled = _PooledClient(credentials)
+                    # Drop stale entries for the same file (e.g. credentials file was replaced)
+                    if key[0] == 'file':
+                        for old_key in [k for k in self._clients if k[0] == 'file' and k[1] == key[1]]:
+                            self._clients.pop(old_key, None)
+                    self._clients[key] = pooled
+                    print(f"🔑 Authorized new Google Sheets client ({key[0]} credentials)")
+
+        pooled.ensure_fresh_token()
+        pooled.hits += 1
+        return pooled.client
+
+    def clear(self):
+        """Forget all clients (next call re-authenticates)"""
+        with self._lock:
+            for pooled in self._clients.values():
+                try:
+                    pooled.session.close()
+                except Exception:
+                    pass
+            self._clients.clear()
+
+    def get_status(self):
+        """Get registry status"""
+        with self._lock:
+            items = list(self._clients.items())
+        return {
+            'total_clients': len(items),
+            'clients': [
+                {
+                    'source': key[0],
+                    'created_at': pooled.created_at.isoformat(),
+                    'token_expiry': pooled.credentials.expiry.isoformat() if pooled.credentials.expiry else None,
+                    'requests_served': pooled.hits
+                }
+                for key, pooled in items
+            ]
+        }
+
+
+class _SpreadsheetEntry:
+    """Cached spreadsheet handle plus its worksheet handles by title"""
+
+    def __init__(self, client):
+        self.client = client
+        self.spreadsheet = None
+        self.worksheets = {}
+        self.loaded_at = 0
+        self.lock = threading.Lock()
+
+    def is_fresh(self, ttl_seconds):
+        return self.spreadsheet is not None and time.time() - self.loaded_at < ttl_seconds
+
+
+class WorksheetHandleCache:
+    """
+    Caches gspread Spreadsheet/Worksheet handles keyed by (sheet_id, worksheet title)
+
+    Opening a spreadsheet and looking up a worksheet are each a metadata call to
+    the Sheets API. Handles are reused for ttl_seconds so warm requests only read values.
+    """
+
+    def __init__(self, ttl_seconds=HANDLE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _get_entry(self, client, sheet_id):
+        with self._lock:
+            entry = self._entries.get(sheet_id)
+            # A different client (e.g. other credentials) gets its own handles
+            if entry is None or entry.client is not client:
+                entry = _SpreadsheetEntry(client)
+                self._entries[sheet_id] = entry
+            return entry
+
+    def _load(self, entry, sheet_id):
+        """Open the spreadsheet and index all worksheets (2 metadata calls for every tab)"""
+        spreadsheet = entry.client.open_by_key(sheet_id)
+        entry.worksheets = {ws.title: ws for ws in spreadsheet.worksheets()}
+        entry.spreadsheet = spreadsheet
+        entry.loaded_at = time.time()
+
+    def get_spreadsheet(self, client, sheet_id):
+        """Get a (possibly cached) gspread Spreadsheet"""
+        entry = self._get_entry(client, sheet_id)
+        with entry.lock:
+            if not entry.is_fresh(self.ttl_seconds):
+                self._load(entry, sheet_id)
+            return entry.spreadsheet
+
+    def get_worksheet(self, client, sheet_id, title):
+        """
+        Get a (possibly cached) gspread Worksheet by title
+
+        Raises:
+            gspread.WorksheetNotFound: if the spreadsheet has no tab with this title
+        """
+        entry = self._get_entry(client, sheet_id)
+        with entry.lock:
+            if entry.is_fresh(self.ttl_seconds) and title in entry.worksheets:
+                return entry.worksheets[title]
+
+            # Unknown title or expired handles - re-read metadata once (picks up new/renamed tabs)
+            self._load(entry, sheet_id)
+            worksheet = entry.worksheets.get(title)
+
+        if worksheet is None:
+            raise gspread.WorksheetNotFound(title)
+        return worksheet
+
+    def get_client(self, sheet_id):
+        """Client that last opened the spreadsheet in this process (None if never opened)"""
+        with self._lock:
+            entry = self._entries.get(sheet_id)
+            return entry.client if entry else None
+    
+    def list_worksheets(self, client, sheet_id):
+        """Get all (possibly cached) worksheets in tab order"""
+        entry = self._get_entry(client, sheet_id)
+        with entry.lock:
+            if not entry.is_fresh(self.ttl_seconds):
+                self._load(entry, sheet_id)
+            return list(entry.worksheets.values())
+
+    def invalidate(self, sheet_id=None, title=None):
+        """
+        Drop cached handles
+
+        Args:
+            sheet_id: Spreadsheet to invalidate (None = everything)
+            title: Only drop this worksheet handle
+        """
+        with self._lock:
+            if sheet_id is None:
+                self._entries.clear()
+                return
+            entry = self._entries.get(sheet_id)
+            if entry is None:
+                return
+            if title is None:
+                self._entries.pop(sheet_id, None)
+            else:
+                entry.worksheets.pop(title, None)
+
+
+class CachedSpreadsheet:
+    """
+    Drop-in for gspread Spreadsheet whose worksheet()/worksheets() lookups use the handle cache
+
+    Anything else (values_batch_get, add_worksheet, ...) is passed to the real spreadsheet.
+    """
+
+    def __init__(self, handle_cache, client, sheet_id):
+        self._handle_cache = handle_cache
+        self._client = client
+        self.id = sheet_id
+
+    def worksheet(self, title):
+        try:
+            return self._handle_cache.get_worksheet(self._client, self.id, title)
+        except gspread.WorksheetNotFound:
+            self._handle_cache.invalidate(self.id, title)
+            raise
+
+    def worksheets(self):
+        return self._handle_cache.list_worksheets(self._client, self.id)
+
+    def __getattr__(self, name):
+        return getattr(self._handle_cache.get_spreadsheet(self._client, self.id), name)
+
+
+class RevisionProbe:
+    """
+    Cheap "has this spreadsheet changed?" check
+
+    One small Drive metadata request returns the file version (bumped on every
+    edit) and modifiedTime, instead of downloading the worksheets. Uses the client
+    that opened the spreadsheet, so every spreadsheet is probed with its own credentials.
+    """
+
+    def __init__(self, handle_cache, ttl_seconds=REVISION_PROBE_TTL_SECONDS):
+        self._handle_cache = handle_cache
+        self.ttl_seconds = ttl_seconds
+        self._results = {}  # sheet_id -> (revision, probed_at)
+        self._lock = threading.Lock()
+        self.probes = 0
+
+    def get_revision(self, sheet_id):
+        """
+        Current revision of a spreadsheet
+
+        Returns:
+            'version@modifiedTime' string, or None if unknown (not opened in this
+            process yet, or the request failed)
+        """
+        with self._lock:
+            cached = self._results.get(sheet_id)
+            if cached and time.time() - cached[1] < self.ttl_seconds:
+                return cached[0]
+
+        client = self._handle_cache.get_client(sheet_id)
+        if client is None:
+            return None
+
+        try:
+            response = client.request('get', f"{DRIVE_FILES_URL}/{sheet_id}",
+                                      params={'fields': 'version,modifiedTime', 'supportsAllDrives': 'true'})
+            info = response.json()
+        except Exception as e:
+            print(f"⚠️ Revision probe failed for {sheet_id}: {e}")
+            return None
+
+        revision = f"{info.get('version')}@{info.get('modifiedTime')}"
+        with self._lock:
+            self._results[sheet_id] = (revision, time.time())
+            self.probes += 1
+        return revision
+
+    def forget(self, sheet_id=None):
+        """Drop probed revisions (None = all), e.g. right after writing to a spreadsheet"""
+        with self._lock:
+            if sheet_id is None:
+                self._results.clear()
+            else:
+                self._results.pop(sheet_id, None)
+
+
+# Global registry instance
+_client_registry = None
+_registry_lock = threading.Lock()
+
+def get_client_registry():
+    """Get or create global client registry instance"""
+    global _client_registry
+    if _client_registry is None:
+        with _registry_lock:
+            if _client_registry is None:
+                _client_registry = SheetsClientRegistry()
+    return _client_registry
+
+def get_sheets_client(credentials_json=None, credentials_file=None, scopes=DEFAULT_SCOPES):
+    """Get a pooled gspread client for the given credential source"""
+    return get_client_registry().get_client(credentials_json, credentials_file, scopes)
+
+
+# Global handle cache instance
+_handle_cache = None
+
+def get_handle_cache():
+    """Get or create global worksheet handle cache instance"""
+    global _handle_cache
+    if _handle_cache is None:
+        with _registry_lock:
+            if _handle_cache is None:
+                _handle_cache = WorksheetHandleCache()
+    return _handle_cache
+
+def open_spreadsheet(client, sheet_id):
+    """Open a spreadsheet through the handle cache (no API call when warm)"""
+    return CachedSpreadsheet(get_handle_cache(), client, sheet_id)
+
+
+# Global revision probe instance
+_revision_probe = None
+
+def get_revision_probe():
+    """Get or create global spreadsheet revision probe"""
+    global _revision_probe
+    if _revision_probe is None:
+        with _registry_lock:
+            if _revision_probe is None:
+                _revision_probe = RevisionProbe(get_handle_cache())
+    return _revision_probe
+
+def get_spreadsheet_revision(sheet_id):
+    """Current revision of a spreadsheet opened in this process (None if unknown)"""
+    return get_revision_probe().get_revision(sheet_id)
+
+
+# Let the cache skip reloads of entries whose spreadsheets haven't changed
+register_revision_probe(get_spreadsheet_revision)
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Spreadsheet Snapshot Loader
+===========================
+Reads several worksheets of one spreadsheet with a single values.batchGet call
+and converts them to records exactly like gspread's get_all_records()
+"""
+
+import gspread
+from gspread.utils import fill_gaps, numericise_all
+
+from sheets_client_registry import open_spreadsheet
+
+
+def quote_sheet_title(title):
+    """Quote a worksheet title for use as an A1 range (e.g. 'Ahly Lineups')"""
+    return "'{}'".format(title.replace("'", "''"))
+
+
+def records_from_values(values):
+    """
+    Convert a worksheet's values (list of rows, header first) to records
+
+    Same semantics as gspread Worksheet.get_all_records() with default arguments:
+    rows padded to the same width, numbers numericised, blank cells as ''.
+
+    Raises:
+        gspread.exceptions.GSpreadException: if the header row is not unique
+    """
+    values = fill_gaps(values) if values else []
+    if not values:
+        return []
+
+    headers = values[0]
+    if len(headers) != len(set(headers)):
+        raise gspread.exceptions.GSpreadException("the header row in the worksheet is not unique")
+
+    return [dict(zip(headers, numericise_all(row))) for row in values[1:]]
+
+
+def fetch_sheet_snapshot(client, sheet_id, titles=None):
+    """
+    Fetch records for several worksheets in one batchGet request
+
+    Args:
+        client: Authorized gspread client
+        sheet_id: Spreadsheet ID
+        titles: Worksheet titles to read (None = every worksheet, in tab order)
+
+    Returns:
+        Dictionary {worksheet title: records}. Titles that don't exist in the
+        spreadsheet are left out; a worksheet whose rows can't be converted
+        (e.g. duplicate headers) maps to [].
+    """
+    spreadsheet = open_spreadsheet(client, sheet_id)
+
+    # Only ask for tabs that exist - one bad range fails the whole batchGet
+    existing_titles = [ws.title for ws in spreadsheet.worksheets()]
+    if titles is None:
+        titles = existing_titles
+    else:
+        titles = [title for title in titles if title in existing_titles]
+
+    if not titles:
+        return {}
+
+    response = spreadsheet.values_batch_get([quote_sheet_title(title) for title in titles])
+    value_ranges = response.get('valueRanges', [])
+
+    snapshot = {}
+    for title, value_range in zip(titles, value_ranges):
+        try:
+            snapshot[title] = records_from_values(value_range.get('values', []))
+        except Exception as e:
+            print(f"⚠️ Could not read records from {title}: {e}")
+            snapshot[title] = []
+
+    return snapshot
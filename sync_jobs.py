@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""
+Sync Jobs
+=========
+Tracks Google Sheets syncs as jobs: an id to poll, per-worksheet progress and
+timings, and at most one running sync per name - triggering a sync while one
+runs attaches to it instead of starting another. With Redis, job snapshots are
+shared so any worker can answer a status poll or attach to a sync running elsewhere.
+"""
+
+import json
+import uuid
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+from cache_manager import JOB_KEY_PREFIX, get_cache_manager
+
+# Finished jobs kept in memory for status polls
+SYNC_JOB_HISTORY = 20
+# How long job snapshots stay in Redis
+SYNC_JOB_TTL_SECONDS = 24 * 3600
+# A running job that stops reporting (its worker died) is forgotten after this long
+SYNC_JOB_STALE_SECONDS = 15 * 60
+
+# Worksheet states that count as finished
+_SHEET_DONE_STATES = ('done', 'failed')
+
+
+class SyncJob:
+    """One sync run and its per-worksheet progress"""
+
+    def __init__(self, name, trigger='manual'):
+        """
+        Args:
+            name: What is synced (one running job per name)
+            trigger: Who started it ('manual', 'scheduler', ...)
+        """
+        self.id = uuid.uuid4().hex[:12]
+        self.name = name
+        self.trigger = trigger
+        self.status = 'queued'
+        self.created_at = datetime.now()
+        self.started_at = None
+        self.finished_at = None
+        self.error = None
+        self.fetch_mode = None
+        self.sheets = OrderedDict()  # worksheet -> {'status', 'records', 'seconds', 'error'}
+        self.result = None  # Synced data for callers that attached (not in the status)
+        self.on_update = None  # Optional callable(job)
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def done(self):
+        return self._done.is_set()
+
+    def start(self):
+        with self._lock:
+            self.status = 'running'
+            self.started_at = datetime.now()
+        self._updated()
+
+    def add_sheets(self, sheet_names):
+        """Declare the worksheets this job is about to fetch"""
+        with self._lock:
+            for sheet_name in sheet_names:
+                self.sheets.setdefault(sheet_name, {'status': 'pending'})
+        self._updated()
+
+    def sheet_started(self, sheet_name):
+        with self._lock:
+            self.sheets.setdefault(sheet_name, {})['status'] = 'fetching'
+        self._updated()
+
+    def sheet_finished(self, sheet_name, records=None, seconds=None, error=None):
+        """
+        Record a fetched worksheet
+
+        Args:
+            sheet_name: Worksheet title
+            records: Number of records fetched
+            seconds: How long the read took
+            error: Why it failed (None = success)
+        """
+        with self._lock:
+            self.sheets[sheet_name] = {
+                'status': 'failed' if error else 'done',
+                'records': records,
+                'seconds': seconds,
+                'error': error
+            }
+        self._updated()
+
+    def finish(self, result=None, error=None):
+        """Mark the job finished (error None = succeeded) and wake everyone waiting on it"""
+        with self._lock:
+            self.status = 'failed' if error else 'succeeded'
+            self.error = error
+            self.result = result
+            self.finished_at = datetime.now()
+        self._done.set()
+        self._updated()
+
+    def wait(self, timeout=None):
+        """Block until the job finishes (returns False on timeout)"""
+        return self._done.wait(timeout)
+
+    def _updated(self):
+        if self.on_update:
+            self.on_update(self)
+
+    def to_dict(self):
+        """JSON-serializable status"""
+        with self._lock:
+            sheets = {name: dict(info) for name, info in self.sheets.items()}
+            finished = sum(1 for info in sheets.values() if info.get('status') in _SHEET_DONE_STATES)
+            end = self.finished_at or datetime.now()
+            return {
+                'job_id': self.id,
+                'name': self.name,
+                'trigger': self.trigger,
+                'status': self.status,
+                'created_at': self.created_at.isoformat(),
+                'started_at': self.started_at.isoformat() if self.started_at else None,
+                'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+                'elapsed_seconds': round((end - self.started_at).total_seconds(), 2) if self.started_at else None,
+                'error': self.error,
+                'fetch_mode': self.fetch_mode,
+                'progress': {
+                    'total': len(sheets),
+                    'finished': finished,
+                    'percent': round(finished * 100 / len(sheets)) if sheets else None
+                },
+                'sheets': sheets
+            }
+
+
+class SyncJobTracker:
+    """Keeps recent jobs and the running job per name"""
+
+    def __init__(self, cache_manager):
+        """
+        Args:
+            cache_manager: Job snapshots are shared through its Redis client (if any)
+        """
+        self.cache = cache_manager
+        self._jobs = OrderedDict()  # job id -> SyncJob, oldest first
+        self._current = {}  # name -> running SyncJob
+        self._lock = threading.Lock()
+
+    def begin(self, name, trigger='manual'):
+        """
+        Get the running job for name, or create one
+
+        Returns:
+            Tuple (job, created) - created is False when attaching to a running job
+        """
+        with self._lock:
+            job = self._current.get(name)
+            if job is not None and not job.done:
+                return job, False
+
+            job = SyncJob(name, trigger)
+            job.on_update = self._publish
+            self._current[name] = job
+            self._jobs[job.id] = job
+            while len(self._jobs) > SYNC_JOB_HISTORY:
+                self._jobs.popitem(last=False)
+        self._publish(job)
+        return job, True
+
+    def end(self, job):
+        """Stop treating job as the running job of its name"""
+        with self._lock:
+            if self._current.get(job.name) is job:
+                del self._current[job.name]
+
+    def get(self, job_id):
+        """Status of a job from this process or, with Redis, any worker (None if unknown)"""
+        job = self._jobs.get(job_id)
+        if job is not None:
+            return job.to_dict()
+        if not self.cache.using_redis:
+            return None
+        try:
+            raw = self.cache.redis_client.get(f"{JOB_KEY_PREFIX}{job_id}")
+            return json.loads(raw) if raw else None
+        except Exception as e:
+            print(f"⚠️ Could not read sync job {job_id}: {e}")
+            return None
+
+    def running_elsewhere(self, name):
+        """Status of a job for name running in another worker (None if there is none)"""
+        if not self.cache.using_redis:
+            return None
+        try:
+            job_id = self.cache.redis_client.get(f"{JOB_KEY_PREFIX}current:{name}")
+        except Exception as e:
+            print(f"⚠️ Could not look up running {name} job: {e}")
+            return None
+        if not job_id or job_id in self._jobs:
+            return None
+        status = self.get(job_id)
+        if status and status['status'] in ('queued', 'running'):
+            return status
+        return None
+
+    def recent(self, limit=5):
+        """Status of the latest jobs in this process, newest first"""
+        with self._lock:
+            jobs = list(self._jobs.values())[-limit:]
+        return [job.to_dict() for job in reversed(jobs)]
+
+    def _publish(self, job):
+        """Share the job's status through Redis (no-op in file / no-cache mode)"""
+        if not self.cache.using_redis:
+            return
+        try:
+            current_key = f"{JOB_KEY_PREFIX}current:{job.name}"
+            pipe = self.cache.redis_client.pipeline()
+            pipe.set(f"{JOB_KEY_PREFIX}{job.id}", json.dumps(job.to_dict()), ex=SYNC_JOB_TTL_SECONDS)
+            if job.done:
+                pipe.delete(current_key)
+            else:
+                pipe.set(current_key, job.id, ex=SYNC_JOB_STALE_SECONDS)
+            pipe.execute()
+        except Exception as e:
+            print(f"⚠️ Could not publish sync job {job.id}: {e}")
+
+
+# Global tracker instance
+_job_tracker = None
+_job_tracker_lock = threading.Lock()
+
+def get_job_tracker():
+    """Get or create the global sync job tracker"""
+    global _job_tracker
+    if _job_tracker is None:
+        with _job_tracker_lock:
+            if _job_tracker is None:
+                _job_tracker = SyncJobTracker(get_cache_manager())
+    return _job_tracker